@@ -0,0 +1,56 @@
+"""Compare sequential evaluation of Pattern validators by Any against a single combined expression by AnyPattern.
+
+Run from a development install (see the README) as: python benchmark/alternation.py
+"""
+
+from timeit import repeat
+
+from marrow.schema.validate import Pattern
+from marrow.schema.validate.compound import Any, AnyPattern
+from marrow.schema.validate.network import ipv4, ipv6
+
+
+def latency(statement, number=2000, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def allowlist(count):
+	"""Produce Pattern validators for an allow-list of path prefixes."""
+	return [Pattern(r'^/api/v1/resource{0}/[0-9]+$'.format(i)) for i in range(count)]
+
+
+def main():
+	print("{0:>10} {1:>8} {2:>14} {3:>14} {4:>14} {5:>14}".format(
+			"patterns", "value", "any (us)", "combined (us)", "any chk (us)", "comb chk (us)"))
+	
+	cases = [(str(count), allowlist(count), count) for count in (2, 8, 32, 128)]
+	cases.append(('ip', [ipv4, ipv6], None))
+	
+	for label, patterns, count in cases:
+		sequential, combined = Any(patterns), AnyPattern(patterns)
+		
+		if count is None:
+			values = (('first', '192.168.0.1'), ('last', '2001:4860:4001:803::1011'), ('none', 'wxyz:'))
+		else:
+			values = (
+					('first', '/api/v1/resource0/27'),
+					('last', '/api/v1/resource{0}/27'.format(count - 1)),
+					('none', '/api/v2/resource0/27'),
+				)
+		
+		for position, value in values:
+			assert (sequential.check(value) is None) is (combined.check(value) is None)
+			
+			print("{0:>10} {1:>8} {2:>14.2f} {3:>14.2f} {4:>14.2f} {5:>14.2f}".format(
+					label,
+					position,
+					latency("check(value)", check=sequential.check, value=value),
+					latency("check(value)", check=combined.check, value=value),
+					latency("check(value)", check=sequential.compile(check=True), value=value),
+					latency("check(value)", check=combined.compile(check=True), value=value),
+				))
+
+
+if __name__ == '__main__':
+	main()
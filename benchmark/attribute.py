@@ -0,0 +1,40 @@
+"""Measure Attribute read latency for stored values (hits) and for missing values resolved from defaults (misses).
+
+Run from a development install (see the README) as: python benchmark/attribute.py
+"""
+
+from timeit import repeat
+
+from marrow.schema import Container, Attribute, CallbackAttribute
+
+
+class Record(Container):
+	stored = Attribute(default=None)
+	constant = Attribute(default=42)
+	factory = Attribute(default=list)
+	callback = CallbackAttribute(default=lambda: 27)
+	required = Attribute()
+
+
+def latency(statement, number=200000, **namespace):
+	"""Best-of-five nanoseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+	inst = Record(stored=1)
+	
+	for label, statement in (
+				("hit", "inst.stored"),
+				("miss, constant default", "inst.constant"),
+				("miss, factory default", "inst.factory"),
+				("miss, callback default", "inst.callback"),
+			):
+		print("{0:<28} {1:>10.1f} ns".format(label, latency(statement, inst=inst)))
+	
+	print("{0:<28} {1:>10.1f} ns".format("miss, no default", latency(
+			"try:\n\tinst.required\nexcept AttributeError:\n\tpass", number=50000, inst=inst)))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,75 @@
+"""Measure asynchronous validation, awaiting I/O-bound checks concurrently, against awaiting each element in turn.
+
+Each element is checked by a coroutine callback simulating a round trip (e.g. a uniqueness query) of fixed latency.
+The overhead of `avalidate` for purely synchronous validators is given alongside that of `validate` for comparison;
+these are evaluated uncompiled when awaited, so `validate` remains preferable where there is nothing to await.
+
+Run from a development install (see the README) as: python benchmark/awaiting.py
+"""
+
+import asyncio
+
+from time import perf_counter
+from timeit import repeat
+
+from marrow.schema.validate.base import Callback, Instance, Length
+from marrow.schema.validate.compound import All, Iterable
+
+
+LATENCY = 0.001  # Seconds per simulated round trip.
+
+
+def latency(statement, number=200, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+async def unique(validator, value, context):
+	await asyncio.sleep(LATENCY)
+	return value
+
+
+async def sequential(validator, values):
+	for value in values:
+		await validator.avalidate(value)
+
+
+def elapsed(coroutine):
+	"""Milliseconds taken to run the given coroutine to completion in a new event loop."""
+	
+	start = perf_counter()
+	asyncio.run(coroutine)
+	return (perf_counter() - start) * 1e3
+
+
+def main():
+	check = All([Instance(str), Callback(unique)])
+	
+	print("{0:>8} {1:>16} {2:>16}".format("elements", "in turn (ms)", "concurrent (ms)"))
+	
+	for count in (10, 100, 1000):
+		values = ['user{0}'.format(i) for i in range(count)]
+		
+		print("{0:>8} {1:>16.1f} {2:>16.1f}".format(
+				count,
+				min(elapsed(sequential(check, values)) for i in range(3)),
+				min(elapsed(Iterable([check]).avalidate(values)) for i in range(3)),
+			))
+	
+	plain = Iterable([All([Instance(str), Length(slice(1, 21))])])
+	values = ['user{0}'.format(i) for i in range(100)]
+	loop = asyncio.new_event_loop()
+	
+	print()
+	print("{0:>8} {1:>16} {2:>16}".format("elements", "validate (us)", "avalidate (us)"))
+	print("{0:>8} {1:>16.1f} {2:>16.1f}".format(
+			len(values),
+			latency("validate(values)", validate=plain.validate, values=values),
+			latency("run(avalidate(values))", run=loop.run_until_complete, avalidate=plain.avalidate, values=values),
+		))
+	
+	loop.close()
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,33 @@
+"""Compare In validator membership tests against the linear scan of the choices it previously performed.
+
+Run from a development install (see the README) as: python benchmark/choices.py
+"""
+
+from timeit import repeat
+
+from marrow.schema.util import ensure_tuple
+from marrow.schema.validate import In
+
+
+def latency(statement, number=2000, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+	print("{0:>8} {1:>14} {2:>14} {3:>14}".format("choices", "linear (us)", "indexed (us)", "pairs (us)"))
+	
+	for size in (10, 100, 1000, 10000):
+		codes = ['C{0:05d}'.format(i) for i in range(size)]
+		value = codes[-1]  # The worst case for a linear scan.
+		
+		print("{0:>8} {1:>14.2f} {2:>14.2f} {3:>14.2f}".format(
+				size,
+				latency("(value, ) in ensure_tuple(1, codes)", value=value, codes=codes, ensure_tuple=ensure_tuple),
+				latency("validate(value)", value=value, validate=In(codes).validate),
+				latency("validate(value)", value=value, validate=In([(i, i.lower()) for i in codes]).validate),
+			))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,57 @@
+"""Measure the construction of many generated schema classes, as when building schemas dynamically from configuration.
+
+Run from a development install (see the README) as: python benchmark/classes.py
+"""
+
+from gc import disable, enable
+from time import perf_counter
+
+from marrow.schema import Container, Attribute
+
+
+COUNT = 10000
+
+
+class Record(Container):
+	identifier = Attribute()
+	created = Attribute(default=None)
+	modified = Attribute(default=None)
+
+
+def generate(count, fields, depth):
+	"""Generate classes declaring the given number of new attributes each, subclassing a chain of the given depth."""
+	
+	bases = [Record]
+	
+	for i in range(depth - 1):  # Each level of the chain declares a field of its own.
+		bases.append(type(bases[-1])('Level{0}'.format(i), (bases[-1], ), {'level{0}'.format(i): Attribute()}))
+	
+	# Attribute declarations are prepared ahead of time, as we are interested in class construction alone.
+	namespaces = [{'field{0}'.format(j): Attribute(default=j) for j in range(fields)} for i in range(count)]
+	base = bases[-1]
+	meta = type(base)
+	
+	disable()  # As timeit does, to avoid measuring the collection of the many objects prepared above.
+	start = perf_counter()
+	
+	for i, namespace in enumerate(namespaces):
+		meta('Generated{0}'.format(i), (base, ), namespace)
+	
+	elapsed = perf_counter() - start
+	enable()
+	
+	return elapsed
+
+
+def main():
+	print("{0:>8} {1:>8} {2:>8} {3:>12} {4:>14}".format("classes", "fields", "depth", "total (ms)", "per class (us)"))
+	
+	for fields, depth in ((0, 1), (4, 1), (16, 1), (4, 16), (16, 64)):
+		elapsed = min(generate(COUNT, fields, depth) for i in range(5))
+		
+		print("{0:>8} {1:>8} {2:>8} {3:>12.1f} {4:>14.2f}".format(
+				COUNT, fields, depth, elapsed * 1e3, elapsed / COUNT * 1e6))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,75 @@
+"""Compare validation on assignment against deferred validation of Container instances committed as one batch.
+
+Run from a development install (see the README) as: python benchmark/deferred.py
+"""
+
+from timeit import repeat
+
+from marrow.schema import Container, Attribute
+from marrow.schema.exc import Concern
+from marrow.schema.validate import Validated, Instance, Length, Range, Pattern
+from marrow.schema.validate.compound import All, Deferred
+
+
+class Person(Container):
+	name = Validated(validator=All([Instance(str), Length(slice(1, 64))]))
+	email = Validated(validator=Pattern(r'^[^@\s]+@[^@\s]+$'))
+	age = Validated(validator=Range(1, 150))
+	score = Validated(validator=Instance(int))
+	note = Attribute(default=None)
+
+
+def latency(statement, number=5, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def rows(count, invalid):
+	"""Produce keyword arguments for the given number of people, every `invalid`th of which is invalid."""
+	return [dict(name='Person {0}'.format(i), email='person{0}@example.com'.format(i), age=200 if invalid and
+			not i % invalid else 1 + i % 100, score=i) for i in range(count)]
+
+
+def immediate(rows):
+	"""Construct all valid people, validating on assignment and discarding those failing."""
+	
+	people = []
+	
+	for row in rows:
+		try:
+			people.append(Person(**row))
+		except Concern:
+			pass
+	
+	return people
+
+
+def deferred(rows):
+	"""Construct all people unvalidated, then validate them in one batch, discarding those failing."""
+	
+	with Deferred() as batch:
+		people = [Person(**row) for row in rows]
+	
+	failures = batch.commit()
+	
+	return [person for i, person in enumerate(people) if i not in failures]
+
+
+def main():
+	print("{0:>8} {1:>8} {2:>16} {3:>16}".format("records", "invalid", "immediate (ms)", "deferred (ms)"))
+	
+	for count in (10, 1000, 10000):
+		for invalid in (0, 10, 2):
+			data = rows(count, invalid)
+			assert len(immediate(data)) == len(deferred(data))
+			
+			print("{0:>8} {1:>8} {2:>16.2f} {3:>16.2f}".format(
+					count,
+					"1/{0}".format(invalid) if invalid else "none",
+					latency("run(data)", run=immediate, data=data) / 1e3,
+					latency("run(data)", run=deferred, data=data) / 1e3,
+				))
+
+
+if __name__ == '__main__':
+	main()
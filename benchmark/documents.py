@@ -0,0 +1,49 @@
+"""Measure the validation of nested documents (lists of mappings of lists), and the early cutoff of failing ones.
+
+Run from a development install (see the README) as: python benchmark/documents.py
+"""
+
+from timeit import repeat
+
+from marrow.schema.validate import Instance, Range
+from marrow.schema.validate.compound import Iterable, Mapping
+
+
+def latency(statement, number=3, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def document(count, width=4, depth=8):
+	"""Produce a list of mappings, each of lists of integers."""
+	return [{'field{0}'.format(j): list(range(1, depth + 1)) for j in range(width)} for i in range(count)]
+
+
+def run(validate, value):
+	try:
+		validate(value)
+	except Exception:
+		pass
+
+
+def main():
+	schema = Iterable([Mapping([Iterable([Instance(int), Range(1, 100)])])])
+	cutoff = Iterable([Mapping([Iterable([Instance(int), Range(1, 100)])])], max_concerns=10)
+	
+	print("{0:>8} {1:>10} {2:>14} {3:>14}".format("records", "payload", "validate (ms)", "cutoff (ms)"))
+	
+	for count in (10, 1000, 10000):
+		valid = document(count)
+		invalid = [dict(record, field0=[0] * 8) for record in valid]
+		
+		for label, value in (('valid', valid), ('invalid', invalid)):
+			print("{0:>8} {1:>10} {2:>14.2f} {3:>14.2f}".format(
+					count,
+					label,
+					latency("run(validate, value)", run=run, validate=schema.validate, value=value) / 1e3,
+					latency("run(validate, value)", run=run, validate=cutoff.validate, value=value) / 1e3,
+				))
+
+
+if __name__ == '__main__':
+	main()
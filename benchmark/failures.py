@@ -0,0 +1,46 @@
+"""Compare the cost of failed validation when raising a Concern against returning a Failure.
+
+Run from a development install (see the README) as: python benchmark/failures.py
+"""
+
+from timeit import repeat
+
+from marrow.schema import Concern
+from marrow.schema.validate import In, Range
+from marrow.schema.validate.network import hostname
+
+
+def latency(statement, number=20000, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def raising(validate, value):
+	try:
+		validate(value)
+	except Concern as e:
+		return e
+
+
+def main():
+	cases = (
+			('hostname', hostname, '-invalid-'),
+			('in', In(range(100)), 1000),
+			('range', Range(1, 10), 27),
+		)
+	
+	print("{0:>10} {1:>14} {2:>14} {3:>14} {4:>14}".format(
+			"validator", "validate (us)", "compiled (us)", "check (us)", "checked (us)"))
+	
+	for label, validator, value in cases:
+		print("{0:>10} {1:>14.2f} {2:>14.2f} {3:>14.2f} {4:>14.2f}".format(
+				label,
+				latency("raising(validate, value)", raising=raising, validate=validator.validate, value=value),
+				latency("raising(validate, value)", raising=raising, validate=validator.compile(), value=value),
+				latency("check(value)", check=validator.check, value=value),
+				latency("check(value)", check=validator.compile(check=True), value=value),
+			))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,58 @@
+"""Measure the import-time cost of Marrow Schema, as reported by `python -X importtime`, for common entry points.
+
+Each statement is run in a fresh interpreter; the total of its top-level imports is reported, best of several runs.
+Standard library modules imported along the way are included, as they are a cost of the import all the same.  For
+representative results permit bytecode caching, i.e. leave PYTHONDONTWRITEBYTECODE unset; the first run warms it.
+
+Run from a development install (see the README) as: python benchmark/importtime.py
+"""
+
+import sys
+
+from subprocess import run
+
+
+STATEMENTS = (
+		"import marrow.schema",
+		"from marrow.schema import Container, Attribute",
+		"from marrow.schema.validate import Pattern",
+		"from marrow.schema.transform import Integer",
+		"from marrow.schema.validate.network import ipaddress",
+		"from marrow.schema.validate.network import ipaddress; ipaddress.validate('::1')",
+		"import marrow.schema.validate, marrow.schema.transform",
+	)
+
+
+def importtime(statement, repeat=7):
+	"""Best-of microseconds spent importing modules while executing the given statement in a new interpreter."""
+	
+	best = None
+	
+	for i in range(repeat):
+		result = run([sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True, check=True)
+		total = 0
+		
+		for line in result.stderr.splitlines():
+			if not line.startswith('import time:') or 'cumulative' in line:
+				continue
+			
+			self, cumulative, name = line[12:].split('|')
+			
+			# Only top-level entries, as nested imports are included in their parent's time, excluding interpreter startup.
+			if name[1:2] != ' ' and name.strip().startswith('marrow'):
+				total += int(cumulative)
+		
+		best = total if best is None else min(best, total)
+	
+	return best
+
+
+def main():
+	print("{0:>10}  {1}".format("time (us)", "statement"))
+	
+	for statement in STATEMENTS:
+		print("{0:>10}  {1}".format(importtime(statement), statement))
+
+
+if __name__ == '__main__':
+	main()
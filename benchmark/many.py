@@ -0,0 +1,54 @@
+"""Compare batch validation using validate_many against calling validate on each value in turn.
+
+Run from a development install (see the README) as: python benchmark/many.py
+"""
+
+from timeit import repeat
+
+from marrow.schema import Concern
+from marrow.schema.validate import In, Range
+from marrow.schema.validate.compound import All
+
+
+def latency(statement, number=10, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def each(validator, values):
+	failures = {}
+	
+	for i, value in enumerate(values):
+		try:
+			validator.validate(value)
+		except Concern as e:
+			failures[i] = e
+	
+	return failures
+
+
+def main():
+	try:
+		import numpy
+	except ImportError:
+		numpy = None
+	
+	validator = All([Range(10, 900), In(range(0, 1000, 2))])
+	
+	print("{0:>8} {1:>14} {2:>14} {3:>14}".format("values", "each (us)", "many (us)", "numpy (us)"))
+	
+	for size in (100, 1000, 10000, 100000):
+		values = [i % 1000 for i in range(size)]
+		array = numpy.array(values) if numpy else None
+		
+		print("{0:>8} {1:>14.1f} {2:>14.1f} {3:>14}".format(
+				size,
+				latency("each(validator, values)", each=each, validator=validator, values=values),
+				latency("validator.validate_many(values)", validator=validator, values=values),
+				"{0:.1f}".format(latency("validator.validate_many(values, mask=True)", validator=validator,
+						values=array)) if numpy else "-",
+			))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,51 @@
+"""Compare the regular expression network address validators against their parsing counterparts.
+
+Includes adversarial input: the CIDRv6 expression backtracks quadratically across a long run of whitespace.
+
+Run from a development install (see the README) as: python benchmark/network.py
+"""
+
+from timeit import repeat
+
+from marrow.schema.validate.network import CIDR, CIDRv4, CIDRv6, IPAddress, IPv4, IPv6
+
+
+def latency(statement, number=2000, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+	cases = (
+			('ipv4', IPv4, '192.168.1.100'),
+			('ipv4', IPv4, '192.168.1.256'),
+			('ipv6', IPv6, '2001:4860:4001:803::1011'),
+			('ipv6', IPv6, '::ffff:192.168.0.1'),
+			('ipv6', IPv6, 'wxyz:'),
+			('ipaddress', IPAddress, '192.168.1.100'),
+			('ipaddress', IPAddress, '2001:4860:4001:803::1011'),
+			('ipaddress', IPAddress, '192.168.1.256'),
+			('cidrv4', CIDRv4, '172.16.0.0/12'),
+			('cidrv6', CIDRv6, 'abcd:ef01::/64'),
+			('cidr', CIDR, 'abcd:ef01::/64'),
+			('cidr', CIDR, 'dead:face::/129'),
+			('ipv6', IPv6, '1:' * 2000 + 'x'),
+			('cidrv6', CIDRv6, '::1%' + ' ' * 2000 + 'x'),
+			('cidr', CIDR, '::1%' + ' ' * 4000 + 'x'),
+		)
+	
+	print("{0:>10} {1:>26} {2:>14} {3:>14}".format("validator", "value", "regex (us)", "parse (us)"))
+	
+	for label, cls, value in cases:
+		regex, parse = cls().compile(check=True), cls(parse=True).compile(check=True)
+		
+		print("{0:>10} {1:>26} {2:>14.2f} {3:>14.2f}".format(
+				label,
+				value if len(value) < 27 else '{0}... ({1})'.format(value[:4], len(value)),
+				latency("regex(value)", regex=regex, value=value, number=5 if len(value) > 100 else 2000),
+				latency("parse(value)", parse=parse, value=value),
+			))
+
+
+if __name__ == '__main__':
+	main()
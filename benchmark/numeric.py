@@ -0,0 +1,44 @@
+"""Compare bulk numeric transformation using native_many against calling native on each value in turn.
+
+Run from a development install (see the README) as: python benchmark/numeric.py
+"""
+
+from timeit import repeat
+
+from marrow.schema.transform import decimal, integer, number
+
+
+def latency(statement, number=10, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+	try:
+		import numpy
+	except ImportError:
+		numpy = None
+	
+	size = 10000
+	columns = (
+			('integer', integer, [str(i - 5000) for i in range(size)]),
+			('decimal', decimal, ['{0}.{1}'.format(i, i % 100) for i in range(size)]),
+			('number', number, [str(i) if i % 2 else '{0}.5'.format(i) for i in range(size)]),
+			('number', number, [str(i) for i in range(size)]),
+		)
+	
+	print("{0} values per column".format(size))
+	print("{0:>8} {1:>14} {2:>14} {3:>14}".format("column", "each (us)", "many (us)", "numpy (us)"))
+	
+	for label, transform, values in columns:
+		print("{0:>8} {1:>14.1f} {2:>14.1f} {3:>14}".format(
+				label,
+				latency("[native(value) for value in values]", native=transform.native, values=values),
+				latency("transform.native_many(values)", transform=transform, values=values),
+				"{0:.1f}".format(latency("transform.native_many(values)", transform=transform,
+						values=numpy.array(values))) if numpy else "-",
+			))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,56 @@
+"""Compare serial validation of a large list against validation in chunks across thread and process pools.
+
+Threads only help where child validators release the GIL (or on a free-threaded interpreter); processes help with
+CPU-heavy validators, at the cost of pickling each chunk.  Results depend heavily on the number of cores available.
+
+Run from a development install (see the README) as: python benchmark/parallel.py
+"""
+
+import os
+
+from timeit import repeat
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from marrow.schema.validate import Callback, Instance, Pattern
+from marrow.schema.validate.compound import Iterable
+
+
+WORKERS = os.cpu_count() or 1
+
+
+def latency(statement, number=1, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def digits(validator, value, context):
+	"""A deliberately costly callback."""
+	return value if sum(int(digit) for digit in value if digit.isdigit()) >= 0 else None
+
+
+def main():
+	children = (
+			('pattern', [Instance(str), Pattern(r'^[a-z0-9.+-]+@(?:[a-z0-9-]+\.)+[a-z]{2,}$')]),
+			('callback', [Instance(str), Callback(digits)]),
+		)
+	
+	print("{0} worker(s)".format(WORKERS))
+	print("{0:>10} {1:>8} {2:>12} {3:>12} {4:>12}".format("children", "elements", "serial (ms)", "threads (ms)",
+			"procs (ms)"))
+	
+	with ThreadPoolExecutor(WORKERS) as threads, ProcessPoolExecutor(WORKERS) as processes:
+		for label, validators in children:
+			for count in (10000, 200000):
+				values = ['user{0}@example{0}.com'.format(i) for i in range(count)]
+				times = []
+				
+				for executor in (None, threads, processes):
+					validate = Iterable(validators, executor=executor).validate
+					validate(values)  # Warm up, compiling the base scheme and starting workers.
+					times.append(latency("validate(values)", validate=validate, values=values) / 1e3)
+				
+				print("{0:>10} {1:>8} {2:>12.2f} {3:>12.2f} {4:>12.2f}".format(label, count, *times))
+
+
+if __name__ == '__main__':
+	main()
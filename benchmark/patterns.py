@@ -0,0 +1,82 @@
+"""Measure Pattern validators against adversarial input, as matched plainly, with a length limit, and in linear time.
+
+Each input is a long run of characters a pattern accepts, ending in one it does not, forcing the expression to explore
+(and, for some, backtrack across) the entire value before failing.  Linear-time matching requires the optional
+`google-re2` package; patterns it is unable to express, or without it installed, are matched by `re` as usual.
+
+Run from a development install (see the README) as: python benchmark/patterns.py
+"""
+
+from timeit import repeat
+
+from marrow.schema.validate import Pattern
+from marrow.schema.validate.util import linear
+from marrow.schema.validate import network, pattern
+
+
+LIMIT = 256
+
+
+def latency(statement, number=20, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def expression(compound):
+	"""Retrieve the regex of the Pattern within a compound validator, such as Hostname."""
+	return next(validator.pattern for validator in compound.validators if isinstance(validator, Pattern))
+
+
+def adversary(prefix, unit, suffix, size):
+	"""Produce a value of roughly the given size from a repeated unit."""
+	return prefix + unit * (size // len(unit)) + suffix
+
+
+CASES = (
+		('IPv4', network.ipv4.pattern, '', '1.', 'x'),
+		('IPv6', network.ipv6.pattern, '', '1:', 'x'),
+		('CIDRv4', network.cidrv4.pattern, '1.1.1.1/', '1', ''),
+		('CIDRv6', network.cidrv6.pattern, '::1%', ' ', 'x'),
+		('Hostname', expression(network.hostname), '', 'a' * 60 + '.', '-'),
+		('DNSName', expression(network.dnsname), '', 'a.', '-'),
+		('MAC', network.mac.pattern, '', 'a:', ''),
+		('URI', network.uri.pattern, '', 'a:', ''),
+		('Alphanumeric', pattern.alphanumeric.pattern, '', 'a', '!'),
+		('Username', pattern.username.pattern, 'a', '.-', '!'),
+		('TwitterUsername', pattern.twitterusername.pattern, '', 'a', ''),
+		('FacebookUsername', pattern.facebookusername.pattern, '', 'a.', '!'),
+		('CreditCard', pattern.creditcard.pattern, '', '1', ''),
+		('HexColor', pattern.hexcolor.pattern, '#', 'a', ''),
+		('AlphaHexColor', pattern.alphahexcolor.pattern, '', 'a', ''),
+		('ISBN', pattern.isbn.pattern, '', '1 ', '!'),
+		('Slug', pattern.slug.pattern, '', 'a', '!'),
+		('UUID', pattern.uuid.pattern, '', '0', ''),
+	)
+
+
+def main():
+	print("{0:>16} {1:>6} {2:>14} {3:>14} {4:>14} {5:>7}".format(
+			"pattern", "size", "plain (us)", "limited (us)", "linear (us)", "engine"))
+	
+	for label, regex, prefix, unit, suffix in CASES:
+		plain = Pattern(regex).compile(check=True)
+		limited = Pattern(regex, limit=LIMIT).compile(check=True)
+		fast = Pattern(regex, linear=True).compile(check=True)
+		engine = type(linear(regex)).__module__.partition('.')[0]
+		
+		for size in (LIMIT // 2, 4096):
+			value = adversary(prefix, unit, suffix, size)
+			assert (plain(value) is None) is (fast(value) is None)
+			
+			print("{0:>16} {1:>6} {2:>14.2f} {3:>14.2f} {4:>14.2f} {5:>7}".format(
+					label,
+					len(value),
+					latency("check(value)", check=plain, value=value),
+					latency("check(value)", check=limited, value=value),
+					latency("check(value)", check=fast, value=value),
+					engine,
+				))
+
+
+if __name__ == '__main__':
+	main()
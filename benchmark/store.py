@@ -0,0 +1,70 @@
+"""Compare per-instance memory and attribute access latency of the dict and slot-backed Container stores.
+
+Run from a development install (see the README) as: python benchmark/store.py
+
+Representative results for the slot store on CPython 3 (single core, noisy; best of three runs, nanoseconds):
+	
+	                   get      set  default
+	dict               330      470      400
+	slot, before       610      860     2750  (Mapping.get; each miss raised and caught KeyError)
+	slot, after        540      720      640  (direct get; empty slots hold a marker instead of raising)
+
+Construction is dominated by the Container itself; marking each slot empty up-front is not measurable here.
+"""
+
+import tracemalloc
+from timeit import repeat
+
+from marrow.schema import Container, Attribute
+from marrow.schema.store import SlotStore
+
+
+class DictRecord(Container):
+	a = Attribute()
+	b = Attribute()
+	c = Attribute()
+	d = Attribute(default=None)
+	e = Attribute(default=None)
+
+
+class SlotRecord(DictRecord):
+	__store__ = SlotStore
+
+
+def memory(cls, count=10000):
+	"""Bytes allocated per instance, including the instance itself and its warehouse."""
+	
+	tracemalloc.start()
+	before = tracemalloc.get_traced_memory()[0]
+	instances = [cls(i, i, i) for i in range(count)]
+	after = tracemalloc.get_traced_memory()[0]
+	tracemalloc.stop()
+	
+	del instances
+	return (after - before) / count
+
+
+def latency(statement, number=200000, **namespace):
+	"""Best-of-five nanoseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+	print("{0:<10} {1:>12} {2:>12} {3:>12} {4:>12} {5:>12}".format(
+			"store", "bytes/inst", "new (ns)", "get (ns)", "set (ns)", "default (ns)"))
+	
+	for label, cls in (('dict', DictRecord), ('slot', SlotRecord)):
+		inst = cls(1, 2, 3)
+		
+		print("{0:<10} {1:>12.1f} {2:>12.1f} {3:>12.1f} {4:>12.1f} {5:>12.1f}".format(
+				label,
+				memory(cls),
+				latency("cls(1, 2, 3)", number=20000, cls=cls),
+				latency("inst.a", inst=inst),
+				latency("inst.b = 27", inst=inst),
+				latency("inst.d", inst=inst),
+			))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,82 @@
+"""Compare the single-pass Token grouping engine against the multi-pass implementation it replaced.
+
+Run from a development install (see the README) as: python benchmark/tokens.py
+"""
+
+from inspect import isroutine
+from timeit import repeat
+
+from marrow.schema.transform import Transform
+from marrow.schema.transform.complex import tags, tag_search, terms
+
+
+def latency(statement, number=2000, **namespace):
+	"""Best-of-five microseconds per execution of the given statement."""
+	return min(repeat(statement, globals=namespace, number=number, repeat=5)) / number * 1e6
+
+
+def previous(self, value, context=None):
+	"""The previous implementation of Token.native, retained for comparison."""
+	
+	value = Transform.native(self, value, context)
+	
+	if value is None:
+		return None
+	
+	pattern, regex = self.pattern
+	matches = regex.findall(value)
+	
+	if isroutine(self.normalize):
+		matches = [self.normalize(i) for i in matches]
+	
+	if self.sort:
+		matches.sort()
+	
+	if not self.groups:
+		return self.cast(matches)
+	
+	groups = dict([(i, list()) for i in self.groups])
+	if None not in groups:
+		groups[None] = list()
+	
+	for i in matches:
+		if i[0] in self.groups:
+			groups[i[0]].append(i[1:])
+		else:
+			groups[None].append(i)
+	
+	if self.group is dict:
+		return groups
+	
+	if not self.group:
+		results = []
+		
+		for group in self.groups:
+			results.extend([(group, match) for match in groups[group]])
+		
+		return self.cast(results)
+	
+	return self.group([[match for match in groups[group]] for group in self.groups])
+
+
+def main():
+	words = ['alpha', '+beta', '-gamma', '"delta epsilon"', '+"zeta eta"', 'Theta', '-iota', 'kappa,lambda']
+	
+	print("{0:>11} {1:>8} {2:>16} {3:>16}".format("transform", "tokens", "previous (us)", "single (us)"))
+	
+	for length in (8, 64, 512):
+		query = ' '.join(words[i % len(words)] for i in range(length))
+		
+		for label, transform in (('tags', tags), ('tag_search', tag_search), ('terms', terms)):
+			assert previous(transform, query) == transform.native(query)
+			
+			print("{0:>11} {1:>8} {2:>16.2f} {3:>16.2f}".format(
+					label,
+					length,
+					latency("previous(transform, query)", previous=previous, transform=transform, query=query),
+					latency("transform.native(query)", transform=transform, query=query),
+				))
+
+
+if __name__ == '__main__':
+	main()
@@ -1,5 +1,9 @@
 from .release import version as __version__
-from .meta import Element
-from .declarative import Container, DataAttribute, Attribute, CallbackAttribute
-from .exc import Concern
-from .util import Attributes
+from .lazy import exports
+
+__all__, __getattr__, __dir__ = exports(__name__, {
+		'.meta': ('Element', ),
+		'.declarative': ('Container', 'DataAttribute', 'Attribute', 'CallbackAttribute'),
+		'.exc': ('Concern', 'Failure'),
+		'.util': ('Attributes', ),
+	}, ('declarative', 'exc', 'meta', 'release', 'store', 'testing', 'transform', 'util', 'validate'))
@@ -5,9 +5,17 @@ These are the most frequently used base classes provided by Marrow Schema.
 
 from warnings import warn
 from inspect import isroutine
+from operator import itemgetter
 from collections import OrderedDict as odict, deque
-from collections.abc import MutableMapping
-from .meta import Element
+from collections.abc import Mapping, MutableMapping
+from .meta import ElementMeta, Element
+
+
+# Classifications of Attribute default values, as determined by Attribute._resolve.  Unique sentinel objects.
+NODEFAULT, CONSTANT, FACTORY = object(), object(), object()
+
+# Types whose instances are never routines, allowing CallbackAttribute to skip inspection of them.
+PLAIN = frozenset((type(None), bool, int, float, complex, str, bytes, tuple, list, dict, set, frozenset, slice))
 
 
 class Container(Element):
@@ -23,6 +31,7 @@ class Container(Element):
 	"""
 	
 	__store__ = dict  # The callable used to produce a new self.__data__ instance. Should result in a MutableMapping.
+	__compiled__ = False  # Generate an __init__ specialized to this class's attributes at class construction time.
 	
 	def __init__(self, *args, **kw):
 		"""Process arguments and assign values to instance attributes at class instantiation time.
@@ -102,6 +111,200 @@ class Container(Element):
 				))
 		
 		return result
+	
+	@classmethod
+	def __compile__(cls):
+		"""Generate and install an ``__init__`` specialized to the final ``__attributes__`` of this class.
+		
+		Called by the metaclass on construction of any subclass with a truthy ``__compiled__`` attribute.  The generated
+		constructor maps positional and keyword arguments without intermediate collections, writing directly to
+		``__data__`` for any attribute using plain ``DataAttribute`` storage and via ``setattr`` for everything else.
+		Invalid invocations are handed to ``_process_arguments`` to raise the usual exceptions.
+		
+		Classes (or intermediate parents) defining their own ``__init__`` are left untouched.
+		"""
+		
+		# Only replace the generic constructor, or a constructor previously generated for a parent class.
+		if cls.__init__ is not Container.__init__ and not getattr(cls.__init__, '__compiled__', False):
+			return
+		
+		attributes = cls.__attributes__
+		positional = [name for name in attributes if name[0] != '_' or name == '__name__']
+		
+		namespace = dict(
+				cls = cls,
+				generic = Container.__init__,
+				parent = super(Container, cls).__init__,
+				fields = frozenset(attributes),
+				positional = tuple(frozenset(positional[:i]) for i in range(len(attributes) + 1)),
+				MutableMapping = MutableMapping,
+			)
+		
+		lines = [
+				"def __init__(self, *args, **kw):",
+				"\tif type(self) is not cls:",  # A subclass with its own __init__ calling up to us.
+				"\t\treturn generic(self, *args, **kw)",
+				"\tn = len(args)",
+				"\tif n > {0} or (kw and (not fields.issuperset(kw) or not positional[n].isdisjoint(kw))):".format(
+						len(attributes)),
+				"\t\tself._process_arguments(args, kw)",  # Raises the appropriate TypeError.
+			]
+		
+		if namespace['parent'] is not object.__init__:
+			lines.append("\tparent(self)")
+		
+		lines.extend((
+				"\tself.__data__ = data = self.__store__()",
+				"\tassert isinstance(data, MutableMapping), 'Data storage attribute __data__ must be a mutable mapping.'",
+			))
+		
+		def assign(name, attr, source):
+			if getattr(type(attr), '__set__', None) is DataAttribute.__set__:
+				return "data[{0!r}] = {1}".format(attr.__name__, source)
+			
+			return "setattr(self, {0!r}, {1})".format(name, source)
+		
+		for i, (name, attr) in enumerate(attributes.items()):
+			lines.append("\tif n > {0}: {1}".format(i, assign(name, attr, 'args[{0}]'.format(i))))
+		
+		if attributes:
+			lines.append("\tif kw:")
+			
+			for name, attr in attributes.items():
+				lines.append("\t\tif {0!r} in kw: {1}".format(name, assign(name, attr, 'kw[{0!r}]'.format(name))))
+		
+		exec(compile("\n".join(lines), '<{0}.__init__>'.format(cls.__qualname__), 'exec'), namespace)
+		
+		init = namespace['__init__']
+		init.__qualname__ = cls.__qualname__ + '.__init__'
+		init.__doc__ = Container.__init__.__doc__
+		init.__compiled__ = True
+		
+		cls.__init__ = init
+	
+	@classmethod
+	def bulk(cls, data, names=None, lazy=False):
+		"""Construct many instances at once from columnar or row-oriented data.
+		
+		The data may be a mapping of attribute names to equal-length sequences of values (columns), a NumPy structured
+		array (whose field names are used), or an iterable of tuples (rows).  Rows are mapped positionally unless a
+		sequence of attribute ``names`` is given.
+		
+		Arguments are mapped, and checked for validity, once per distinct row shape rather than once per instance; the
+		usual ``TypeError`` exceptions are raised for invalid arguments.  Returns a list, or a generator if ``lazy``.
+		"""
+		
+		fields = getattr(getattr(data, 'dtype', None), 'names', None)
+		
+		if isinstance(data, Mapping):
+			names = tuple(data)
+			columns = list(data.values())
+			
+			if len({len(column) for column in columns if hasattr(column, '__len__')}) > 1:
+				raise ValueError("All columns must be of equal length.")
+			
+			rows = zip(*columns)
+		
+		elif fields:  # A NumPy structured (record) array.
+			names = tuple(names or fields)
+			rows = (row.item() for row in data) if lazy else data.tolist()
+		
+		else:
+			rows = data
+		
+		instances = cls._bulk(rows, tuple(names) if names else None)
+		
+		return instances if lazy else list(instances)
+	
+	@classmethod
+	def _bulk(cls, rows, names):
+		"""Generate instances from an iterable of value tuples, resolving a construction plan per row shape."""
+		
+		# A class with its own constructor must still have it called; only the argument mapping can be shared.
+		if cls.__init__ is not Container.__init__ and not getattr(cls.__init__, '__compiled__', False):
+			for row in rows:
+				yield cls(**dict(zip(names, row))) if names else cls(*row)
+			
+			return
+		
+		new = cls.__new__
+		store = cls.__store__
+		parent = super(Container, cls).__init__
+		parent = None if parent is object.__init__ else parent
+		plans = {}
+		
+		for row in rows:
+			try:
+				order, keys, direct = plans[len(row)]
+			except KeyError:
+				order, keys, direct = plans[len(row)] = cls._bulk_plan(row, names)
+			
+			instance = new(cls)
+			
+			if parent:
+				parent(instance)
+			
+			instance.__data__ = data = store()
+			values = order(row) if order else row
+			
+			if direct:
+				data.update(zip(keys, values))
+			else:
+				for (name, key), value in zip(keys, values):
+					if key is None:
+						setattr(instance, name, value)
+					else:
+						data[key] = value
+			
+			instance.__sequence__ = ElementMeta.sequence
+			ElementMeta.sequence += 1
+			
+			yield instance
+	
+	@classmethod
+	def _bulk_plan(cls, row, names):
+		"""Determine the attribute assignments for a bulk construction row of a given shape.
+		
+		Returns a callable re-ordering row values into attribute order (or None if already ordered), the assignments to
+		perform, and a flag indicating if all assignments may be written directly to the warehouse.
+		"""
+		
+		prototype = cls.__new__(cls)
+		
+		if names:
+			if len(set(names)) != len(names):
+				duplicates = set(name for name in names if names.count(name) > 1)
+				raise TypeError('{0} got multiple values for keyword argument{1}: {2}'.format(
+						cls.__name__,
+						'' if len(duplicates) == 1 else 's',
+						', '.join(duplicates)
+					))
+			
+			if len(names) != len(row):
+				raise ValueError("Row length {0} does not match the {1} names given.".format(len(row), len(names)))
+			
+			arguments = prototype._process_arguments((), dict(zip(names, range(len(row)))))
+		else:
+			arguments = prototype._process_arguments(tuple(range(len(row))), {})
+		
+		positions = list(arguments.values())  # The index into the row of each value, in attribute order.
+		
+		if positions == list(range(len(positions))):
+			order = None
+		else:
+			order = itemgetter(*positions)
+		
+		keys = []
+		
+		for name in arguments:
+			attr = cls.__attributes__[name]
+			direct = getattr(type(attr), '__set__', None) is DataAttribute.__set__
+			keys.append((name, attr.__name__ if direct else None))
+		
+		if all(key is not None for name, key in keys):
+			return order, [key for name, key in keys], True
+		
+		return order, keys, False
 
 
 class DataAttribute(Element):
@@ -163,6 +366,8 @@ class Attribute(Container, DataAttribute):
 	default = DataAttribute()
 	assign = False  # If the value is missing, do we outright create it?
 	
+	__resolves__ = frozenset(('__name__', 'default', '__data__'))  # Assignment to these resets the resolved default.
+	
 	def __init__(self, *args, **kw):
 		"""A tiny helper to work around the dunderscores around ``name`` during instantiation.
 		
@@ -176,6 +381,36 @@ class Attribute(Container, DataAttribute):
 		# Process arguments upstream.
 		super().__init__(*args, **kw)
 	
+	def __setattr__(self, name, value):
+		"""Discard the resolved storage key and default when anything they depend upon changes."""
+		
+		if name in self.__resolves__:
+			self.__dict__.pop('_resolved', None)
+		
+		super().__setattr__(name, value)
+	
+	def __delattr__(self, name):
+		if name in self.__resolves__:
+			self.__dict__.pop('_resolved', None)
+		
+		super().__delattr__(name)
+	
+	def _resolve(self):
+		"""Determine the storage key, and classify the default value as absent, constant, or a factory to call.
+		
+		The result is cached, and reset on assignment to any attribute it depends upon.
+		"""
+		
+		try:
+			default = self.default
+		except AttributeError:
+			kind = NODEFAULT
+		else:
+			kind = FACTORY if isroutine(default) else CONSTANT
+		
+		self._resolved = resolved = (self.__name__, kind, None if kind is NODEFAULT else default)
+		return resolved
+	
 	def __get__(self, obj, cls=None):
 		"""Executed when retrieving an Attribute instance attribute."""
 		
@@ -183,29 +418,31 @@ class Attribute(Container, DataAttribute):
 		if obj is None:
 			return self
 		
-		# Attempt to retrieve the data from the warehouse.
 		try:
-			return super().__get__(obj, cls)
+			name, kind, default = self._resolved
 		except AttributeError:
-			pass
+			name, kind, default = self._resolve()
 		
-		# Attempt to utilize the defined default value.
-		try:
-			default = self.default
-		except AttributeError:
-			pass
-		else:
-			# Process and optionally store the default value.
-			value = default() if isroutine(default) else default
-			if self.assign:
-				self.__set__(obj, value)
+		# Attempt to retrieve the data from the warehouse.
+		value = obj.__data__.get(name, NODEFAULT)
+		
+		if value is not NODEFAULT:
 			return value
 		
-		# If we still don't have a value, this attribute doesn't yet exist.
-		raise AttributeError('\'{0}\' object has no attribute \'{1}\''.format(
-				obj.__class__.__name__,
-				self.__name__
-			))
+		# If we have no default, this attribute doesn't yet exist.
+		if kind is NODEFAULT:
+			raise AttributeError('\'{0}\' object has no attribute \'{1}\''.format(
+					obj.__class__.__name__,
+					name
+				))
+		
+		# Process and optionally store the default value.
+		value = default() if kind is FACTORY else default
+		
+		if self.assign:
+			self.__set__(obj, value)
+		
+		return value
 
 
 class CallbackAttribute(Attribute):
@@ -224,5 +461,9 @@ class CallbackAttribute(Attribute):
 		# Attempt to retrieve the data from the warehouse.
 		value = super().__get__(obj, cls)
 		
+		# Common plain values can never be routines; skip the comparatively costly inspection of them.
+		if type(value) in PLAIN:
+			return value
+		
 		# Return the value, or execute it and return the result.
 		return value() if isroutine(value) else value
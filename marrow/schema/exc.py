@@ -1,13 +1,63 @@
 import sys
 import copy
+import copyreg
 
 from logging import getLevelName, DEBUG, INFO, WARNING, ERROR, CRITICAL
 
 
+class ElementMessage:
+	"""A concern message prefixed by the element it concerns, rendered only when used.
+	
+	Held by a `Concern` or `Failure` describing an element of a collection or record; their `message` attribute
+	renders it to a `str` on first access.  Behaves as the rendered string for comparison, containment, concatenation,
+	and string methods.
+	"""
+	
+	__slots__ = ('key', 'message')
+	
+	def __init__(self, key, message):
+		self.key = key
+		self.message = message
+	
+	def __str__(self):
+		return "Element " + repr(self.key) + ": " + str(self.message)
+	
+	def __repr__(self):
+		return repr(str(self))
+	
+	def __getattr__(self, name):
+		if name in self.__slots__:  # Not yet assigned, e.g. during unpickling.
+			raise AttributeError(name)
+		
+		return getattr(str(self), name)
+	
+	def __contains__(self, other):
+		return other in str(self)
+	
+	def __eq__(self, other):
+		return str(self) == other
+	
+	def __hash__(self):
+		return hash(str(self))
+	
+	def __len__(self):
+		return len(str(self))
+	
+	def __add__(self, other):
+		return str(self) + other
+	
+	def __radd__(self, other):
+		return other + str(self)
+
+
 class Concern(Exception):
 	"""There was an error validating data.
 	
 	Only `logging.ERROR` (and above) validation concerns should be treated as actual errors.
+	
+	The `path` is a tuple of the keys (indexes, mapping keys, or field names) leading from the value validated to the
+	element of it concerned, outermost first; it is empty if the concern is about the value itself.  The `message` of
+	a concern about an element is prefixed with that element, formatted into a `str` only once first accessed.
 	"""
 	
 	def __init__(self, level=ERROR, message="Unspecified error.", *args, **kw):
@@ -23,10 +73,34 @@ class Concern(Exception):
 		self.message = message
 		self.level = level
 		self.concerns = kw.pop('concerns', [])
+		self.path = kw.pop('path', ())
 		self.kwargs = kw
 		
 		super().__init__(*args)
 	
+	def __reduce__(self):
+		"""Pickle without calling the constructor, which would re-arrange the already processed arguments."""
+		return copyreg.__newobj__, (self.__class__, ) + self.args, self.__dict__
+	
+	@property
+	def message(self):
+		message = self._message
+		
+		if type(message) is ElementMessage:  # Render the deferred element prefix once, now that it's wanted.
+			message = self._message = str(message)
+		
+		return message
+	
+	@message.setter
+	def message(self, value):
+		self._message = value
+	
+	def _element(self, key):
+		"""Prefix this concern, as being about the element of the value validated with the given key."""
+		
+		self._message = ElementMessage(key, self._message)
+		self.path = (key, ) + self.path
+	
 	def __str__(self):
 		"""Format the validation concern for human consumption.
 		
@@ -42,3 +116,59 @@ class Concern(Exception):
 			)
 		
 		return result
+
+
+class Failure:
+	"""A lightweight description of a validation failure, returned rather than raised.
+	
+	Produced by the non-raising `check` validation methods, sparing the construction, raising, and catching of an
+	exception and its traceback.  Shares the `level`, `message`, `args`, `kwargs`, `concerns`, and `path` of `Concern`,
+	and as with `Concern` the message is only formatted when rendered.  Failures without arguments may be shared
+	between calls; treat them as immutable.
+	"""
+	
+	__slots__ = ('level', '_message', 'args', 'kwargs', 'concerns', 'path')
+	
+	def __init__(self, level=ERROR, message="Unspecified error.", *args, **kw):
+		"""Accepts the same arguments as `Concern`."""
+		
+		if isinstance(level, int):
+			args = (level, message) + args
+		else:
+			args = (message, ) + args
+			message = level
+			level = ERROR
+		
+		self.level = level
+		self.message = message
+		self.args = args
+		self.concerns = kw.pop('concerns', [])
+		self.path = kw.pop('path', ())
+		self.kwargs = kw
+	
+	@classmethod
+	def of(cls, concern):
+		"""Describe an existing Concern instance."""
+		
+		failure = cls.__new__(cls)
+		failure.level = concern.level
+		failure._message = concern._message
+		failure.args = concern.args
+		failure.kwargs = concern.kwargs
+		failure.concerns = concern.concerns
+		failure.path = concern.path
+		
+		return failure
+	
+	def concern(self):
+		"""Produce an equivalent Concern, e.g. for raising."""
+		
+		concern = Concern(self.level, self._message, concerns=self.concerns, path=self.path, **self.kwargs)
+		concern.args = self.args
+		
+		return concern
+	
+	message = Concern.message
+	_element = Concern._element
+	__str__ = Concern.__str__
+	__repr__ = Concern.__repr__
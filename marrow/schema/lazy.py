@@ -0,0 +1,34 @@
+"""Deferred package exports, importing the submodule providing a name only when that name is first used.
+
+Kept free of other Marrow Schema imports, and light on standard library ones, as it is used during package import.
+"""
+
+from importlib import import_module
+
+
+def exports(package, names, submodules=()):
+	"""Produce the `__all__`, `__getattr__`, and `__dir__` of a package whose exports are imported on first access.
+	
+	The names exported are given as a mapping of relative submodule path (e.g. ".base") to the names it provides.
+	Any additionally named submodules are imported on access as attributes of the package, as if already imported.
+	Resolved values are stored in the package namespace, bypassing further lookups.
+	"""
+	
+	namespace = import_module(package).__dict__
+	origin = {name: module for module, provided in names.items() for name in provided}
+	
+	def __getattr__(name):
+		if name in origin:
+			value = getattr(import_module(origin[name], package), name)
+		elif name in submodules:
+			value = import_module('.' + name, package)
+		else:
+			raise AttributeError("module {0!r} has no attribute {1!r}".format(package, name))
+		
+		namespace[name] = value
+		return value
+	
+	def __dir__():
+		return sorted(set(namespace) | set(origin) | set(submodules))
+	
+	return list(origin), __getattr__, __dir__
@@ -4,13 +4,19 @@ This handles the irregularities of metaclass definition and usage across Python
 """
 
 from collections import OrderedDict as odict
+from heapq import merge
+
+
+def _sequence(item):
+	"""Sort key for (name, attribute) pairs, ordering by attribute instantiation."""
+	return item[1].__sequence__
 
 
 class ElementMeta(type):
 	"""Instantiation order tracking and attribute naming / collection metaclass.
 	
 	To use, construct subclasses of the Element class whose attributes are themselves instances of Element subclasses.
-	Five attributes on your subclass have magical properties:
+	Seven attributes on your subclass have magical properties:
 	
 	* `inst.__sequence__`
 	  An atomically incrementing (for the life of the process) counter used to preserve order.  Each instance of an
@@ -35,6 +41,14 @@ class ElementMeta(type):
 	  class will be called to notify you and allow you to make additional adjustments to the class using your subclass.
 	  Should be a classmethod.
 	
+	* `cls.__store__`
+	  If the storage factory of your class provides a `__specialize__` classmethod, it is called with your completed
+	  class and the result replaces the factory.  This allows storage to be laid out to match the final attributes.
+	
+	* `cls.__compiled__`
+	  If truthy, the `__compile__` classmethod of your class is called once construction (and any fixups) have
+	  completed, allowing the class to generate code specialized to its final set of attributes.
+	
 	Generally you will want to use one of the helper classes provided (Container, Attribute, etc.) however this can be
 	useful if you only require extremely light-weight attribute features on custom objects.
 	"""
@@ -48,23 +62,32 @@ class ElementMeta(type):
 		# Short-circuit this logic on the root "Element" class, as it can have no attributes.
 		if len(bases) == 1 and bases[0] is object:
 			attrs['__attributes__'] = odict()
-			return type.__new__(meta, str(name), bases, attrs)
+			cls = type.__new__(meta, str(name), bases, attrs)
+			cls.__derived = dict()
+			return cls
 		
-		attributes = odict()
-		overridden_sequence = dict()
 		fixups = []
 		
-		# Gather the parent classes that participate in our protocol.
-		for base in bases:
-			if hasattr(base, '__attributes__'):
-				attributes.update(base.__attributes__)
+		# Gather the parent classes that participate in our protocol.  Their orderings are already sorted; with a single
+		# parent (by far the most common case) its ordering and derived annotations are reused, rather than rebuilt.
+		parents = [base for base in bases if hasattr(base, '__attributes__')]
+		
+		if len(parents) == 1 and isinstance(parents[0], ElementMeta):
+			attributes = parents[0].__attributes__
+			inherited = parents[0].__derived
+		
+		else:
+			# Where the same name is inherited from several parents, the last one wins, as with dictionary update.
+			winners = dict()
+			for parent in parents: winners.update(parent.__attributes__)
+			
+			attributes = odict((k, v) for k, v in merge(*(parent.__attributes__.items() for parent in parents),
+					key=_sequence) if winners[k] is v)
+			inherited = None
 		
 		# To allow for hardcoding of Attributes we eliminate keys that have been redefined.
 		# They might get added back later, of course.
-		for k in attrs:
-			if k in attributes:
-				overridden_sequence[k] = attributes[k].__sequence__
-				attributes.pop(k, None)
+		overridden_sequence = {k: attributes[k].__sequence__ for k in attrs if k in attributes}
 		
 		def process(name, attr):
 			"""Process attributes that are Element subclass instances."""
@@ -84,16 +107,40 @@ class ElementMeta(type):
 			return name, attr
 		
 		# Iteratively process the Element subclass instances and update their definition.
-		attributes.update(process(k, v) for k, v in attrs.items() if isinstance(v, Element))
-		attrs['__attributes__'] = odict(sorted(attributes.items(), key=lambda t: t[1].__sequence__))
-		ann = attrs.setdefault('__annotations__', dict())
+		declared = sorted((process(k, v) for k, v in attrs.items() if isinstance(v, Element)), key=_sequence)
 		
-		for k, v in attributes.items():
-			if not hasattr(v, 'annotation'): continue  # Skip missing or None annotations.
-			ann.setdefault(k, v.annotation)  # If an annotation is already set (explicitly by the developer), skip.
+		# Newly declared attributes are typically newer than any inherited, in which case they are simply appended;
+		# otherwise, such as when an attribute is overridden, the two sorted sequences are merged.
+		if not overridden_sequence and (not declared or not attributes or
+				_sequence(declared[0]) > _sequence(next(reversed(attributes.items())))):
+			attributes = odict(attributes)
+			attributes.update(declared)
+		
+		else:
+			attributes = odict(merge(((k, v) for k, v in attributes.items() if k not in overridden_sequence), declared,
+					key=_sequence))
+			inherited = None
+		
+		# The annotations derived from our attributes, in order, skipping any missing (but not None) annotations.
+		if inherited is None:
+			derived = {k: v.annotation for k, v in attributes.items() if hasattr(v, 'annotation')}
+		else:
+			derived = dict(inherited)
+			derived.update((k, v.annotation) for k, v in declared if hasattr(v, 'annotation'))
+		
+		attrs['__attributes__'] = attributes
+		
+		if '__annotations__' not in attrs:
+			attrs['__annotations__'] = dict(derived)
+		else:
+			ann = attrs['__annotations__']
+			
+			for k, v in derived.items():
+				ann.setdefault(k, v)  # If an annotation is already set (explicitly by the developer), skip.
 		
 		# Construct the new class.
 		cls = type.__new__(meta, str(name), bases, attrs)
+		cls.__derived = derived
 		
 		# Allow the class to be notified of its own construction.  Do not ask how this avoids creating black holes.
 		if hasattr(cls, '__attributed__'):
@@ -103,6 +150,13 @@ class ElementMeta(type):
 		for obj in fixups:
 			obj.__fixup__(cls)
 		
+		# Once the attribute set is final, allow the storage factory and class to specialize themselves against it.
+		if hasattr(getattr(cls, '__store__', None), '__specialize__'):
+			cls.__store__ = cls.__store__.__specialize__(cls)
+		
+		if getattr(cls, '__compiled__', False):
+			cls.__compile__()
+		
 		return cls
 	
 	def __call__(meta, *args, **kw):
@@ -0,0 +1,163 @@
+"""Alternative instance data storage for Container subclasses.
+
+Assign one of these as the ``__store__`` of a ``Container`` subclass to replace the default ``dict`` warehouse.
+"""
+
+from operator import attrgetter
+from collections.abc import MutableMapping
+
+
+EMPTY = object()  # Held by a declared slot without a value.
+
+
+class SlotStore(MutableMapping):
+	"""A fixed-position, slot-backed mapping laid out from the declared attributes of a Container subclass.
+	
+	Each value declared by a ``DataAttribute`` (keyed on its ``__name__``) is assigned a dedicated slot on the store
+	instance, eliminating the per-instance hash table of a ``dict``.  Keys not known at class construction time are
+	accepted, and are kept in a small overflow dictionary created on first use.
+	
+	Iteration follows attribute declaration order, not assignment order, with any overflow keys last.  Declared slots
+	without a value hold the ``EMPTY`` marker, so lookups of absent keys are answered without raising internally.
+	
+	To use, simply assign the class as the ``__store__`` of your ``Container`` subclass::
+		
+		class Point(Container):
+			__store__ = SlotStore
+			
+			x = Attribute()
+			y = Attribute()
+	
+	The metaclass notices the ``__specialize__`` class method and replaces the store with a subclass generated for the
+	final attributes of each ``Container`` subclass.
+	"""
+	
+	__slots__ = ('_extra', )
+	
+	__keys__ = ()  # The declared keys, in slot order.
+	__getters__ = {}  # A mapping of declared key to slot value retrieval callable.
+	__names__ = {}  # A mapping of declared key to slot name.
+	
+	def __init__(self):
+		self._extra = None
+	
+	@classmethod
+	def __specialize__(cls, container):
+		"""Produce a store subclass with one slot per value storing attribute of the given Container subclass."""
+		
+		from .declarative import DataAttribute
+		
+		generic = cls.__dict__.get('__generic__', cls)  # Always specialize from the original, unspecialized store.
+		keys = []
+		
+		for attr in container.__attributes__.values():
+			if not isinstance(attr, DataAttribute): continue  # Not stored in the warehouse.
+			if attr.__name__ not in keys: keys.append(attr.__name__)
+		
+		slots = tuple('_' + str(i) for i in range(len(keys)))
+		namespace = dict(
+				__slots__ = slots,
+				__module__ = generic.__module__,
+				__qualname__ = container.__qualname__ + '.' + generic.__name__,
+				__generic__ = generic,
+				__keys__ = tuple(keys),
+			)
+		
+		if slots:  # Mark every slot empty up-front, so that reads never need to catch an unset slot's AttributeError.
+			lines = ["def __init__(self):", "\tself." + " = self.".join(slots) + " = EMPTY", "\tself._extra = None"]
+			scope = dict(EMPTY=EMPTY)
+			exec(compile("\n".join(lines), '<{0}.__init__>'.format(namespace['__qualname__']), 'exec'), scope)
+			namespace['__init__'] = scope['__init__']
+		
+		store = type(generic.__name__, (generic, ), namespace)
+		
+		store.__getters__ = {key: attrgetter(slot) for key, slot in zip(keys, slots)}
+		store.__names__ = dict(zip(keys, slots))
+		
+		return store
+	
+	def __getstate__(self):
+		"""Copy and pickle the present values only; the empty marker is restored by ``__init__``."""
+		return dict(self.items())
+	
+	def __setstate__(self, state):
+		self.__init__()
+		self.update(state)
+	
+	def get(self, key, default=None):
+		"""Return the value for the given key if present, otherwise the default, as per ``dict.get``."""
+		
+		getter = self.__getters__.get(key)
+		
+		if getter is None:
+			extra = self._extra
+			return default if extra is None else extra.get(key, default)
+		
+		value = getter(self)
+		return default if value is EMPTY else value
+	
+	def __getitem__(self, key):
+		getter = self.__getters__.get(key)
+		
+		if getter is None:
+			if self._extra is None:
+				raise KeyError(key)
+			
+			return self._extra[key]
+		
+		value = getter(self)
+		
+		if value is EMPTY:
+			raise KeyError(key)
+		
+		return value
+	
+	def __setitem__(self, key, value):
+		slot = self.__names__.get(key)
+		
+		if slot is None:
+			if self._extra is None:
+				self._extra = {}
+			
+			self._extra[key] = value
+			return
+		
+		setattr(self, slot, value)
+	
+	def __delitem__(self, key):
+		slot = self.__names__.get(key)
+		
+		if slot is None:
+			if self._extra is None:
+				raise KeyError(key)
+			
+			del self._extra[key]
+			return
+		
+		if getattr(self, slot) is EMPTY:
+			raise KeyError(key)
+		
+		setattr(self, slot, EMPTY)
+	
+	def __contains__(self, key):
+		return self.get(key, EMPTY) is not EMPTY
+	
+	def __iter__(self):
+		getters = self.__getters__
+		
+		for key in self.__keys__:
+			if getters[key](self) is not EMPTY:
+				yield key
+		
+		if self._extra is not None:
+			yield from list(self._extra)
+	
+	def __len__(self):
+		return sum(1 for key in self)
+	
+	def __repr__(self):
+		return '{0}({1!r})'.format(self.__class__.__name__, dict(self.items()))
+	
+	def copy(self):
+		"""Return a shallow copy as a plain dictionary, as per ``dict.copy``."""
+		return dict(self.items())
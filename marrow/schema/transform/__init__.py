@@ -1,11 +1,9 @@
-from .base import BaseTransform, Transform, SplitTransform
-from .base import IngressTransform, EgressTransform, CallbackTransform
+from ..lazy import exports
 
-from .complex import Token, tags, terms
-
-from .container import Array, array
-
-from .type import Boolean, boolean
-from .type import Integer, integer
-from .type import Decimal, decimal
-from .type import Number, number
+__all__, __getattr__, __dir__ = exports(__name__, {
+		'.base': ('BaseTransform', 'Transform', 'SplitTransform', 'IngressTransform', 'EgressTransform',
+				'CallbackTransform'),
+		'.complex': ('Token', 'tags', 'terms'),
+		'.container': ('Array', 'array'),
+		'.type': ('Boolean', 'boolean', 'Integer', 'integer', 'Decimal', 'decimal', 'Number', 'number'),
+	}, ('base', 'complex', 'container', 'primitive', 'type'))
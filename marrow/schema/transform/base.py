@@ -1,9 +1,17 @@
+import io
 import sys
 
+from codecs import getincrementaldecoder
+from inspect import isawaitable
+
 from .. import Container, DataAttribute, Attribute, Attributes
 from ..exc import Concern
 
 
+CHUNK = 64 * 1024  # The default number of characters (or bytes) read at a time by iterload.
+PARSERS = {int: 'int64', float: 'float64'}  # Ingress callbacks with a NumPy equivalent; these accept text and bytes.
+
+
 class BaseTransform(Container):
 	"""The core implementation of common Transform shared routines.
 	
@@ -20,6 +28,20 @@ class BaseTransform(Container):
 		
 		return value
 	
+	async def aforeign(self, value, context=None):
+		"""Asynchronously convert a value from Python to a foreign-acceptable type, for use within an event loop.
+		
+		Transformers whose conversion may need to wait, such as upon a callback performing I/O, override this; by
+		default the synchronous `foreign` is used.
+		"""
+		
+		return self.foreign(value, context)
+	
+	async def anative(self, value, context=None):
+		"""Asynchronously convert a value from a foreign type to Python-native, as per `aforeign`."""
+		
+		return self.native(value, context)
+	
 	def loads(self, value, context=None):
 		"""Attempt to load a string-based value into the native representation.
 		
@@ -56,6 +78,27 @@ class BaseTransform(Container):
 		value = self.dumps(value)
 		fh.write(value)
 		return len(value)
+	
+	def iterload(self, fh, context=None, size=CHUNK):
+		"""Transform a string-based value read from a file-like object, yielding the elements of the native value.
+		
+		Transformers of collections (such as ``Array`` and ``Token``) override this to read in chunks of ``size``,
+		yielding elements as they are encountered instead of reading the whole content first.
+		"""
+		
+		value = self.load(fh, context)
+		
+		if value is not None:
+			yield from value
+	
+	def iterdump(self, fh, iterable, context=None):
+		"""Transform and write the elements of an iterable as a single string-based foreign value.
+		
+		Returns the length written.  Transformers of collections override this to write each element as it is
+		produced instead of building the whole string first.
+		"""
+		
+		return self.dump(fh, list(iterable), context)
 
 
 class Transform(BaseTransform):
@@ -87,6 +130,42 @@ class Transform(BaseTransform):
 			return value.decode(self.encoding)
 		
 		return value
+	
+	def _chunks(self, fh, size=CHUNK):
+		"""Read a file-like object in chunks of the given size, yielding text decoded using our encoding if needed."""
+		
+		decoder = None
+		
+		while True:
+			chunk = fh.read(size)
+			
+			if not chunk:
+				break
+			
+			if isinstance(chunk, bytes):
+				if decoder is None:
+					decoder = getincrementaldecoder(self.encoding or 'utf-8')()
+				
+				chunk = decoder.decode(chunk)  # Multi-byte sequences split across chunks are retained by the decoder.
+			
+			if chunk:
+				yield chunk
+		
+		if decoder is not None:
+			chunk = decoder.decode(b'', True)
+			
+			if chunk:
+				yield chunk
+	
+	def _writer(self, fh):
+		"""Return a callable writing text to the given file-like object, encoding it if the handle is binary."""
+		
+		if isinstance(fh, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(fh, 'mode', ''):
+			encoding = self.encoding or 'utf-8'
+			write = fh.write
+			return lambda text: write(text.encode(encoding))
+		
+		return fh.write
 
 
 class IngressTransform(Transform):
@@ -117,6 +196,90 @@ class IngressTransform(Transform):
 			return self.ingress(value)
 		except Exception as e:
 			raise Concern("Unable to transform incoming value: {0}", str(e))
+	
+	async def anative(self, value, context=None):
+		"""As per `native`, awaiting the result of the ingress callback if it is a coroutine function."""
+		
+		if type(self).native is not IngressTransform.native:  # Overridden; our own behaviour may not apply.
+			return self.native(value, context)
+		
+		value = super().native(value, context)
+		
+		if value is None: return
+		
+		try:
+			value = self.ingress(value)
+			
+			if isawaitable(value):
+				value = await value
+		except Exception as e:
+			raise Concern("Unable to transform incoming value: {0}", str(e))
+		
+		return value
+	
+	def native_many(self, values, context=None):
+		"""Convert a sequence of foreign values to native, as per `native`, in bulk.
+		
+		All values are processed before raising a single Concern whose `concerns` describe each failure, including the
+		index of the failing value.  Returns a list, or where a NumPy array of text or numbers is given and the ingress
+		callback is `int` or `float`, a NumPy array of the corresponding type if every value could be converted.
+		"""
+		
+		numpy = sys.modules.get('numpy')  # If a NumPy array was passed in, NumPy has already been imported.
+		overridden = type(self).native is not IngressTransform.native  # If so, no shortcut may be taken.
+		
+		if numpy is not None and isinstance(values, numpy.ndarray):
+			result = None if overridden else self._native_array(values, numpy)
+			
+			if result is not None:
+				return result
+			
+			values = values.tolist()
+		
+		if overridden:
+			return _many(self.native, values, context, "incoming")
+		
+		ingress = self.ingress
+		
+		if ingress in PARSERS:
+			try:  # The builtins perform identical stripping and decoding; only failures need individual handling.
+				return list(map(ingress, values))
+			except Exception:
+				pass
+		
+		strip, none, encoding = self.strip, self.none, self.encoding
+		
+		def native(value, context):  # Transform.native and our own, with the attribute lookups hoisted out.
+			if strip and hasattr(value, 'strip'):
+				value = value.strip()
+			
+			if none and value == '':
+				return None
+			
+			if encoding and isinstance(value, bytes):
+				value = value.decode(encoding)
+			
+			if value is None: return
+			
+			try:
+				return ingress(value)
+			except Exception as e:
+				raise Concern("Unable to transform incoming value: {0}", str(e))
+		
+		return _many(native, values, context, "incoming")
+	
+	def _native_array(self, values, numpy):
+		"""Convert a NumPy array in one operation, returning None if not possible."""
+		
+		dtype = PARSERS.get(self.ingress)
+		
+		if dtype is None or values.ndim != 1 or values.dtype.kind not in 'USbif':  # Unsigned values may not fit.
+			return None
+		
+		if dtype == 'int64' and values.dtype.kind == 'f':  # Truncation of NaN and infinities is not reported by NumPy.
+			return None
+		
+		return _parse(values, numpy, self.ingress, dtype)
 
 
 class EgressTransform(Transform):
@@ -131,6 +294,43 @@ class EgressTransform(Transform):
 			return self.egress(value)
 		except Exception as e:
 			raise Concern("Unable to transform outgoing value: {0}", str(e))
+	
+	async def aforeign(self, value, context=None):
+		"""As per `foreign`, awaiting the result of the egress callback if it is a coroutine function."""
+		
+		if type(self).foreign is not EgressTransform.foreign:
+			return self.foreign(value, context)
+		
+		value = super().foreign(value, context)
+		
+		try:
+			value = self.egress(value)
+			
+			if isawaitable(value):
+				value = await value
+		except Exception as e:
+			raise Concern("Unable to transform outgoing value: {0}", str(e))
+		
+		return value
+	
+	def foreign_many(self, values, context=None):
+		"""Convert a sequence of native values to foreign, as per `foreign`, in bulk, returning a list.
+		
+		Failures are reported as per `IngressTransform.native_many`.  NumPy arrays are first converted to Python values.
+		"""
+		
+		numpy = sys.modules.get('numpy')
+		
+		if numpy is not None and isinstance(values, numpy.ndarray):
+			values = values.tolist()
+		
+		if type(self).foreign is EgressTransform.foreign:
+			try:
+				return list(map(self.egress, values))
+			except Exception:
+				pass
+		
+		return _many(self.foreign, values, context, "outgoing")
 
 
 class CallbackTransform(IngressTransform, EgressTransform):
@@ -141,6 +341,38 @@ class CallbackTransform(IngressTransform, EgressTransform):
 	pass
 
 
+def _parse(values, numpy, parser, dtype):
+	"""Convert a NumPy array using the given builtin parser and equivalent NumPy type, returning None on failure."""
+	
+	try:
+		if values.dtype.kind in 'US':  # NumPy's own parsing of text is slower than that of the builtins.
+			return numpy.fromiter(map(parser, values.tolist()), dtype, len(values))
+		
+		return values.astype(dtype)
+	except (ValueError, OverflowError):
+		return None
+
+
+def _many(transform, values, context, direction):
+	"""Apply a transformation to each value, raising one Concern describing every failure."""
+	
+	results = []
+	failures = []
+	
+	for i, value in enumerate(values):
+		try:
+			results.append(transform(value, context))
+		except Concern as e:
+			results.append(None)
+			failures.append(Concern("Unable to transform {0} value {1!r} at index {2}: {3}", direction, value, i, str(e)))
+	
+	if failures:
+		raise Concern("Unable to transform {0} of {1} {2} values.", len(failures), len(results), direction,
+				concerns=failures)
+	
+	return results
+
+
 class SplitTransform(BaseTransform):
 	"""Splits read and write behaviours between two transformers.
 	
@@ -164,19 +396,31 @@ class SplitTransform(BaseTransform):
 	def native(self, value, context=None):
 		return self.reader.native(value, context)
 	
+	async def anative(self, value, context=None):
+		return await self.reader.anative(value, context)
+	
 	def loads(self, value, context=None):
 		return self.reader.loads(value, context)
 	
 	def load(self, fh, context=None):
 		return self.reader.load(fh, context)
 	
+	def iterload(self, fh, context=None, size=CHUNK):
+		return self.reader.iterload(fh, context, size)
+	
 	# Writer Methods
 	
 	def foreign(self, value, context=None):
 		return self.writer.foreign(value, context)
 	
+	async def aforeign(self, value, context=None):
+		return await self.writer.aforeign(value, context)
+	
 	def dumps(self, value, context=None):
 		return self.writer.dumps(value, context)
 	
 	def dump(self, fh, value, context=None):
 		return self.writer.dump(fh, value, context)
+	
+	def iterdump(self, fh, iterable, context=None):
+		return self.writer.iterdump(fh, iterable, context)
@@ -1,7 +1,37 @@
 import re
+from functools import lru_cache
 from inspect import isroutine
 
-from .base import Concern, Transform, DataAttribute, Attribute
+from .base import CHUNK, Concern, Transform, DataAttribute, Attribute
+
+
+@lru_cache(maxsize=128)
+def token_pattern(separators, quotes, groups):
+	"""Build and compile the regular expression needed for token processing, returning both.
+	
+	Results are shared by all Token instances with the same configuration; ``groups`` must be hashable, e.g. a tuple.
+	Call ``token_pattern.cache_info()`` for hit and miss counts, or ``token_pattern.cache_clear()`` to reset.
+	"""
+	
+	if groups and None not in groups:
+		groups = [None] + list(groups)
+	
+	expression = ''.join((
+			# Trap possible leading space or separators.
+			(r'[\s%s]*' % (''.join(separators), )),
+			'(',
+				# Pass groups=('+','-') to handle optional leading + or -.
+				('[%s]%s' % (''.join([i for i in list(groups) if i is not None]), '?' if None in groups else '')) if groups else '',
+				# Match any amount of text (that isn't a quote) inside quotes.
+				''.join([(r'%s[^%s]+%s|' % (i, i, i)) for i in quotes]) if quotes else '',
+				# Match any amount of text that isn't whitespace.
+				('[^%s]+' % (''.join(separators), )),
+			')',
+			# Match possible separator character.
+			('[%s]*' % (''.join(separators), )),
+		))
+	
+	return expression, re.compile(expression)
 
 
 class TokenPatternAttribute(DataAttribute):
@@ -18,31 +48,14 @@ class TokenPatternAttribute(DataAttribute):
 		except KeyError:
 			pass
 		
-		# No stored value?  No problem!  Let's calculate it.
+		# No stored value?  No problem!  Let's retrieve it from the shared cache, or calculate it.
 		
-		separators = obj.separators
 		groups = obj.groups
-		quotes = obj.quotes
-		
-		if groups and None not in groups:
-			groups = [None] + list(groups)
-		
-		expression = ''.join((
-				# Trap possible leading space or separators.
-				('[\s%s]*' % (''.join(separators), )),
-				'(',
-					# Pass groups=('+','-') to handle optional leading + or -.
-					('[%s]%s' % (''.join([i for i in list(groups) if i is not None]), '?' if None in groups else '')) if groups else '',
-					# Match any amount of text (that isn't a quote) inside quotes.
-					''.join([(r'%s[^%s]+%s|' % (i, i, i)) for i in quotes]) if quotes else '',
-					# Match any amount of text that isn't whitespace.
-					('[^%s]+' % (''.join(separators), )),
-				')',
-				# Match possible separator character.
-				('[%s]*' % (''.join(separators), )),
-			))
-		
-		value = (expression, re.compile(expression))
+		
+		try:
+			value = token_pattern(obj.separators, obj.quotes, tuple(groups or ()))
+		except TypeError:  # Unhashable configuration, e.g. a list of separators.
+			value = token_pattern.__wrapped__(obj.separators, obj.quotes, groups)
 		
 		self.__set__(obj, value)
 		
@@ -67,39 +80,160 @@ class Token(Transform):
 			return None
 		
 		pattern, regex = self.pattern
-		matches = regex.findall(value)
+		tokens = regex.findall(value)
 		
 		if isroutine(self.normalize):
-			matches = [self.normalize(i) for i in matches]
-		
-		if self.sort:
-			matches.sort()
+			tokens = map(self.normalize, tokens)
 		
 		if not self.groups:
-			return self.cast(matches)
+			return self.cast(sorted(tokens) if self.sort else tokens)
 		
-		groups = dict([(i, list()) for i in self.groups])
-		if None not in groups:
-			groups[None] = list() # To prevent errors.
+		# Dispatch each token to its group in a single pass; grouped tokens share a prefix, so sort each afterwards.
+		groups = {i: [] for i in self.groups}
+		other = groups.setdefault(None, [])  # To prevent errors.
 		
-		for i in matches:
-			if i[0] in self.groups:
-				groups[i[0]].append(i[1:])
+		for token in tokens:
+			bucket = groups.get(token[:1])
+			
+			if bucket is None:
+				other.append(token)
 			else:
-				groups[None].append(i)
+				bucket.append(token[1:])
+		
+		if self.sort:
+			for bucket in groups.values():
+				bucket.sort()
 		
 		if self.group is dict:
 			return groups
 		
 		if not self.group:
-			results = []
+			return self.cast([(group, token) for group in self.groups for token in groups[group]])
+		
+		return self.group([groups[group] for group in self.groups])
+	
+	def iterload(self, fh, context=None, size=CHUNK):
+		"""Read tokens from a file-like object, yielding each, normalized, as it is encountered.
+		
+		Results are not cast.  Where groups are defined, ``(group, token)`` pairs are yielded in order of appearance, as
+		per ``group=None``, with a group of ``None`` for tokens without a recognized prefix, as retained by ``native``
+		when grouping into a dictionary.  When sorting, all tokens are necessarily read before any are yielded.
+		"""
+		
+		tokens = self._tokens(fh, size)
+		
+		if isroutine(self.normalize):
+			tokens = (self.normalize(i) for i in tokens)
+		
+		if self.sort:
+			tokens = sorted(tokens)
+		
+		if not self.groups:
+			yield from tokens
+			return
+		
+		prefixes = [i for i in self.groups if i is not None]
+		other = self.group is dict or None in self.groups  # Whether native would retain tokens without a prefix.
+		
+		for token in tokens:
+			prefix = token[:1]
 			
-			for group in self.groups:
-				results.extend([(group, match) for match in groups[group]])
+			if prefix in prefixes:
+				yield prefix, token[1:]
+			elif other:
+				yield None, token
+	
+	def _tokens(self, fh, size):
+		"""Yield the raw tokens read in chunks from the given file-like object."""
+		
+		pattern, regex = self.pattern
+		quotes = self.quotes or ''
+		prefixes = [i for i in self.groups or () if i]
+		strip = self.strip
+		buffer = ''
+		leading = strip  # As per native, whitespace leading the content is stripped before matching.
+		
+		for chunk in self._chunks(fh, size):
+			buffer += chunk
+			position = 0
+			
+			if leading:
+				buffer = buffer.lstrip()
+				
+				if not buffer:
+					continue
+				
+				leading = False
 			
-			return self.cast(results)
+			limit = len(buffer.rstrip()) if strip else len(buffer)
+			
+			# Only matches ending short of the buffer are final: any separators and whitespace leading the remainder
+			# belong to the next token, which native would match from there; yielding them here would split it.
+			for match in regex.finditer(buffer):
+				token = match.group(1)
+				
+				if match.end() == len(buffer):  # The token, or trailing separators, may continue in the next chunk.
+					break
+				
+				if match.end(1) >= limit:  # Followed only by whitespace, which native strips if the content ends here.
+					break
+				
+				if quotes:
+					if token[:1] in prefixes:
+						token = token[1:]
+					
+					if token and token[0] in quotes and (len(token) < 2 or token[-1] != token[0]):
+						break  # An opening quote whose closing quote may be in the next chunk.
+				
+				position = match.end()
+				yield match.group(1)
+			
+			buffer = buffer[position:]
+		
+		if strip:
+			buffer = buffer.rstrip()
 		
-		return self.group([[match for match in groups[group]] for group in self.groups])
+		yield from regex.findall(buffer)
+	
+	def iterdump(self, fh, iterable, context=None):
+		"""Write tokens to a file-like object as each is produced, returning the length written.
+		
+		If grouping into a dictionary, ``(group, token)`` pairs are expected.  When sorting, all tokens are necessarily
+		collected before any are written.
+		"""
+		
+		separator = self.separators[0]
+		write = self._writer(fh)
+		length = 0
+		
+		if self.group is dict:
+			iterable = ((prefix or '') + self._sanitize(keyword) for prefix, keyword in iterable)
+		else:
+			iterable = (self._sanitize(keyword) for keyword in iterable)
+		
+		if self.sort:
+			iterable = sorted(iterable)
+		
+		for i, token in enumerate(iterable):
+			if i:
+				token = separator + token
+			
+			write(token)
+			length += len(token)
+		
+		return length
+	
+	def _sanitize(self, keyword):
+		"""Quote the given keyword if it contains a separator."""
+		
+		if not self.quotes:
+			return keyword
+		
+		for sep in self.separators:
+			if sep in keyword:
+				return self.quotes[0] + keyword + self.quotes[0]
+		
+		return keyword
 	
 	def foreign(self, value, context=None):
 		value = super().foreign(value, context)
@@ -107,15 +241,7 @@ class Token(Transform):
 		if value is None:
 			return None
 		
-		def sanatize(keyword):
-			if not self.quotes:
-				return keyword
-			
-			for sep in self.separators:
-				if sep in keyword:
-					return self.quotes[0] + keyword + self.quotes[0]
-			
-			return keyword
+		sanatize = self._sanitize
 		
 		if self.group is dict:
 			if not isinstance(value, dict):
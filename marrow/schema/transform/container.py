@@ -1,4 +1,4 @@
-from .base import Concern, Transform, Attribute
+from .base import CHUNK, Concern, Transform, Attribute
 
 
 class Array(Transform):
@@ -12,52 +12,155 @@ class Array(Transform):
 	a list) the following example applies::
 	
 		"foo,bar, baz   , , diz" -> ['foo', 'bar', 'baz', 'diz'] -> "foo,bar,baz,diz"
+	
+	The separator as used, stripped if stripping, is determined on first use and retained until either ``separator``
+	or ``strip`` is assigned to.
 	"""
 	
 	separator = Attribute(default=', ')
 	empty = Attribute(default=False)  # allow elements that appear 'empty' to be included
 	cast = Attribute(default=list)  # return native results as an instance of this, None for a lazy generator
 	
-	def _clean(self, value):
-		"""Perform a standardized pipline of operations across an iterable."""
+	def __setattr__(self, name, value):
+		if name in ('separator', 'strip'):
+			self.invalidate()
+		
+		super().__setattr__(name, value)
+	
+	def __delattr__(self, name):
+		if name in ('separator', 'strip'):
+			self.invalidate()
+		
+		super().__delattr__(name)
+	
+	def invalidate(self):
+		"""Discard the retained separator, forcing it to be determined again on next use."""
+		
+		self.__dict__.pop('_split', None)
+	
+	def _splitter(self):
+		"""Return the separator used to split foreign values, stripped if stripping, or None to split on whitespace."""
+		
+		try:
+			return self.__dict__['_split']
+		except KeyError:
+			pass
 		
-		value = (str(v) for v in value)
+		separator = self.separator
+		
+		if self.strip and hasattr(separator, 'strip'):
+			separator = separator.strip()
+		
+		self.__dict__['_split'] = separator
+		return separator
+	
+	def _clean(self, value, text=False):
+		"""Perform a standardized pipline of operations across an iterable, lazily.
+		
+		Each stage is a builtin iterator, keeping per-element work out of Python code.  Pass ``text=True`` if the
+		elements are already known to be strings, e.g. the result of splitting one.
+		"""
+		
+		if not text:
+			value = map(str, value)
 		
 		if self.strip:
-			value = (v.strip() for v in value)
+			value = map(str.strip, value)
 		
 		if not self.empty:
-			value = (v for v in value if v)
+			value = filter(None, value)
 		
 		return value
 	
 	def native(self, value, context=None):
 		"""Convert the given string into a list of substrings."""
 		
-		separator = self.separator.strip() if self.strip and hasattr(self.separator, 'strip') else self.separator
+		separator = self._splitter()
 		value = super().native(value, context)
 		
 		if value is None:
 			return self.cast()
 		
-		if hasattr(value, 'split'):
+		if isinstance(value, str):
 			value = value.split(separator)
-		
-		value = self._clean(value)
+			value = iter(value) if separator is None else self._clean(value, True)  # Whitespace splits are clean.
+		else:
+			if hasattr(value, 'split'):
+				value = value.split(separator)
+			
+			value = self._clean(value)
 		
 		try:
 			return self.cast(value) if self.cast else value
 		except Exception as e:
 			raise Concern("{0} caught, failed to perform array transform: {1}", e.__class__.__name__, str(e))
 	
+	def iterload(self, fh, context=None, size=CHUNK):
+		"""Read and transform a separated string from a file-like object, yielding elements as they are encountered.
+		
+		Equivalent to iterating the result of ``native`` without casting, but only the current chunk and any partial
+		element are retained in memory.
+		"""
+		
+		separator = self._splitter()
+		buffer = ''
+		blank = True
+		
+		for chunk in self._chunks(fh, size):
+			buffer += chunk
+			
+			if blank:
+				if not chunk.strip(): continue
+				blank = False
+			
+			parts = buffer.split(separator)
+			
+			if separator is not None or not buffer[-1].isspace():
+				buffer = parts.pop()  # The last element may continue into the next chunk.
+			else:
+				buffer = ''
+			
+			yield from self._clean(parts, True)
+		
+		if blank:  # As per native, entirely blank content is a single (possibly empty) element, unless it is None.
+			if self.strip:
+				buffer = buffer.strip()
+			
+			if self.none and buffer == '':
+				return
+		
+		yield from self._clean(buffer.split(separator), True)
+	
+	def iterdump(self, fh, iterable, context=None):
+		"""Write the elements of an iterable to a file-like object as a separated string, as each is produced.
+		
+		Returns the length written.
+		"""
+		
+		separator = self._separator()
+		write = self._writer(fh)
+		length = 0
+		
+		for i, element in enumerate(self._clean(iterable)):
+			if i:
+				element = separator + element
+			
+			write(element)
+			length += len(element)
+		
+		return length
+	
+	def _separator(self):
+		"""The separator used when constructing foreign values."""
+		
+		separator = self._splitter()
+		
+		return ' ' if separator is None else separator
+	
 	def foreign(self, value, context=None):
 		"""Construct a string-like representation for an iterable of string-like objects."""
 		
-		if self.separator is None:
-			separator = ' '
-		else:
-			separator = self.separator.strip() if self.strip and hasattr(self.separator, 'strip') else self.separator
-		
+		separator = self._separator()
 		value = self._clean(value)
 		
 		try:
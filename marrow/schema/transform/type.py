@@ -12,6 +12,9 @@ class Boolean(Transform):
 	
 	Truthy: true, t, yes, y, on, 1, literal True
 	Falsy: false, f, no, n, off, 0, literal False
+	
+	A hashed lookup table of both is built on first use and retained until either is assigned to.  Call ``invalidate``
+	after mutating an existing collection in-place.
 	"""
 	
 	use = Attribute(default=0)  # Which of the pairs to use for the "foreign" side.
@@ -32,10 +35,18 @@ class Boolean(Transform):
 		except AttributeError:
 			return bool(value)
 		
-		if value in self.truthy:
+		table = self._table()
+		
+		if table is not None:
+			result = table.get(value)
+			
+			if result is not None:
+				return result
+		
+		elif value in self.truthy:
 			return True
 		
-		if value in self.falsy:
+		elif value in self.falsy:
 			return False
 		
 		raise Concern("Unable to convert {0!r} to a boolean value.", value)
@@ -46,16 +57,54 @@ class Boolean(Transform):
 		if self.none and value is None:
 			return ''
 		
-		try:
-			value = self.native(value, context)
-		except Concern:
-			# The value might not be in the lists; bool() evaluate it instead.
-			value = bool(value.strip() if self.strip and hasattr(value, 'strip') else value)
+		if value is not True and value is not False:  # Literal booleans need no conversion.
+			try:
+				value = self.native(value, context)
+			except Concern:
+				# The value might not be in the lists; bool() evaluate it instead.
+				value = bool(value.strip() if self.strip and hasattr(value, 'strip') else value)
 		
-		if value in self.truthy or value:
+		table = self._table()
+		
+		if (table.get(value) if table is not None else value in self.truthy) or value:
 			return self.truthy[self.use]
 		
 		return self.falsy[self.use]
+	
+	def __setattr__(self, name, value):
+		if name in ('truthy', 'falsy'):
+			self.invalidate()
+		
+		super().__setattr__(name, value)
+	
+	def __delattr__(self, name):
+		if name in ('truthy', 'falsy'):
+			self.invalidate()
+		
+		super().__delattr__(name)
+	
+	def invalidate(self):
+		"""Discard any retained lookup table, forcing it to be rebuilt on next use."""
+		
+		self.__dict__.pop('_lookup', None)
+	
+	def _table(self):
+		"""Return a mapping of each truthy and falsy value to its boolean equivalent, or None if not hashable."""
+		
+		try:
+			return self.__dict__['_lookup']
+		except KeyError:
+			pass
+		
+		try:  # Truthy values take precedence, as they are tested first.
+			table = dict.fromkeys(self.falsy, False)
+			table.update(dict.fromkeys(self.truthy, True))
+		except TypeError:
+			table = None
+		
+		self.__dict__['_lookup'] = table
+		
+		return table
 
 boolean = Boolean()
 
@@ -111,5 +160,28 @@ class Number(CallbackTransform):
 			pass
 		
 		raise Concern("Unable to convert {0!r} to a number.", value)
+	
+	def _native_array(self, values, numpy):
+		"""Convert to integers if possible, otherwise floating point; NumPy arrays can not mix the two."""
+		
+		if values.ndim != 1 or values.dtype.kind not in 'USbi':  # Floating point values are truncated by ingress.
+			return None
+		
+		if values.dtype.kind not in 'US':
+			return values.astype('int64')
+		
+		values = values.tolist()
+		
+		try:
+			return numpy.fromiter(map(int, values), 'int64', len(values))
+		except OverflowError:  # Python integers have no such limit.
+			return None
+		except ValueError:
+			pass
+		
+		try:
+			return numpy.fromiter(map(float, values), 'float64', len(values))
+		except ValueError:
+			return None
 
 number = Number()
@@ -1,5 +1,11 @@
-from .base import Validator, Callback, In, Contains, Length, Range, Pattern, Instance, Subclass, Equal
-from .base import Always, always, Never, never, Unique, unique
-from .base import AlwaysTruthy, truthy, Truthy, AlwaysFalsy, falsy, Falsy
-from .base import AlwaysRequired, required, Required, AlwaysMissing, missing, Missing
-from .base import Validated
+from ..lazy import exports
+
+__all__, __getattr__, __dir__ = exports(__name__, {
+		'.base': (
+				'Validator', 'Callback', 'In', 'Contains', 'Length', 'Range', 'Pattern', 'Instance', 'Subclass', 'Equal',
+				'Always', 'always', 'Never', 'never', 'Unique', 'unique',
+				'AlwaysTruthy', 'truthy', 'Truthy', 'AlwaysFalsy', 'falsy', 'Falsy',
+				'AlwaysRequired', 'required', 'Required', 'AlwaysMissing', 'missing', 'Missing',
+				'Validated',
+			),
+	}, ('base', 'compiler', 'compound', 'date', 'geo', 'network', 'pattern', 'util'))
@@ -1,12 +1,24 @@
 """Marrow Schema base classes for data validation."""
 
-from re import compile
+import sys
+
+from time import monotonic
+from weakref import WeakSet
+from contextvars import ContextVar
+from functools import lru_cache
+from inspect import isroutine, isawaitable
 from numbers import Number
 
 from .. import Container, Attribute, CallbackAttribute
-from ..exc import Concern
+from ..exc import Concern, Failure
 from ..util import ensure_tuple
-from .util import SliceAttribute, RegexAttribute
+from .util import SliceAttribute, RegexAttribute, ChoiceIndex, linear
+from .compiler import Compiler, DYNAMIC
+
+
+MANY = 32  # The number of values from which Validator.validate_many uses a compiled validator.
+DEFERRED = ContextVar('DEFERRED', default=None)  # The records awaiting validation by an active compound.Deferred.
+MISSING = object()  # Sentinel for absent values, where None is meaningful, e.g. a retained index or record field.
 
 
 # ## Class Definitions
@@ -20,6 +32,56 @@ class Validator(Container):
 	Subclass and override the `validate` method to implement your own simple validators.
 	"""
 	
+	def __setattr__(self, name, value):
+		if '__sequence__' in self.__dict__:  # Assigned by ElementMeta once constructed; construction alters nothing.
+			self._altered()
+		
+		super().__setattr__(name, value)
+	
+	def __delattr__(self, name):
+		self._altered()
+		super().__delattr__(name)
+	
+	def __getstate__(self):
+		"""Exclude registered dependents and the compiled checker from pickling and copying; a copy retains nothing."""
+		
+		state = self.__dict__.copy()
+		state.pop('_dependents', None)
+		state.pop('_check', None)
+		return state
+	
+	def invalidate(self):
+		"""Discard the compiled checker retained by `validate_many`, forcing it to be compiled again on next use."""
+		
+		self.__dict__.pop('_check', None)
+	
+	def _retain(self, dependent):
+		"""Register a dependent having retained a compilation of this validator, to invalidate should it be altered.
+		
+		The dependent is referenced weakly, and must have an `invalidate` method.
+		"""
+		
+		try:
+			dependents = self.__dict__['_dependents']
+		except KeyError:
+			dependents = self.__dict__['_dependents'] = WeakSet()
+		
+		dependents.add(dependent)
+	
+	def _altered(self):
+		"""Invalidate any dependent registered by `_retain`, as an attribute of this validator is being assigned to."""
+		
+		self.__dict__.pop('_check', None)
+		dependents = self.__dict__.get('_dependents')
+		
+		if dependents:
+			for dependent in list(dependents):
+				dependent.invalidate()
+	
+	def _descendants(self):
+		"""Yield the child validators, and theirs, recursively, that a compilation of this validator incorporates."""
+		return ()
+	
 	def validate(self, value, context=None):
 		"""Attempt to validate the given value.
 		
@@ -29,6 +91,179 @@ class Validator(Container):
 		Context represents the current processing context, i.e. the object whose property is being inspected.
 		"""
 		return value
+	
+	def check(self, value, context=None):
+		"""Validate the given value as per `validate`, returning a `Failure` instead of raising, or None if valid.
+		
+		Any alteration of the value is discarded.  Where failures are frequent, use `compile(check=True)` to produce a
+		function doing the same that, for flattened validators, neither raises nor catches exceptions.
+		"""
+		
+		try:
+			self.validate(value, context)
+		except Concern as e:
+			return Failure.of(e)
+	
+	def compile(self, check=False):
+		"""Flatten this validator into a single function behaving identically to its `validate` method.
+		
+		Cooperative (`super()`-chained) validation across mixins and the children of compound validators are emitted
+		into one function, with attribute values bound as locals.  Callable (`CallbackAttribute`) values are still
+		evaluated on each call, but the compiled function is otherwise a snapshot: later changes to the validator are
+		not reflected.  Any `validate` implementation without a matching `_emit` is called as-is, so custom validators
+		remain correct, if not flattened.
+		
+		If `check` is truthy the result instead behaves as per the `check` method.
+		"""
+		
+		compiler = Compiler(check)
+		self._compile(compiler)
+		
+		return compiler.function(self.__class__.__qualname__)
+	
+	def _compile(self, compiler, after=None):
+		"""Emit the validation performed by the next `validate` in method resolution order following the given class.
+		
+		Called without a class, this emits the complete validation for this validator.  Within `_emit`, call with the
+		class defining it to emit the equivalent of a `super().validate` call.
+		"""
+		
+		mro = type(self).__mro__
+		
+		for cls in mro[mro.index(after) + 1 if after else 0:]:
+			if 'validate' in cls.__dict__:
+				break
+		else:
+			return
+		
+		emit = cls.__dict__.get('_emit')
+		
+		if emit is None:  # This validate implementation can not be flattened; call it directly.
+			compiler.call(super(after, self).validate if after else self.validate)
+			return
+		
+		emit(self, compiler)
+	
+	def _emit(self, compiler):
+		pass
+	
+	def validate_many(self, values, context=None, mask=False):
+		"""Validate each of many values, collecting failures rather than stopping on the first.
+		
+		Returns a dictionary mapping the index of each failing value to a `Failure` describing it or, if `mask` is
+		truthy, a list of booleans indicating which values passed.  Any alteration of the values is discarded.
+		
+		Larger batches are validated using the result of `compile(check=True)`, amortising attribute lookups.  It is
+		retained until an attribute of this validator, or of any child, is assigned to, or `invalidate` is called.
+		Given a one-dimensional NumPy array, validators (and compound validators) composed only of `Range`, `Equal`,
+		`In`, and `Instance` test all values at once; the mask is then a NumPy boolean array.
+		"""
+		
+		numpy = sys.modules.get('numpy')  # If a NumPy array was passed in, NumPy has already been imported.
+		
+		if numpy is not None and isinstance(values, numpy.ndarray) and values.ndim == 1:
+			passed = self._vectorize(values, numpy)
+			
+			if passed is not None:
+				if mask:
+					return passed
+				
+				failures = ((int(i), self.check(values[i], context)) for i in numpy.flatnonzero(~passed))
+				return {i: failure for i, failure in failures if failure is not None}
+		
+		check = self.check if hasattr(values, '__len__') and len(values) < MANY else self._checker()
+		failures = {}
+		count = 0
+		
+		for count, value in enumerate(values, 1):
+			failure = check(value, context)
+			
+			if failure is not None:
+				failures[count - 1] = failure
+		
+		if mask:
+			return [i not in failures for i in range(count)]
+		
+		return failures
+	
+	def _checker(self):
+		"""Return the result of `compile(check=True)`, compiling it on first use, registering to be invalidated."""
+		
+		try:
+			return self.__dict__['_check']
+		except KeyError:
+			pass
+		
+		check = self.__dict__['_check'] = self.compile(True)
+		
+		for validator in self._descendants():
+			validator._retain(self)
+		
+		return check
+	
+	def _vectorize(self, values, numpy, after=None):
+		"""Test a NumPy array of values, returning a boolean array of those passing or None if not possible.
+		
+		As per `_compile`, mirroring `validate` using the `_vector` method of each class, if defined.
+		"""
+		
+		mro = type(self).__mro__
+		
+		for cls in mro[mro.index(after) + 1 if after else 0:]:
+			if 'validate' in cls.__dict__:
+				break
+		else:
+			return numpy.ones(len(values), dtype=bool)
+		
+		vector = cls.__dict__.get('_vector')
+		
+		if vector is None:
+			return None
+		
+		return vector(self, values, numpy)
+	
+	def _vector(self, values, numpy):
+		return numpy.ones(len(values), dtype=bool)
+	
+	async def avalidate(self, value, context=None):
+		"""Asynchronously validate the given value, as per `validate`, for use within an asyncio event loop.
+		
+		Callbacks and choices which are coroutine functions are awaited, and compound validators await their children,
+		concurrently where the result is unaffected.  Any `validate` implementation without a matching `_avalidate` is
+		called as-is, so synchronous validators, including custom ones, may be awaited all the same.
+		"""
+		
+		return await self._await(value, context)
+	
+	async def _await(self, value, context, after=None):
+		"""Perform the validation of the next `validate` in method resolution order following the given class.
+		
+		As per `_compile`: within `_avalidate`, call with the class defining it to await the equivalent of a
+		`super().validate` call.
+		"""
+		
+		validate, avalidate = _following(type(self), after)
+		
+		if avalidate is not None:
+			return await avalidate(self, value, context)
+		
+		if validate is None:
+			return value
+		
+		return validate(self, value, context)  # This validate implementation is synchronous; call it directly.
+
+
+@lru_cache(maxsize=256)
+def _following(cls, after):
+	"""Find the next `validate` of the given class following another in method resolution order, and its `_avalidate`."""
+	
+	mro = cls.__mro__
+	
+	for owner in mro[mro.index(after) + 1 if after else 0:]:
+		if 'validate' in owner.__dict__:
+			return owner.__dict__['validate'], owner.__dict__.get('_avalidate')
+	
+	return None, None
 
 
 class Always(Validator):
@@ -40,6 +275,12 @@ class Always(Validator):
 	"""
 	def validate(self, value=None, context=None):
 		return value
+	
+	def _emit(self, compiler):
+		pass
+	
+	def _vector(self, values, numpy):
+		return numpy.ones(len(values), dtype=bool)
 
 always = Always()
 
@@ -51,6 +292,12 @@ class Never(Validator):
 	"""
 	def validate(self, value=None, context=None):
 		raise Concern("Set to always fail.")
+	
+	def _emit(self, compiler):
+		compiler.emit(compiler.fail("Set to always fail."))
+	
+	def _vector(self, values, numpy):
+		return numpy.zeros(len(values), dtype=bool)
 
 never = Never()
 
@@ -65,6 +312,13 @@ class AlwaysTruthy(Validator):
 			raise Concern("Value is missing or empty.")
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, AlwaysTruthy)
+		compiler.emit(
+				'if not bool(value):',
+				'\t' + compiler.fail("Value is missing or empty."),
+			)
 
 truthy = AlwaysTruthy()
 
@@ -78,6 +332,12 @@ class Truthy(AlwaysTruthy):
 		from functools import partial
 		instance = super().validate if self.truthy else partial(AlwaysTruthy.validate, self)
 		return instance(value, context)
+	
+	def _emit(self, compiler):
+		if self.truthy:
+			self._compile(compiler, Truthy)
+		else:
+			AlwaysTruthy._emit(self, compiler)
 
 
 class AlwaysFalsy(Validator):
@@ -90,6 +350,13 @@ class AlwaysFalsy(Validator):
 			raise Concern("Value should be falsy.")
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, AlwaysFalsy)
+		compiler.emit(
+				'if bool(value):',
+				'\t' + compiler.fail("Value should be falsy."),
+			)
 
 falsy = AlwaysFalsy()
 
@@ -102,6 +369,9 @@ class Falsy(AlwaysFalsy):
 	def validate(self, value, context=None):
 		instance = super(Falsy, self) if self.falsy else super(AlwaysFalsy, self)
 		return instance.validate(value, context)
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Falsy if self.falsy else AlwaysFalsy)
 
 
 class AlwaysRequired(Validator):
@@ -117,6 +387,15 @@ class AlwaysRequired(Validator):
 			raise Concern("Value is required, but provided value is empty.")
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, AlwaysRequired)
+		compiler.emit(
+				'if value is None:',
+				'\t' + compiler.fail("Value is required, but none was provided."),
+				'if hasattr(value, \'__len__\') and not len(value):',
+				'\t' + compiler.fail("Value is required, but provided value is empty."),
+			)
 
 required = AlwaysRequired()
 
@@ -129,6 +408,9 @@ class Required(AlwaysRequired):
 	def validate(self, value, context=None):
 		instance = super(Required, self) if self.required else super(AlwaysRequired, self)
 		return instance.validate(value, context)
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Required if self.required else AlwaysRequired)
 
 
 class AlwaysMissing(Validator):
@@ -141,6 +423,13 @@ class AlwaysMissing(Validator):
 			raise Concern("Value must be omitted, but value was provided.")
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, AlwaysMissing)
+		compiler.emit(
+				'if value is not None and (not hasattr(value, \'__len__\') or len(value)):',
+				'\t' + compiler.fail("Value must be omitted, but value was provided."),
+			)
 
 missing = AlwaysMissing()
 
@@ -153,6 +442,9 @@ class Missing(AlwaysMissing):
 	def validate(self, value, context=None):
 		instance = super(Missing, self) if self.missing else super(AlwaysMissing, self)
 		return instance.validate(value, context)
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Missing if self.missing else AlwaysMissing)
 
 
 class Callback(Validator):
@@ -185,6 +477,37 @@ class Callback(Validator):
 			raise result
 		
 		return result
+	
+	async def _avalidate(self, value, context):
+		value = await self._await(value, context, Callback)
+		
+		if not self.validator:
+			return value
+		
+		result = self.validator(self, value, context)
+		
+		if isawaitable(result):
+			result = await result
+		
+		if isinstance(result, Concern):
+			raise result
+		
+		return result
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Callback)
+		
+		if not self.validator:
+			return
+		
+		callback = compiler.bind(self.validator, 'callback')
+		instance = compiler.bind(self, 'instance')
+		
+		compiler.guard('value = {0}({1}, value, context)'.format(callback, instance))
+		compiler.emit(
+				'if isinstance(value, Concern):',
+				'\t' + compiler.reraise('value'),
+			)
 
 
 class In(Validator):
@@ -193,22 +516,130 @@ class In(Validator):
 	The choice selection may be a callback, however note that the callback is passed no arguments.
 	
 	The iterable may be either a collection of single values, or a collection of 2-tuples indicating value and label.
+	
+	A hashed index of the choices is built on first use and retained until a different collection of choices is
+	assigned.  Call ``invalidate`` after mutating the existing collection in-place.  The index of choices produced by a
+	callback is only retained for ``ttl`` seconds: the default of zero calls the callback on every use, and ``None``
+	retains the index until explicitly invalidated.
 	"""
 	
 	choices = CallbackAttribute(default=None)
+	ttl = Attribute(default=0)  # Seconds to retain the index of callback-produced choices; None for indefinitely.
 	
 	def validate(self, value, context=None):
 		value = super().validate(value, context)
 		
-		choices = self.choices
+		index = self._index()
+		
+		if index is not None and value not in index:
+			raise Concern("Value is not in allowed list.")
+		
+		return value
+	
+	def invalidate(self):
+		"""Discard any retained index of the choices, forcing it to be rebuilt on next use."""
+		
+		super().invalidate()
+		self.__dict__.pop('_cache', None)
+	
+	def _index(self):
+		"""Return the membership index of the current choices, or None if unrestricted."""
+		
+		source, index = self._retained()
+		
+		if index is not MISSING:
+			return index
+		
+		return self._build(source, source() if isroutine(source) else source)
+	
+	async def _aindex(self):
+		"""As per `_index`, awaiting the choices if produced by a coroutine function."""
+		
+		source, index = self._retained()
+		
+		if index is not MISSING:
+			return index
+		
+		choices = source() if isroutine(source) else source
+		
+		if isawaitable(choices):
+			choices = await choices
+		
+		return self._build(source, choices)
+	
+	def _retained(self):
+		"""Return the current choices (or callback producing them) and their retained index, if still valid."""
+		
+		descriptor = self.__attributes__.get('choices')
+		source = Attribute.__get__(descriptor, self) if isinstance(descriptor, CallbackAttribute) else self.choices
+		
+		try:
+			cached, index, expires = self._cache
+		except AttributeError:
+			pass
+		else:
+			if cached is source and (expires is None or expires > monotonic()):
+				return source, index
+		
+		return source, MISSING
+	
+	def _build(self, source, choices):
+		"""Build, and retain if appropriate, the membership index of the given choices, produced from the source."""
+		
+		dynamic = isroutine(source)
 		
 		if not choices:
-			return value
+			index = None
+		elif dynamic and self.ttl == 0:  # Not retained; a linear scan is cheaper than building an index to discard.
+			return tuple(value for value, in ensure_tuple(1, choices))
+		else:
+			index = ChoiceIndex(choices)
+		
+		expires = monotonic() + self.ttl if dynamic and self.ttl is not None else None
+		self.__dict__['_cache'] = (source, index, expires)  # Directly, as retaining the index alters nothing.
+		
+		return index
+	
+	async def _avalidate(self, value, context):
+		value = await self._await(value, context, In)
 		
-		if (value, ) not in ensure_tuple(1, choices):
+		index = await self._aindex()
+		
+		if index is not None and value not in index:
 			raise Concern("Value is not in allowed list.")
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, In)
+		
+		index = compiler.name('index')
+		
+		compiler.emit(
+				'{0} = {1}()'.format(index, compiler.bind(self._index, 'index')),
+				'if {0} is not None and value not in {0}:'.format(index),
+				'\t' + compiler.fail("Value is not in allowed list."),
+			)
+	
+	def _vector(self, values, numpy):
+		passed = self._vectorize(values, numpy, In)
+		index = self._index()
+		
+		if passed is None or index is None:
+			return passed
+		
+		choices = index.values if isinstance(index, ChoiceIndex) else index
+		kind = values.dtype.kind
+		
+		# Only homogeneous numeric or textual choices and values compare identically in NumPy and Python.
+		if kind in 'biuf' and all(type(choice) in (bool, int, float) for choice in choices):
+			pass
+		elif kind == 'U' and all(type(choice) is str for choice in choices):
+			pass
+		else:
+			return None
+		
+		return passed & numpy.isin(values, numpy.array(choices))
 
 
 class Contains(Validator):
@@ -229,6 +660,19 @@ class Contains(Validator):
 			raise Concern("Value does not contain: {0}", other)
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Contains)
+		
+		try:
+			other, static = compiler.load(self, 'contains')
+		except AttributeError:
+			return
+		
+		compiler.emit(
+				'if {0} not in value:'.format(other),
+				'\t' + compiler.fail("Value does not contain: {0}", other),
+			)
 
 
 class Length(Validator):
@@ -259,6 +703,26 @@ class Length(Validator):
 			raise Concern("Length out of bounds; must be between {0} and {1} long.", length.start, length.stop)
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Length)
+		length, static = compiler.load(self, 'length')
+		
+		if static is None:
+			return
+		
+		ln = compiler.name('ln')
+		guard = '{0} is not None and '.format(length) if static is DYNAMIC else ''
+		
+		compiler.emit(
+				'{0} = len(value) if hasattr(value, \'__len__\') else None'.format(ln),
+				'if {0}{1} is None:'.format(guard, ln),
+				'\t' + compiler.fail("Value can't be measured; must be between {0} and {1} long.", length + '.start',
+						length + '.stop'),
+				'elif {0}{1} not in range(*{2}.indices({1} + 1)):'.format(guard, ln, length),
+				'\t' + compiler.fail("Length out of bounds; must be between {0} and {1} long.", length + '.start',
+						length + '.stop'),
+			)
 
 
 class Range(Validator):
@@ -284,26 +748,120 @@ class Range(Validator):
 			raise Concern("Too small; must be greater than {0}.", minimum)
 		
 		elif maximum and value > maximum:
-			raise Concern("Too large; must be less than {1}.", maximum)
+			raise Concern("Too large; must be less than {0}.", maximum)
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Range)
+		minimum, low = compiler.load(self, 'minimum')
+		maximum, high = compiler.load(self, 'maximum')
+		
+		if low is None and high is None:
+			return
+		
+		compiler.emit(
+				'if {0} and {1} and not ({0} <= value <= {1}):'.format(minimum, maximum),
+				'\t' + compiler.fail("Out of bounds; must be greater than {0} and less than {1}.", minimum, maximum),
+				'elif {0} and value < {0}:'.format(minimum),
+				'\t' + compiler.fail("Too small; must be greater than {0}.", minimum),
+				'elif {0} and value > {0}:'.format(maximum),
+				'\t' + compiler.fail("Too large; must be less than {0}.", maximum),
+			)
+	
+	def _vector(self, values, numpy):
+		passed = self._vectorize(values, numpy, Range)
+		
+		if passed is None or values.dtype.kind not in 'biufmM':  # Only numeric and temporal values.
+			return None
+		
+		minimum = self.minimum
+		maximum = self.maximum
+		
+		try:  # Comparisons are ordered as per validate, so that NaN is treated identically.
+			if minimum and maximum:
+				passed &= (minimum <= values) & (values <= maximum)
+			elif minimum:
+				passed &= ~(values < minimum)
+			elif maximum:
+				passed &= ~(values > maximum)
+		except TypeError:
+			return None
+		
+		return passed
 
 
 class Pattern(Validator):
-	"""Match a regular expression."""
+	"""Match a regular expression.
+	
+	Untrusted input may be guarded against expressions prone to excessive backtracking by giving a `limit` on the
+	length of values to match, rejecting longer values outright, and by matching in `linear` time using RE2 if the
+	`google-re2` package is installed and able to express the pattern; see `marrow.schema.validate.util:linear`.
+	"""
 	
 	pattern = RegexAttribute(default=None)
+	limit = Attribute(default=None)
+	linear = Attribute(default=False)
 	
 	def validate(self, value, context=None):
 		value = super().validate(value, context)
+		pattern = self.pattern
 		
-		if not self.pattern or value is None:
+		if not pattern or value is None:
 			return value
 		
-		if not self.pattern.match(value):
+		if self.limit is not None and len(value) > self.limit:
+			raise Concern("Value exceeds the maximum length of {0} to match.", self.limit)
+		
+		if self.linear:
+			pattern = linear(pattern)
+		
+		if not pattern.match(value):
 			raise Concern("Failed to match required pattern.")
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Pattern)
+		pattern, static = compiler.load(self, 'pattern')
+		
+		if not static and static is not DYNAMIC:
+			return
+		
+		if self.limit is not None:
+			limit = compiler.bind(self.limit, 'limit')
+			compiler.emit(
+					'if {0}value is not None and len(value) > {1}:'.format(
+							pattern + ' and ' if static is DYNAMIC else '', limit),
+					'\t' + compiler.fail("Value exceeds the maximum length of {0} to match.", limit),
+				)
+		
+		if static is not DYNAMIC:  # Bind the match method itself, sparing an attribute lookup per call.
+			compiler.bindings[pattern] = (linear(static) if self.linear else static).match
+			compiler.emit('if value is not None and not {0}(value):'.format(pattern))
+		else:
+			if self.linear:
+				compiler.emit('{0} = {1}({0})'.format(pattern, compiler.bind(linear, 'linear')))
+			
+			compiler.emit('if {0} and value is not None and not {0}.match(value):'.format(pattern))
+		
+		compiler.emit('\t' + compiler.fail("Failed to match required pattern."))
+	
+	def _expression(self):
+		"""Return the regex to which validation by this instance reduces, or None if validation entails anything more.
+		
+		Used to combine the expressions of several validators; see `marrow.schema.validate.compound:AnyPattern`.
+		Subclasses overriding `validate` must also override this method to remain eligible.
+		"""
+		
+		for cls in type(self).__mro__:
+			if cls is not Validator and 'validate' in cls.__dict__ and '_expression' not in cls.__dict__:
+				return None
+		
+		if self.limit is not None or self.linear:
+			return None
+		
+		return self.pattern or None
 
 
 class Instance(Validator):
@@ -318,6 +876,31 @@ class Instance(Validator):
 			raise Concern("Value is not an instance of {0!r}.", self.instance)
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Instance)
+		
+		if not self.instance:
+			return
+		
+		instance = compiler.bind(self.instance, 'instance')
+		
+		compiler.emit(
+				'if not isinstance(value, {0}):'.format(instance),
+				'\t' + compiler.fail("Value is not an instance of {0!r}.", instance),
+			)
+	
+	def _vector(self, values, numpy):
+		passed = self._vectorize(values, numpy, Instance)
+		
+		if passed is None or values.dtype.kind == 'O':  # Object arrays may contain values of any type.
+			return None
+		
+		# Every element of a typed array is an instance of the same scalar type.
+		if self.instance and not issubclass(values.dtype.type, self.instance):
+			passed[:] = False
+		
+		return passed
 
 
 class Subclass(Validator):
@@ -332,6 +915,19 @@ class Subclass(Validator):
 			raise Concern("Value is not a subclass of {0!r}.", self.subclass)
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Subclass)
+		
+		if not self.subclass:
+			return
+		
+		subclass = compiler.bind(self.subclass, 'subclass')
+		
+		compiler.emit(
+				'if not issubclass(value, {0}):'.format(subclass),
+				'\t' + compiler.fail("Value is not a subclass of {0!r}.", subclass),
+			)
 
 
 class Equal(Validator):
@@ -355,6 +951,35 @@ class Equal(Validator):
 			raise Concern("Value does not equal: {0}", other)
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Equal)
+		
+		try:
+			other, static = compiler.load(self, 'equals')
+		except AttributeError:
+			return
+		
+		compiler.emit(
+				'if value != {0}:'.format(other),
+				'\t' + compiler.fail("Value does not equal: {0}", other),
+			)
+	
+	def _vector(self, values, numpy):
+		passed = self._vectorize(values, numpy, Equal)
+		
+		try:
+			other = self.equals
+		except AttributeError:
+			return passed
+		
+		if passed is None or values.dtype.kind not in 'biufU' or not isinstance(other, (bool, int, float, str)):
+			return None
+		
+		try:
+			return passed & ~(values != other)
+		except TypeError:
+			return None
 
 
 class Unique(Validator):
@@ -372,6 +997,16 @@ class Unique(Validator):
 			raise Concern("Not all values are unique.")
 		
 		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Unique)
+		unique = compiler.name('unique')
+		
+		compiler.emit(
+				'{0} = value.values() if hasattr(value, \'values\') else value'.format(unique),
+				'if not len({0}) == len(set({0})):'.format(unique),
+				'\t' + compiler.fail("Not all values are unique."),
+			)
 
 unique = Unique()
 
@@ -379,7 +1014,8 @@ unique = Unique()
 class Validated(Attribute):
 	"""A small attribute helper to validate values as they are assigned.
 	
-	Primarily used as a mixin, i.e. to provide validation in addition to typecasting.
+	Primarily used as a mixin, i.e. to provide validation in addition to typecasting.  Within a `with` block using
+	`marrow.schema.validate.compound:Deferred`, the object is instead recorded for later validation.
 	"""
 	
 	validator = CallbackAttribute(default=always)
@@ -387,7 +1023,13 @@ class Validated(Attribute):
 	def __set__(self, obj, value):
 		"""Executed when assigning a value to a Validated instance attribute."""
 		
-		self.validator.validate(value, obj)
+		pending = DEFERRED.get()
+		
+		if pending is None:
+			self.validator.validate(value, obj)
+		else:
+			pending[id(obj)] = obj
+		
 		
 		# Store the (validated) value in the warehouse.
 		super().__set__(obj, value)
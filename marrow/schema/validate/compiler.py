@@ -0,0 +1,146 @@
+"""Flattening of validator trees into single Python functions.
+
+Used by `Validator.compile`; see that method for details.
+"""
+
+from inspect import isroutine
+from contextlib import contextmanager
+
+from ..declarative import Attribute, CallbackAttribute
+from ..exc import Concern, Failure
+
+
+DYNAMIC = object()  # Marker returned by Compiler.load for attribute values that are re-evaluated on each call.
+
+
+class Compiler:
+	"""Accumulate the source lines and bound values of a function while walking a validator tree.
+	
+	Validator classes participate by defining an `_emit` method (looked up on each class individually, not inherited)
+	mirroring their `validate` method.  Emitted code operates on the `value` and `context` locals, replaces `value` with
+	any altered version, and signals failure using the statement produced by `fail`; it must not otherwise return.
+	
+	If `check` is truthy the function produced returns a `Failure` instead of raising, or None if the value is valid.
+	"""
+	
+	def __init__(self, check=False):
+		self.lines = []
+		self.bindings = dict(Concern=Concern, Failure=Failure)
+		self.depth = 1
+		self.counter = 0
+		self.check = check
+	
+	def name(self, hint='v'):
+		"""Produce a new unique local variable name."""
+		
+		self.counter += 1
+		return '_{0}{1}'.format(hint.strip('_'), self.counter)
+	
+	def bind(self, value, hint='v'):
+		"""Make the given value available to the generated function as a local, returning the local name."""
+		
+		name = self.name(hint)
+		self.bindings[name] = value
+		return name
+	
+	def load(self, validator, attribute):
+		"""Emit retrieval of the named attribute of a validator, returning the local name holding it and its value.
+		
+		Callback attributes whose value is a routine are called on every invocation, as they would be by `validate`; in
+		this case the value returned is `DYNAMIC`.  Raises AttributeError if the attribute has no value.
+		"""
+		
+		descriptor = validator.__attributes__.get(attribute)
+		
+		if not isinstance(descriptor, CallbackAttribute):
+			value = getattr(validator, attribute)
+			return self.bind(value, attribute), value
+		
+		value = Attribute.__get__(descriptor, validator, type(validator))  # Retrieve the callback itself, uncalled.
+		
+		if not isroutine(value):
+			value = descriptor.__get__(validator, type(validator))  # Permit any processing of plain values on access.
+			return self.bind(value, attribute), value
+		
+		name = self.name(attribute)
+		self.emit('{0} = {1}()'.format(name, self.bind(value, attribute)))
+		
+		return name, DYNAMIC
+	
+	def emit(self, *lines):
+		"""Add lines of source at the current indentation."""
+		
+		self.lines.extend('\t' * self.depth + line for line in lines)
+	
+	@contextmanager
+	def indent(self):
+		"""Increase the indentation of lines emitted within the context."""
+		
+		self.depth += 1
+		
+		try:
+			yield
+		finally:
+			self.depth -= 1
+	
+	def fail(self, message, *args, concerns=None):
+		"""Produce the statement signalling failure with the given message, argument local names, and nested concerns.
+		
+		This raises a Concern or, if checking, returns a Failure; failures with no arguments are allocated only once.
+		"""
+		
+		arguments = ''.join(', ' + arg for arg in args) + (', concerns=' + concerns if concerns else '')
+		
+		if not self.check:
+			return 'raise Concern({0!r}{1})'.format(message, arguments)
+		
+		if not arguments:
+			return 'return ' + self.bind(Failure(message), 'failure')
+		
+		return 'return Failure({0!r}{1})'.format(message, arguments)
+	
+	def reraise(self, concern):
+		"""Produce the statement signalling failure with the Concern instance held by the given local name."""
+		
+		if not self.check:
+			return 'raise ' + concern
+		
+		return 'return Failure.of({0})'.format(concern)
+	
+	def guard(self, *lines):
+		"""Emit lines of source which may raise a Concern, e.g. by calling out to other code."""
+		
+		if not self.check:
+			self.emit(*lines)
+			return
+		
+		e = self.name('e')
+		
+		self.emit('try:')
+		self.emit(*('\t' + line for line in lines))
+		self.emit('except Concern as {0}:'.format(e), '\t' + self.reraise(e))
+	
+	def call(self, validate):
+		"""Emit a call to an uncompilable validation routine, such as a bound `validate` method."""
+		
+		self.guard('value = {0}(value, context)'.format(self.bind(validate, 'validate')))
+	
+	def function(self, label='validator'):
+		"""Produce the compiled function from the emitted source, labelled for tracebacks and introspection."""
+		
+		parameters = ''.join(', {0}={0}'.format(binding) for binding in self.bindings)
+		
+		source = '\n'.join([
+				'def validate(value, context=None, *{0}):'.format(parameters),
+			] + self.lines + [
+				'\treturn None' if self.check else '\treturn value',
+			])
+		
+		namespace = dict(self.bindings)
+		exec(compile(source, '<compiled {0}>'.format(label), 'exec'), namespace)
+		
+		fn = namespace['validate']
+		fn.__qualname__ = label + '.validate'
+		fn.__source__ = source
+		
+		return fn
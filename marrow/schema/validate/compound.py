@@ -1,11 +1,18 @@
 import sys
 import copy
 
+from re import A, I, M, S, U, Pattern as Regex, compile, error
+from functools import lru_cache
+from itertools import islice
 from collections.abc import Sequence as ISequence, Mapping as IMapping, Iterable as IIterable
 from numbers import Number
 
-from .. import Attribute, Attributes
-from .base import Concern, Validator
+from .. import Attribute, Attributes, Container
+from .base import MANY, MISSING, DEFERRED, Concern, Failure, Pattern, Validator, Validated
+
+
+SCOPED = ((A, 'a'), (I, 'i'), (M, 'm'), (S, 's'))  # Flags which may be applied to a portion of an expression.
+NUMBERED = compile(r'\\[1-9]|\(\?\(\d')  # References to groups by number, which combination would renumber.
 
 
 # ## Class Definitions
@@ -30,6 +37,11 @@ class Compound(Validator):
 		if self.validators:
 			for validator in self.validators:
 				yield validator
+	
+	def _descendants(self):
+		for child in self._validators:
+			yield child
+			yield from child._descendants()
 
 
 class Any(Compound):
@@ -46,6 +58,191 @@ class Any(Compound):
 				failures.append(e)
 		
 		raise Concern("All validators failed.", concerns=failures)
+	
+	async def _avalidate(self, value, context):
+		from asyncio import ensure_future  # Already imported, as an event loop is running.
+		
+		value = await self._await(value, context, Any)
+		pending = [ensure_future(validator.avalidate(value, context)) for validator in self._validators]
+		failures = []
+		
+		try:  # All children are evaluated concurrently; the first to succeed, in order, wins.
+			for task in pending:
+				try:
+					return await task
+				except Concern as e:
+					failures.append(e)
+		
+		finally:
+			for task in pending:
+				if not task.cancel() and not task.cancelled():
+					task.exception()  # Retrieve the outcome of any not awaited, sparing warnings about them.
+		
+		raise Concern("All validators failed.", concerns=failures)
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Any)
+		
+		validators = compiler.bind(tuple(validator.compile() for validator in self._validators), 'validators')
+		failures, validate, e = compiler.name('failures'), compiler.name('validate'), compiler.name('e')
+		
+		compiler.emit(
+				'{0} = []'.format(failures),
+				'for {0} in {1}:'.format(validate, validators),
+				'\ttry:',
+				'\t\tvalue = {0}(value, context)'.format(validate),
+				'\t\tbreak',
+				'\texcept Concern as {0}:'.format(e),
+				'\t\t{0}.append({1})'.format(failures, e),
+				'else:',
+				'\t' + compiler.fail("All validators failed.", concerns=failures),
+			)
+	
+	def _vector(self, values, numpy):
+		passed = self._vectorize(values, numpy, Any)
+		matched = numpy.zeros(len(values), dtype=bool)
+		
+		for validator in self._validators:
+			if passed is None:
+				break
+			
+			child = validator._vectorize(values, numpy)
+			
+			if child is None:
+				return None
+			
+			matched |= child
+		
+		return None if passed is None else passed & matched
+
+
+class AnyPattern(Any):
+	"""Evaluate multiple Pattern validators, stopping on the first match, using a single combined regular expression.
+	
+	The expressions of the children are combined into one alternation, tried in order, so that any number of patterns
+	cost a single scan; `matching` reports which child matched.  Only on failure are the children evaluated in turn,
+	so that, as per `Any`, the Concern raised includes the Concern of each child.
+	
+	Children which can not be combined, such as those with backreferences or validating more than their pattern,
+	result in evaluation as per `Any`.  The combination is built on first use and retained until the validators are
+	assigned to; call `invalidate` after altering them in-place.
+	"""
+	
+	def __setattr__(self, name, value):
+		if name == 'validators':
+			self.invalidate()
+		
+		super().__setattr__(name, value)
+	
+	def __delattr__(self, name):
+		if name == 'validators':
+			self.invalidate()
+		
+		super().__delattr__(name)
+	
+	def invalidate(self):
+		"""Discard any retained combined expression, forcing it to be rebuilt on next use."""
+		
+		super().invalidate()
+		self.__dict__.pop('_combined', None)
+	
+	def _alternation(self):
+		"""Return the combined regex and the tuple of children by branch, or None if the children can't be combined."""
+		
+		try:
+			return self.__dict__['_combined']
+		except KeyError:
+			pass
+		
+		children = tuple(self._validators)
+		branches = []
+		combined = None
+		
+		for i, child in enumerate(children):
+			regex = child._expression() if isinstance(child, Pattern) else None
+			
+			if not isinstance(regex, Regex) or not isinstance(regex.pattern, str) or NUMBERED.search(regex.pattern):
+				break
+			
+			if regex.flags & ~(A | I | M | S | U):  # Verbose, locale, and debug modes apply only globally.
+				break
+			
+			flags = ''.join(flag for mask, flag in SCOPED if regex.flags & mask)
+			branches.append('(?P<_{0}>(?{1}:{2}))'.format(i, flags, regex.pattern) if flags else
+					'(?P<_{0}>{1})'.format(i, regex.pattern))
+		
+		else:
+			try:
+				combined = (compile('|'.join(branches)), children) if children else None
+			except error:  # E.g. duplicated group names, or global flags within an expression.
+				pass
+		
+		self.__dict__['_combined'] = combined
+		return combined
+	
+	def matching(self, value, context=None):
+		"""Return the first child validator accepting the given value, or None if none do."""
+		
+		alternation = self._alternation()
+		
+		if alternation is None:
+			for validator in self._validators:
+				if validator.check(value, context) is None:
+					return validator
+			
+			return None
+		
+		regex, children = alternation
+		
+		if value is None:  # Accepted, without matching, by every Pattern.
+			return children[0]
+		
+		match = regex.match(value)
+		
+		return children[int(match.lastgroup[1:])] if match else None
+	
+	def validate(self, value, context=None):
+		alternation = self._alternation()
+		
+		if alternation is None:
+			return super().validate(value, context)
+		
+		value = super(Any, self).validate(value, context)
+		
+		if value is not None and not alternation[0].match(value):
+			raise Concern("All validators failed.", concerns=self._failures(value, context))
+		
+		return value
+	
+	def _failures(self, value, context):
+		"""Gather the Concern of each child failing to validate the given value, once the combination fails to match."""
+		
+		failures = []
+		
+		for validator in self._validators:
+			try:
+				validator.validate(value, context)
+			except Concern as e:
+				failures.append(e)
+		
+		return failures
+	
+	def _emit(self, compiler):
+		alternation = self._alternation()
+		
+		if alternation is None:
+			self._compile(compiler, AnyPattern)
+			return
+		
+		self._compile(compiler, Any)
+		match = compiler.bind(alternation[0].match, 'match')
+		gather, failures = compiler.bind(self._failures, 'gather'), compiler.name('failures')
+		
+		compiler.emit(
+				'if value is not None and not {0}(value):'.format(match),
+				'\t{0} = {1}(value, context)'.format(failures, gather),
+				'\t' + compiler.fail("All validators failed.", concerns=failures),
+			)
 
 
 class All(Compound):
@@ -58,6 +255,32 @@ class All(Compound):
 			value = validator.validate(value, context)
 		
 		return value
+	
+	async def _avalidate(self, value, context):
+		value = await self._await(value, context, All)
+		
+		for validator in self._validators:  # Sequentially, as each is given the value produced by the last.
+			value = await validator.avalidate(value, context)
+		
+		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, All)
+		
+		for validator in self._validators:
+			validator._compile(compiler)
+	
+	def _vector(self, values, numpy):
+		passed = self._vectorize(values, numpy, All)
+		
+		for validator in self._validators:
+			if passed is None:
+				break
+			
+			child = validator._vectorize(values, numpy)
+			passed = None if child is None else passed & child
+		
+		return passed
 
 
 class Pipe(Compound):
@@ -77,62 +300,454 @@ class Pipe(Compound):
 			raise Concern("One or more validators failed.", concerns=failures)
 		
 		return value
+	
+	async def _avalidate(self, value, context):
+		value = await self._await(value, context, Pipe)
+		failures = []
+		
+		for validator in self._validators:  # Sequentially, as each is given the value produced by the last.
+			try:
+				value = await validator.avalidate(value, context)
+			except Concern as e:
+				failures.append(e)
+		
+		if failures:
+			raise Concern("One or more validators failed.", concerns=failures)
+		
+		return value
+	
+	def _emit(self, compiler):
+		self._compile(compiler, Pipe)
+		
+		validators = compiler.bind(tuple(validator.compile() for validator in self._validators), 'validators')
+		failures, validate, e = compiler.name('failures'), compiler.name('validate'), compiler.name('e')
+		
+		compiler.emit(
+				'{0} = []'.format(failures),
+				'for {0} in {1}:'.format(validate, validators),
+				'\ttry:',
+				'\t\tvalue = {0}(value, context)'.format(validate),
+				'\texcept Concern as {0}:'.format(e),
+				'\t\t{0}.append({1})'.format(failures, e),
+				'if {0}:'.format(failures),
+				'\t' + compiler.fail("One or more validators failed.", concerns=failures),
+			)
+	
+	def _vector(self, values, numpy):
+		passed = self._vectorize(values, numpy, Pipe)
+		
+		for validator in self._validators:
+			if passed is None:
+				break
+			
+			child = validator._vectorize(values, numpy)
+			passed = None if child is None else passed & child
+		
+		return passed
 
 
-class Iterable(Compound):
-	"""Validate that the value is iterable and that the values optionally conform to a schema.
+def _concerns(validate, elements, context, limit=None):
+	"""Validate the given (key, element) pairs, returning the concerns of those failing, up to an optional limit.
 	
-	Will attempt to iterate nearly anything.
+	A module-level function so that chunks of a collection may be validated by a process pool.
+	"""
+	
+	concerns = []
+	
+	for key, element in elements:
+		try:
+			validate(element, context)
+		except Concern as e:
+			e._element(key)
+			concerns.append(e)
+			
+			if limit and len(concerns) >= limit:
+				break
+	
+	return concerns
+
+
+def _raise(concerns):
+	"""Raise the given concerns about elements, if any, individually or as one."""
+	
+	if len(concerns) == 1:
+		raise concerns[0]
+	elif concerns:
+		raise Concern(max(i.level for i in concerns), "Multiple validation concerns.", concerns=concerns)
+
+
+def _compiled_concerns(scheme, elements, context, limit=None):
+	"""As per `_concerns`, for a chunk sent to another process, compiling the base scheme there."""
+	return _concerns(scheme.compile(), elements, context, limit)
+
+
+class Collection(Compound):
+	"""Validate each element of a collection using the base scheme defined by `require`.
+	
+	Do not use this validator directly; use one of its subclasses instead.
+	
+	The base scheme, i.e. `require` given the child validators, is constructed on first use and, once a number of
+	elements have been validated (in one call, or over several), compiled.  Either is retained until `require` or
+	`validators` is assigned to, or an attribute of any validator within the scheme (a child, or one of theirs) is;
+	the children notify the collections retaining them.  Call `invalidate` after altering a collection of child
+	validators in-place, e.g. by appending to `validators`.  Failures identify the element concerned both in their
+	message and as the leading key of their `path`.  Validation stops once `max_concerns` failures have been found,
+	if given.
+	
+	Given a `concurrent.futures` executor, collections of at least `threshold` elements are validated in chunks of
+	`chunksize` elements across it, with concerns reported in element order.  For a process pool, the child
+	validators, elements, keys, and context must be picklable; the base scheme is compiled for each chunk.
 	"""
 	
 	require = Attribute(default=All)
+	max_concerns = Attribute(default=None)
+	executor = Attribute(default=None)
+	threshold = Attribute(default=16384)
+	chunksize = Attribute(default=4096)
 	
-	def validate(self, value, context=None):
-		if not isinstance(value, IIterable):
-			raise Concern("Value must be iterable.")
+	def __setattr__(self, name, value):
+		if name in ('validators', 'require'):
+			self.invalidate()
 		
-		validate = self.require(validators=list(self._validators)).validate
+		super().__setattr__(name, value)
+	
+	def __delattr__(self, name):
+		if name in ('validators', 'require'):
+			self.invalidate()
+		
+		super().__delattr__(name)
+	
+	def invalidate(self):
+		"""Discard any retained base scheme, forcing it to be rebuilt on next use."""
+		
+		super().invalidate()
+		
+		for name in ('_scheme', '_compiled', '_validated'):
+			self.__dict__.pop(name, None)
+	
+	def __getstate__(self):
+		"""Exclude the retained base scheme from pickling, as a compiled scheme can not be pickled."""
+		
+		state = super().__getstate__()
+		
+		for name in ('_scheme', '_compiled', '_validated'):
+			state.pop(name, None)
+		
+		return state
+	
+	def _base(self):
+		"""Return the base scheme, constructing it on first use, registering to be invalidated should it be altered."""
+		
+		state = self.__dict__
+		
+		try:
+			return state['_scheme']
+		except KeyError:
+			pass
+		
+		scheme = state['_scheme'] = self.require(validators=list(self._validators))
+		
+		for validator in scheme._descendants():
+			validator._retain(self)
 		
+		return scheme
+	
+	def _require(self, count=0):
+		"""Return the validate function of the base scheme, about to be used to validate the given number of elements."""
+		
+		state = self.__dict__
+		scheme = self._base()
+		
+		try:
+			return state['_compiled']
+		except KeyError:
+			pass
+		
+		count += state.get('_validated', 0)
+		
+		if count < MANY:
+			state['_validated'] = count
+			return scheme.validate
+		
+		validate = state['_compiled'] = scheme.compile()
+		return validate
+	
+	def _elements(self, value, elements, context):
+		"""Validate the given (key, element) pairs of the value, raising a Concern describing those failing."""
+		
+		size = len(value) if hasattr(value, '__len__') else 1
+		validate = self._require(size)
+		limit = self.max_concerns
+		
+		if self.executor is None or size < self.threshold:
+			concerns = _concerns(validate, elements, context, limit)
+		else:
+			concerns = self._parallel(validate, list(elements), context, limit)
+		
+		_raise(concerns)
+	
+	async def _aelements(self, elements, context):
+		"""As per `_elements`, awaiting the base scheme for each chunk of elements concurrently."""
+		
+		from asyncio import ensure_future, gather  # Already imported, as an event loop is running.
+		
+		avalidate = self._base().avalidate
+		limit = self.max_concerns
+		elements = iter(elements)
 		concerns = []
 		
-		for i, item in enumerate(value):
+		while not limit or len(concerns) < limit:
+			chunk = list(islice(elements, self.chunksize))
+			
+			if not chunk:
+				break
+			
+			# Each element is a task of its own, so that, e.g., timeouts within one apply to it alone.
+			tasks = [ensure_future(avalidate(element, context)) for key, element in chunk]
+			
 			try:
-				validate(item, context)
-			except Concern as e:
-				e.message = "Element " + str(i) + ": " + e.message
-				concerns.append(e)
+				results = await gather(*tasks, return_exceptions=True)
+			finally:
+				for task in tasks:  # Only those remaining should we have been interrupted.
+					task.cancel()
+			
+			for (key, element), result in zip(chunk, results):
+				if isinstance(result, Concern):
+					result._element(key)
+					concerns.append(result)
+				
+				elif isinstance(result, BaseException):
+					raise result
+		
+		_raise(concerns[:limit] if limit else concerns)
+	
+	def _parallel(self, validate, elements, context, limit):
+		"""Validate chunks of the given (key, element) pairs using the executor, returning concerns in element order."""
+		
+		from concurrent.futures import ProcessPoolExecutor  # Already imported, by whoever created the executor.
+		
+		executor, size, worker = self.executor, self.chunksize, _concerns
+		
+		if isinstance(executor, ProcessPoolExecutor):  # Compiled functions can not be pickled; compile per chunk.
+			validate, worker = self._base(), _compiled_concerns
+		
+		futures = [executor.submit(worker, validate, elements[i:i + size], context, limit)
+				for i in range(0, len(elements), size)]
+		concerns = []
+		
+		try:
+			for future in futures:
+				concerns.extend(future.result())
+				
+				if limit and len(concerns) >= limit:
+					return concerns[:limit]
+		
+		finally:
+			for future in futures:  # Abandon any chunks not yet started once done, or on error.
+				future.cancel()
+		
+		return concerns
+
+
+class Iterable(Collection):
+	"""Validate that the value is iterable and that the values optionally conform to a schema.
+	
+	Will attempt to iterate nearly anything.
+	"""
+	
+	def validate(self, value, context=None):
+		if not isinstance(value, IIterable):
+			raise Concern("Value must be iterable.")
+		
+		self._elements(value, enumerate(value), context)
+		
+		return value
+	
+	async def _avalidate(self, value, context):
+		if not isinstance(value, IIterable):
+			raise Concern("Value must be iterable.")
 		
-		if len(concerns) == 1:
-			raise concerns[0]
-		elif concerns:
-			raise Concern(max(i.level for i in concerns), "Multiple validation concerns.", concerns=concerns)
+		await self._aelements(enumerate(value), context)
 		
 		return value
 
 
-class Mapping(Compound):
+class Mapping(Collection):
 	"""Validate that the value is a mapping whose values (not keys) optionally conform to a schema."""
 	
-	require = Attribute(default=All)
-	
 	def validate(self, value, context=None):
 		if not isinstance(value, IMapping):
 			raise Concern("Value must be a mapping.")
 		
-		validate = self.require(validators=list(self._validators)).validate
+		self._elements(value, value.items(), context)
+		
+		return value
+	
+	async def _avalidate(self, value, context):
+		if not isinstance(value, IMapping):
+			raise Concern("Value must be a mapping.")
+		
+		await self._aelements(value.items(), context)
 		
+		return value
+
+
+# ## Record Validation
+
+@lru_cache(maxsize=256)
+def fields(schema):
+	"""The name, storage key, and attribute of each Validated attribute of a Container subclass, in declared order.
+	
+	Shared by all Schema validators, as the attributes of a class are fixed once it has been constructed.  Call
+	``fields.cache_clear()`` after altering the attributes of a class, or their names, in-place.
+	"""
+	
+	return tuple((name, attribute.__name__, attribute) for name, attribute in schema.__attributes__.items()
+			if isinstance(attribute, Validated))
+
+
+class Schema(Validator):
+	"""Validate a complete record against the Validated attributes of a Container subclass, collecting all concerns.
+	
+	The record may be an instance of the schema, whose stored values are validated, or any mapping of attribute names
+	to values.  Each value is validated by the validator of its attribute, with the record as context, as it would be
+	on assignment.  As with assignment, absent values (including those which would fall back on a default) are not
+	validated, nor are values altered.  If no schema is given, the class of the record is used.
+	"""
+	
+	schema = Attribute(default=None)
+	
+	def validate(self, value, context=None):
+		value = super().validate(value, context)
 		concerns = []
 		
-		for key in value:
+		for name, attribute, item in self._fields(value):
 			try:
-				validate(value[key], context)
+				attribute.validator.validate(item, value)
 			except Concern as e:
-				e.message = "Element " + repr(key) + ": " + e.message
+				e._element(name)
 				concerns.append(e)
 		
-		if len(concerns) == 1:
-			raise concerns[0]
-		elif concerns:
-			raise Concern(max(i.level for i in concerns), "Multiple validation concerns.", concerns=concerns)
+		_raise(concerns)
 		
 		return value
+	
+	async def _avalidate(self, value, context):
+		from asyncio import gather  # Already imported, as an event loop is running.
+		
+		value = await self._await(value, context, Schema)
+		present = list(self._fields(value))
+		concerns = []
+		
+		# Fields are validated concurrently, e.g. to perform several uniqueness checks at once.
+		results = await gather(*(attribute.validator.avalidate(item, value) for name, attribute, item in present),
+				return_exceptions=True)
+		
+		for (name, attribute, item), result in zip(present, results):
+			if isinstance(result, Concern):
+				result._element(name)
+				concerns.append(result)
+			
+			elif isinstance(result, BaseException):
+				raise result
+		
+		_raise(concerns)
+		
+		return value
+	
+	def _fields(self, value):
+		"""Yield the name, attribute, and value of each Validated field present in the given record."""
+		
+		schema = self.schema
+		
+		if isinstance(value, Container) and (schema is None or isinstance(value, schema)):
+			data, stored = value.__data__, True
+			schema = schema or value.__class__
+		elif schema is not None and isinstance(value, IMapping):
+			data, stored = value, False
+		else:
+			raise Concern("Value must be a record or mapping.")
+		
+		for name, key, attribute in fields(schema):
+			item = data.get(key if stored else name, MISSING)
+			
+			if item is not MISSING:
+				yield name, attribute, item
+
+
+class Deferred:
+	"""Defer the validation of Validated attributes, assigned within a `with` block, to an explicit `commit`.
+	
+	Within the block assignments are stored unvalidated and the objects assigned to are recorded, in order, as
+	`records`.  Validation does not happen on leaving the block; call `commit` to validate every recorded object at
+	once, e.g. prior to discarding those which are invalid::
+		
+		with Deferred() as batch:
+			people = [Person(**row) for row in rows]
+		
+		failures = batch.commit()
+		people = [person for i, person in enumerate(people) if i not in failures]
+	
+	Records are grouped by class and validated field by field, each field's validator being compiled once for the
+	batch when there are enough records of that class to benefit.  Blocks may be nested; each records only the
+	assignments made directly within it.  Deferral is tracked per thread and asynchronous task.
+	"""
+	
+	def __init__(self):
+		self._pending = {}
+		self._token = None
+	
+	def __enter__(self):
+		self._token = DEFERRED.set(self._pending)
+		return self
+	
+	def __exit__(self, kind, value, traceback):
+		DEFERRED.reset(self._token)
+		self._token = None
+	
+	@property
+	def records(self):
+		"""The objects assigned to within the block, in order of first assignment."""
+		return list(self._pending.values())
+	
+	def commit(self):
+		"""Validate all recorded objects, returning a dictionary mapping the index of each invalid record to a `Failure`.
+		
+		As per `Schema`, each failure describes every invalid field of its record, and values are not altered.  Larger
+		batches are checked using compiled validators; these are compiled anew by each commit, and not retained.
+		"""
+		
+		records = self.records
+		classes = {}
+		found = {}
+		
+		for i, record in enumerate(records):
+			classes.setdefault(record.__class__, []).append(i)
+		
+		for cls, members in classes.items():
+			for name, key, attribute in fields(cls):
+				validator = attribute.validator
+				check = validator.compile(True) if len(members) >= MANY else validator.check
+				
+				for i in members:
+					record = records[i]
+					value = record.__data__.get(key, MISSING)
+					
+					if value is MISSING:
+						continue
+					
+					failure = check(value, record)
+					
+					if failure is not None:
+						failure = copy.copy(failure)  # Failures may be shared between calls; ours is altered.
+						failure._element(name)
+						found.setdefault(i, []).append(failure)
+		
+		failures = {}
+		
+		for i in sorted(found):
+			concerns = found[i]
+			failures[i] = concerns[0] if len(concerns) == 1 else \
+					Failure(max(concern.level for concern in concerns), "Multiple validation concerns.", concerns=concerns)
+		
+		return failures
@@ -1,67 +1,238 @@
-from re import compile, I, U
-
+from .. import Attribute
 from . import Validator, Pattern, Length
-from .compound import Any, All
+from .base import Concern
+from .compound import Any, AnyPattern, All
+from .util import RegexAttribute
+
+
+OCTETS = frozenset(map(str, range(256)))  # Every decimal octet in canonical form, i.e. without leading zeros.
+PREFIXES = (frozenset(map(str, range(33))), frozenset(map(str, range(129))))  # IPv4 and IPv6 CIDR prefix lengths.
+HEXADECIMAL = frozenset('0123456789abcdefABCDEF')
+GROUPS = frozenset((1, 2, 3, 4))  # The permitted lengths of hexadecimal IPv6 groups.
+ZONE = 255  # The longest accepted IPv6 scope zone, e.g. the "eth0" in "fe80::1%eth0".
+
+
+# ## Address Parsers
+# Each predicate examines a bounded amount of its input without backtracking and never raises, simply answering False.
+
+def _ipv4(value):
+	if not isinstance(value, str) or len(value) > 15:
+		return False
+	
+	octets = value.split('.')
+	return len(octets) == 4 and OCTETS.issuperset(octets)
+
+
+def _ipv6(value):
+	if not isinstance(value, str) or len(value) > 46 + ZONE:
+		return False
+	
+	address, zoned, zone = value.partition('%')
+	
+	if (zoned and not zone) or len(address) > 45:
+		return False
+	
+	if '.' in address:  # Trailing dotted IPv4 notation occupies the final two groups.
+		head, colon, tail = address.rpartition(':')
+		
+		if not colon or not _ipv4(tail):
+			return False
+		
+		address = head + ':0:0'
+	
+	if '::' in address:  # Elides one or more groups.
+		head, _, tail = address.partition('::')
+		
+		if '::' in tail:
+			return False
+		
+		groups = (head.split(':') if head else []) + (tail.split(':') if tail else [])
+		
+		if len(groups) > 7:
+			return False
+	
+	else:
+		groups = address.split(':')
+		
+		if len(groups) != 8:
+			return False
+	
+	return GROUPS.issuperset(map(len, groups)) and HEXADECIMAL.issuperset(''.join(groups))
+
+
+def _cidrv4(value):
+	if not isinstance(value, str) or len(value) > 18:
+		return False
+	
+	address, _, prefix = value.partition('/')
+	return prefix in PREFIXES[0] and _ipv4(address)
+
+
+def _cidrv6(value):
+	if not isinstance(value, str) or len(value) > 50 + ZONE:
+		return False
+	
+	address, _, prefix = value.rpartition('/')
+	return prefix in PREFIXES[1] and _ipv6(address)
+
+
+# ## Class Definitions
+
+class Address(Pattern):
+	"""Validate a network address using a regular expression or, if `parse` is truthy, a dedicated parser.
+	
+	The parser runs in time bounded by the length of a valid address regardless of input, and is stricter than the
+	expressions it replaces: surrounding whitespace and trailing content are rejected.
+	"""
+	
+	parse = Attribute(default=False)
+	parser = None  # A predicate accepting the value, as a staticmethod.
+	
+	def validate(self, value, context=None):
+		if not self.parse:
+			return super().validate(value, context)
+		
+		value = super(Pattern, self).validate(value, context)
+		
+		if value is not None and not self.parser(value):
+			raise Concern("Failed to match required pattern.")
+		
+		return value
+	
+	def _emit(self, compiler):
+		if not self.parse:
+			self._compile(compiler, Address)
+			return
+		
+		self._compile(compiler, Pattern)
+		parser = compiler.bind(self.parser, 'parser')
+		
+		compiler.emit(
+				'if value is not None and not {0}(value):'.format(parser),
+				'\t' + compiler.fail("Failed to match required pattern."),
+			)
+	
+	def _expression(self):
+		return None if self.parse else super()._expression()
 
 
-class IPv4(Pattern):
+class AnyAddress(AnyPattern):
+	"""Accept a value matching any of the child address validators, as per `AnyPattern`.
+	
+	If `parse` is truthy the parsers of the children are consulted directly, without trial validation; only `Address`
+	children are supported in this mode.  Either way, failure includes a Concern for each child.
+	"""
+	
+	parse = Attribute(default=False)
+	
+	def validate(self, value, context=None):
+		if not self.parse:
+			return super().validate(value, context)
+		
+		value = super(Any, self).validate(value, context)
+		
+		if value is None:
+			return value
+		
+		for validator in self._validators:
+			if validator.parser(value):
+				return value
+		
+		raise Concern("All validators failed.", concerns=self._failures(value, context))
+	
+	def _failures(self, value, context):
+		if not self.parse:
+			return super()._failures(value, context)
+		
+		return [Concern("Failed to match required pattern.") for validator in self._validators]  # As per Address.
+	
+	def _emit(self, compiler):
+		if not self.parse:
+			self._compile(compiler, AnyAddress)
+			return
+		
+		self._compile(compiler, Any)
+		parsers = compiler.bind(tuple(validator.parser for validator in self._validators), 'parsers')
+		gather = compiler.bind(self._failures, 'gather')
+		parser, failures = compiler.name('parser'), compiler.name('failures')
+		
+		compiler.emit(
+				'if value is not None:',
+				'\tfor {0} in {1}:'.format(parser, parsers),
+				'\t\tif {0}(value):'.format(parser),
+				'\t\t\tbreak',
+				'\telse:',
+				'\t\t{0} = {1}(value, context)'.format(failures, gather),
+				'\t\t' + compiler.fail("All validators failed.", concerns=failures),
+			)
+
+
+class IPv4(Address):
 	"""Validate any IPv4 dotted-notation address."""
-	pattern = compile(r'^(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])$')
+	pattern = RegexAttribute(default=r'^(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])$')
+	parser = staticmethod(_ipv4)
 
 ipv4 = IPv4()
 
 
-class IPv6(Pattern):
+class IPv6(Address):
 	"""Validate any IPv6 colon-notation address."""
-	pattern = compile(r'^\s*((([0-9A-Fa-f]{1,4}:){7}([0-9A-Fa-f]{1,4}|:))|(([0-9A-Fa-f]{1,4}:){6}(:[0-9A-Fa-f]{1,4}|((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){5}(((:[0-9A-Fa-f]{1,4}){1,2})|:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){4}(((:[0-9A-Fa-f]{1,4}){1,3})|((:[0-9A-Fa-f]{1,4})?:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){3}(((:[0-9A-Fa-f]{1,4}){1,4})|((:[0-9A-Fa-f]{1,4}){0,2}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){2}(((:[0-9A-Fa-f]{1,4}){1,5})|((:[0-9A-Fa-f]{1,4}){0,3}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){1}(((:[0-9A-Fa-f]{1,4}){1,6})|((:[0-9A-Fa-f]{1,4}){0,4}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(:(((:[0-9A-Fa-f]{1,4}){1,7})|((:[0-9A-Fa-f]{1,4}){0,5}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:)))(%.+)?\s*')
+	pattern = RegexAttribute(default=r'^\s*((([0-9A-Fa-f]{1,4}:){7}([0-9A-Fa-f]{1,4}|:))|(([0-9A-Fa-f]{1,4}:){6}(:[0-9A-Fa-f]{1,4}|((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){5}(((:[0-9A-Fa-f]{1,4}){1,2})|:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){4}(((:[0-9A-Fa-f]{1,4}){1,3})|((:[0-9A-Fa-f]{1,4})?:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){3}(((:[0-9A-Fa-f]{1,4}){1,4})|((:[0-9A-Fa-f]{1,4}){0,2}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){2}(((:[0-9A-Fa-f]{1,4}){1,5})|((:[0-9A-Fa-f]{1,4}){0,3}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){1}(((:[0-9A-Fa-f]{1,4}){1,6})|((:[0-9A-Fa-f]{1,4}){0,4}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(:(((:[0-9A-Fa-f]{1,4}){1,7})|((:[0-9A-Fa-f]{1,4}){0,5}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:)))(%.+)?\s*')
+	parser = staticmethod(_ipv6)
 
 ipv6 = IPv6()
 
 
-class CIDRv4(Pattern):
+class CIDRv4(Address):
 	"""Validate any network address range in slash-notation CIDR format for IPv4 networks."""
-	pattern = compile(r'^(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])(\/(\d|[1-2]\d|3[0-2]))$')
+	pattern = RegexAttribute(default=r'^(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])(\/(\d|[1-2]\d|3[0-2]))$')
+	parser = staticmethod(_cidrv4)
 
 cidrv4 = CIDRv4()
 
 
-class CIDRv6(Pattern):
+class CIDRv6(Address):
 	"""Validate any network address range in slash-notation CIDR format for IPv6 networks."""
-	pattern = compile(r'^\s*((([0-9A-Fa-f]{1,4}:){7}([0-9A-Fa-f]{1,4}|:))|(([0-9A-Fa-f]{1,4}:){6}(:[0-9A-Fa-f]{1,4}|((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){5}(((:[0-9A-Fa-f]{1,4}){1,2})|:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){4}(((:[0-9A-Fa-f]{1,4}){1,3})|((:[0-9A-Fa-f]{1,4})?:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){3}(((:[0-9A-Fa-f]{1,4}){1,4})|((:[0-9A-Fa-f]{1,4}){0,2}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){2}(((:[0-9A-Fa-f]{1,4}){1,5})|((:[0-9A-Fa-f]{1,4}){0,3}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){1}(((:[0-9A-Fa-f]{1,4}){1,6})|((:[0-9A-Fa-f]{1,4}){0,4}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(:(((:[0-9A-Fa-f]{1,4}){1,7})|((:[0-9A-Fa-f]{1,4}){0,5}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:)))(%.+)?\s*(\/(\d|\d\d|1[0-1]\d|12[0-8]))$')
+	pattern = RegexAttribute(default=r'^\s*((([0-9A-Fa-f]{1,4}:){7}([0-9A-Fa-f]{1,4}|:))|(([0-9A-Fa-f]{1,4}:){6}(:[0-9A-Fa-f]{1,4}|((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){5}(((:[0-9A-Fa-f]{1,4}){1,2})|:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3})|:))|(([0-9A-Fa-f]{1,4}:){4}(((:[0-9A-Fa-f]{1,4}){1,3})|((:[0-9A-Fa-f]{1,4})?:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){3}(((:[0-9A-Fa-f]{1,4}){1,4})|((:[0-9A-Fa-f]{1,4}){0,2}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){2}(((:[0-9A-Fa-f]{1,4}){1,5})|((:[0-9A-Fa-f]{1,4}){0,3}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(([0-9A-Fa-f]{1,4}:){1}(((:[0-9A-Fa-f]{1,4}){1,6})|((:[0-9A-Fa-f]{1,4}){0,4}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:))|(:(((:[0-9A-Fa-f]{1,4}){1,7})|((:[0-9A-Fa-f]{1,4}){0,5}:((25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)(\.(25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)){3}))|:)))(%.+)?\s*(\/(\d|\d\d|1[0-1]\d|12[0-8]))$')
+	parser = staticmethod(_cidrv6)
 
 cidrv6 = CIDRv6()
 
 
-class IPAddress(Any):
+class IPAddress(AnyAddress):
 	"""Accept any string that appears to be an IPv4 or IPv6 address."""
 	validators = [ipv4, ipv6]
 
 ipaddress = IPAddress()
 
 
-class CIDR(Any):
+class CIDR(AnyAddress):
 	"""Accept any string that appears to be an IPv4 CIDR or IPv6 CIDR."""
 	validators = [cidrv4, cidrv6]
 
 cidr = CIDR()
 
 
+class _Hostname(Pattern):
+	"""The labels of a (pre-unicode) hostname."""
+	pattern = RegexAttribute(default=r'^(([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9-]{0,61}[a-zA-Z0-9])\.)*([A-Za-z]{2,}|[A-Za-z][A-Za-z\-]{0,61}[A-Za-z])$')
+
+
 class Hostname(All):
 	"""Validate (pre-unicode) hostnames."""
-	validators = [
-			Length(255),
-			Pattern(r'^(([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9-]{0,61}[a-zA-Z0-9])\.)*([A-Za-z]{2,}|[A-Za-z][A-Za-z\-]{0,61}[A-Za-z])$')
-		]
+	validators = [Length(255), _Hostname()]
 
 hostname = Hostname()
 
 
+class _DNSName(Pattern):
+	"""The labels of an allowable DNS name."""
+	pattern = RegexAttribute(default=r'^(([a-zA-Z0-9_]|[a-zA-Z0-9_][a-zA-Z0-9_-]{0,61}[a-zA-Z0-9])\.)*([A-Za-z_][A-Za-z0-9]|[A-Za-z_][A-Za-z0-9_-]{0,61}[A-Za-z])\.?$')
+
+
 class DNSName(All):
 	"""Validate allowable DNS names."""
-	validators = [
-			Length(255),
-			Pattern(r'^(([a-zA-Z0-9_]|[a-zA-Z0-9_][a-zA-Z0-9_-]{0,61}[a-zA-Z0-9])\.)*([A-Za-z_][A-Za-z0-9]|[A-Za-z_][A-Za-z0-9_-]{0,61}[A-Za-z])\.?$')
-		]
+	validators = [Length(255), _DNSName()]
 
 dnsname = DNSName()
 
@@ -69,13 +240,13 @@ dnsname = DNSName()
 class MAC(Pattern):
 	"""A Media Access Control (MAC) address.  Also referred to as a "Wi-Fi Address" or "Hardware ID"."""
 	
-	pattern = compile(r'^(?:(?:[0-9a-fA-F]{1,2})([:.-])(?:[0-9a-fA-F]{1,2})\1(?:[0-9a-fA-F]{1,2})\1(?:[0-9a-fA-F]{1,2})\1(?:[0-9a-fA-F]{1,2})\1(?:[0-9a-fA-F]{1,2}))$')
+	pattern = RegexAttribute(default=r'^(?:(?:[0-9a-fA-F]{1,2})([:.-])(?:[0-9a-fA-F]{1,2})\1(?:[0-9a-fA-F]{1,2})\1(?:[0-9a-fA-F]{1,2})\1(?:[0-9a-fA-F]{1,2})\1(?:[0-9a-fA-F]{1,2}))$')
 
 mac = MAC()
 
 
 class URI(Pattern):
 	"""Validate a reasonable URI.  Might not cover all cases."""
-	pattern = compile(r'^(([^:/?#]+):)?(//([^/?#]*))?([^?#]*)(\?([^#]*))?(#(.*))?')
+	pattern = RegexAttribute(default=r'^(([^:/?#]+):)?(//([^/?#]*))?([^?#]*)(\?([^#]*))?(#(.*))?')
 
 uri = URI()
@@ -1,7 +1,63 @@
-from re import compile
+from re import compile, A, I, M, S, U
+from functools import lru_cache
 from numbers import Number
 
-from .. import CallbackAttribute
+from .. import Attribute, CallbackAttribute
+from ..util import ensure_tuple
+
+
+INLINE = ((I, 'i'), (M, 'm'), (S, 's'))  # Flags RE2 understands, and their inline equivalents.
+UNICODE = compile(r'\\[wWdDsSbB]')  # Escapes RE2 would interpret as ASCII-only, where Python would not.
+
+
+# ## Expression Compilation
+
+@lru_cache(maxsize=256)
+def expression(source, flags=0):
+	"""Compile a regular expression, sharing the result among all users of the same source and flags.
+	
+	Call ``expression.cache_info()`` for hit and miss counts, or ``expression.cache_clear()`` to reset.
+	"""
+	
+	return compile(source, flags)
+
+
+# ## Linear-Time Matching
+
+@lru_cache(maxsize=128)
+def _linear(source, flags):
+	try:
+		import re2
+	except ImportError:  # The linear-time engine is an optional dependency.
+		return None
+	
+	if flags & ~(A | I | M | S | U) or (flags & U and UNICODE.search(source)):
+		return None  # The expression depends upon behaviour RE2 does not replicate.
+	
+	options = re2.Options()
+	options.log_errors = False
+	inline = ''.join(flag for mask, flag in INLINE if flags & mask)
+	
+	try:
+		return re2.compile(('(?' + inline + ')' if inline else '') + source, options)
+	except re2.error:  # E.g. backreferences or lookaround assertions, which require backtracking.
+		return None
+
+
+def linear(regex):
+	"""Produce an equivalent of the given compiled regex using the linear-time RE2 engine, where possible.
+	
+	RE2 is used if the `google-re2` package is installed and able to express the pattern: backreferences, lookaround,
+	verbose mode, and, for text patterns, Unicode-aware character class escapes (unless `re.ASCII` is given) are not
+	supported.  Otherwise the regex is returned unaltered.  Conversions are cached.
+	"""
+	
+	source = getattr(regex, 'pattern', None)
+	
+	if not isinstance(source, str):
+		return regex
+	
+	return _linear(source, regex.flags) or regex
 
 
 class SliceAttribute(CallbackAttribute):
@@ -33,11 +89,75 @@ class SliceAttribute(CallbackAttribute):
 class RegexAttribute(CallbackAttribute):
 	"""Automatically attempt to transform non-regexen into regexen upon assignment.
 	
-	Technically only checks for regex-like capability a la a `.match()` method.  Will compile strings into regex objects.
+	Technically only checks for regex-like capability a la a `.match()` method.  Will compile strings into regex objects,
+	using the given `flags`, sharing the result with all others compiling the same source and flags; see `expression`.
+	A string default, such as the expression declared by a `Pattern` subclass, is compiled on first access rather than
+	at declaration, then retained by the instance; accessed on the class, the compiled default is returned.  If `defer`
+	is truthy, the same applies to assigned strings.  If `linear` is truthy regexen are converted for matching in linear
+	time where possible; see `linear`.
 	"""
 	
+	flags = Attribute(default=0)
+	defer = Attribute(default=False)
+	linear = Attribute(default=False)
+	
+	def __get__(self, obj, cls=None):
+		if obj is None:  # As when declared as a plain compiled class attribute, e.g. `Alphanumeric.pattern.match(s)`.
+			default = getattr(self, 'default', None)
+			return self._compile(default) if isinstance(default, (str, bytes)) else self
+		
+		value = super().__get__(obj, cls)
+		
+		if isinstance(value, (str, bytes)):  # An uncompiled default, or deferred assignment.
+			value = self._compile(value)
+			super().__set__(obj, value)
+		
+		return value
+	
 	def __set__(self, obj, value):
-		if not hasattr(value, 'match'):
-			value = compile(value)
+		if not self.defer or not isinstance(value, (str, bytes)):
+			value = self._compile(value)
 		
 		return super().__set__(obj, value)
+	
+	def _compile(self, value):
+		if not hasattr(value, 'match'):
+			value = expression(value, self.flags)
+		
+		return linear(value) if self.linear else value
+
+
+class ChoiceIndex:
+	"""A hashed membership index over the values of a collection of choices, as accepted by the In validator.
+	
+	Choices may be single values or ``(value, label)`` pairs; only the values are indexed.  Unhashable choices, and
+	tests for membership of unhashable values, fall back on a linear scan.
+	"""
+	
+	__slots__ = ('hashed', 'unhashable', 'values')
+	
+	def __init__(self, choices):
+		self.values = tuple(value for value, in ensure_tuple(1, choices))
+		hashed = set()
+		unhashable = []
+		
+		for value in self.values:
+			try:
+				hashed.add(value)
+			except TypeError:
+				unhashable.append(value)
+		
+		self.hashed = frozenset(hashed)
+		self.unhashable = tuple(unhashable)
+	
+	def __contains__(self, value):
+		try:
+			if value in self.hashed:
+				return True
+		except TypeError:  # An unhashable value can only be located by comparison against every choice.
+			return value in self.values
+		
+		return bool(self.unhashable) and value in self.unhashable
+	
+	def __len__(self):
+		return len(self.values)
@@ -58,6 +58,7 @@ setup(
 	
 	extras_require = dict(
 			development = tests_require,
+			linear = ['google-re2'],
 		),
 	
 	tests_require = tests_require,
@@ -52,6 +52,163 @@ class TestContainer:
 		assert list(OurSample(bar=42, foo=27).__data__.keys()) == ['foo', 'bar']
 
 
+
+class TestCompiledContainer:
+	class Sample(Container):
+		__compiled__ = True
+		
+		foo = Attribute(default=None)
+		bar = Attribute(default=None)
+		baz = Attribute(name='bazzy')
+	
+	class Generic(Container):
+		foo = Attribute(default=None)
+		bar = Attribute(default=None)
+		baz = Attribute(name='bazzy')
+	
+	def test_constructor_is_compiled(self):
+		assert self.Sample.__init__ is not Container.__init__
+		assert self.Sample.__init__.__compiled__
+		assert self.Generic.__init__ is Container.__init__
+	
+	def test_arguments(self):
+		assert self.Sample(27, 42).__data__ == dict(foo=27, bar=42)
+		assert self.Sample(27, bar=42).__data__ == dict(foo=27, bar=42)
+		assert self.Sample(bar=42, baz=7).__data__ == dict(bar=42, bazzy=7)
+		assert self.Sample().__data__ == dict()
+	
+	def test_preserves_order(self):
+		class OurSample(self.Sample):
+			__store__ = odict
+		
+		assert list(OurSample(27, 42).__data__.keys()) == ['foo', 'bar']
+		assert list(OurSample(bar=42, foo=27).__data__.keys()) == ['foo', 'bar']
+	
+	@pytest.mark.parametrize('args,kw', [
+			((1, 2, 3, 4), {}),
+			((1, ), dict(foo=2)),
+			((1, 2), dict(foo=3, bar=4)),
+			((), dict(diz=1)),
+			((), dict(diz=1, dar=2)),
+		])
+	def test_identical_errors(self, args, kw):
+		with pytest.raises(TypeError) as compiled:
+			self.Sample(*args, **kw)
+		
+		with pytest.raises(TypeError) as generic:
+			self.Generic(*args, **kw)
+		
+		assert str(compiled.value).replace('Sample', 'Generic') == str(generic.value)
+	
+	def test_descriptor_assignment(self):
+		assigned = []
+		
+		class Recorded(Attribute):
+			def __set__(self, obj, value):
+				assigned.append(value)
+				super().__set__(obj, value)
+		
+		class Sample(Container):
+			__compiled__ = True
+			foo = Recorded()
+		
+		assert Sample(27).foo == 27
+		assert Sample(foo=42).foo == 42
+		assert assigned == [27, 42]
+	
+	def test_subclass_recompiled(self):
+		class Child(self.Sample):
+			diz = Attribute()
+		
+		assert Child.__init__ is not self.Sample.__init__
+		assert Child(1, 2, 3, 4).__data__ == dict(foo=1, bar=2, bazzy=3, diz=4)
+	
+	def test_explicit_constructor_respected(self):
+		class Child(self.Sample):
+			diz = Attribute()
+			
+			def __init__(self, *args, **kw):
+				kw.setdefault('diz', 27)
+				super().__init__(*args, **kw)
+		
+		assert Child(1).__data__ == dict(foo=1, diz=27)
+
+
+class TestContainerBulk:
+	class Sample(Container):
+		__store__ = odict
+		
+		foo = Attribute(default=None)
+		bar = Attribute(default=None)
+		baz = Attribute(name='bazzy')
+	
+	def test_rows(self):
+		result = self.Sample.bulk([(1, 2), (3, 4, 5), ()])
+		
+		assert [i.__data__ for i in result] == [dict(foo=1, bar=2), dict(foo=3, bar=4, bazzy=5), dict()]
+		assert all(isinstance(i, self.Sample) for i in result)
+		assert result[0].__sequence__ < result[1].__sequence__ < result[2].__sequence__
+	
+	def test_named_rows(self):
+		result = self.Sample.bulk([(1, 2), (3, 4)], names=('baz', 'foo'))
+		
+		assert [i.__data__ for i in result] == [dict(foo=2, bazzy=1), dict(foo=4, bazzy=3)]
+		assert list(result[0].__data__) == ['foo', 'bazzy']
+	
+	def test_columns(self):
+		result = self.Sample.bulk(odict((('bar', [1, 2]), ('foo', [3, 4]))))
+		
+		assert [i.__data__ for i in result] == [dict(foo=3, bar=1), dict(foo=4, bar=2)]
+	
+	def test_lazy(self):
+		result = self.Sample.bulk(iter([(1, ), (2, )]), lazy=True)
+		
+		assert not isinstance(result, list)
+		assert [i.foo for i in result] == [1, 2]
+	
+	def test_errors(self):
+		with pytest.raises(TypeError):
+			self.Sample.bulk([(1, 2, 3, 4)])
+		
+		with pytest.raises(TypeError):
+			self.Sample.bulk([(1, 2)], names=('foo', 'foo'))
+		
+		with pytest.raises(TypeError):
+			self.Sample.bulk(dict(diz=[1]))
+		
+		with pytest.raises(ValueError):
+			self.Sample.bulk(dict(foo=[1, 2], bar=[1]))
+	
+	def test_descriptor_assignment(self):
+		assigned = []
+		
+		class Recorded(Attribute):
+			def __set__(self, obj, value):
+				assigned.append(value)
+				super().__set__(obj, value)
+		
+		class Sample(Container):
+			foo = Attribute()
+			bar = Recorded()
+		
+		assert [i.__data__ for i in Sample.bulk([(1, 2)])] == [dict(foo=1, bar=2)]
+		assert assigned == [2]
+	
+	def test_custom_constructor(self):
+		class Sample(self.Sample):
+			def __init__(self, *args, **kw):
+				kw.setdefault('bar', 27)
+				super().__init__(*args, **kw)
+		
+		assert [i.__data__ for i in Sample.bulk([(1, )])] == [dict(foo=1, bar=27)]
+	
+	def test_structured_array(self):
+		numpy = pytest.importorskip('numpy')
+		data = numpy.array([(1, 2.5), (3, 4.5)], dtype=[('foo', 'i4'), ('bar', 'f8')])
+		
+		assert [i.__data__ for i in self.Sample.bulk(data)] == [dict(foo=1, bar=2.5), dict(foo=3, bar=4.5)]
+		assert [i.__data__ for i in self.Sample.bulk(data, lazy=True)] == [dict(foo=1, bar=2.5), dict(foo=3, bar=4.5)]
+
 class TestDataAttribute:
 	class Sample(Container):
 		foo = DataAttribute()
@@ -142,6 +299,40 @@ class TestAttribute:
 	def test_othername(self):
 		instance = self.Sample(bazfoo="Hello", bazbar="world", bazbaz="again!")
 		assert instance.__data__ == dict(fooey="Hello", barey="world", bazzy="again!")
+	
+	def test_stored_none(self):
+		instance = self.Sample(bar=None)
+		assert instance.bar is None
+	
+	def test_default_reassignment(self):
+		class Sample(Container):
+			foo = Attribute(default=1)
+		
+		instance = Sample()
+		assert instance.foo == 1
+		
+		Sample.foo.default = lambda: [27]
+		assert instance.foo == [27]
+		
+		del Sample.foo.default
+		
+		with pytest.raises(AttributeError):
+			instance.foo
+	
+	def test_rename(self):
+		class Sample(Container):
+			foo = Attribute()
+		
+		instance = Sample(27)
+		assert instance.foo == 27
+		
+		Sample.foo.__name__ = 'bar'
+		
+		with pytest.raises(AttributeError):
+			instance.foo
+		
+		instance.__data__['bar'] = 42
+		assert instance.foo == 42
 
 
 class TestCallbackAttribute:
@@ -1,4 +1,6 @@
-from marrow.schema.exc import Concern, WARNING, ERROR, CRITICAL
+import pickle
+
+from marrow.schema.exc import Concern, Failure, WARNING, ERROR, CRITICAL
 
 
 def test_basic_concern_text():
@@ -44,3 +46,41 @@ def test_nested_concern():
 	concern = Concern("Uh-oh.", concerns=[child])
 	
 	assert concern.concerns == [child]
+
+
+def test_failure():
+	failure = Failure("{0} has failed me for the {1} time.", "Bob Dole", "last")
+	assert not isinstance(failure, Exception)
+	assert failure.level == ERROR
+	assert str(failure) == "Bob Dole has failed me for the last time."
+	assert repr(failure) == 'Failure(ERROR, "Bob Dole has failed me for the last time.")'
+	
+	failure = Failure(WARNING, "This is a sample warning.")
+	assert failure.level == WARNING
+	assert str(failure) == "This is a sample warning."
+
+
+def test_failure_concern_roundtrip():
+	child = Concern("Oh noes.")
+	original = Concern(CRITICAL, "{who} failed.", who="Bob Dole", concerns=[child])
+	failure = Failure.of(original)
+	
+	assert failure.level == CRITICAL
+	assert failure.concerns == [child]
+	assert str(failure) == str(original)
+	
+	concern = failure.concern()
+	assert isinstance(concern, Concern)
+	assert concern.level == CRITICAL
+	assert concern.concerns == [child]
+	assert str(concern) == str(original)
+
+
+def test_concern_pickle():
+	original = Concern("{0} failed {who}.", "Bob Dole", who="me", concerns=[Concern("Oh noes.")], path=(1, 'a'))
+	concern = pickle.loads(pickle.dumps(original))
+	
+	assert str(concern) == "Bob Dole failed me."
+	assert concern.path == (1, 'a')
+	assert str(concern) == str(original)
+	assert str(concern.concerns[0]) == "Oh noes."
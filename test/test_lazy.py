@@ -0,0 +1,56 @@
+import sys
+import pytest
+
+from subprocess import run
+
+import marrow.schema
+from marrow.schema import validate, transform
+from marrow.schema.lazy import exports
+
+
+def isolated(statement):
+	"""Execute the given statement in a new interpreter, returning its output."""
+	
+	result = run([sys.executable, '-c', statement], capture_output=True, text=True, check=True)
+	return result.stdout.strip()
+
+
+class TestExports(object):
+	def test_deferred(self):
+		loaded = isolated("import sys, marrow.schema.validate; print('marrow.schema.validate.base' in sys.modules)")
+		assert loaded == 'False'
+	
+	def test_patterns_deferred(self):
+		statement = "from marrow.schema.validate.util import expression; from marrow.schema.validate import network; " \
+				"print(expression.cache_info().currsize)"
+		assert isolated(statement) == '0'
+	
+	def test_resolution(self):
+		from marrow.schema.validate.base import Pattern
+		assert validate.Pattern is Pattern
+		assert 'Pattern' in vars(validate)  # Retained after first access.
+	
+	def test_submodule(self):
+		from marrow.schema.transform import complex
+		assert transform.complex is complex
+	
+	def test_star(self):
+		namespace = {}
+		exec('from marrow.schema.transform import *', namespace)
+		assert namespace['Integer'] is transform.Integer
+		assert 'complex' not in namespace
+	
+	def test_dir(self):
+		assert {'Container', 'Concern', 'validate'} <= set(dir(marrow.schema))
+	
+	def test_missing(self):
+		with pytest.raises(AttributeError):
+			validate.Missed
+		
+		with pytest.raises(ImportError):
+			from marrow.schema.validate import Missed
+	
+	def test_exports(self):
+		names, getattr_, dir_ = exports('marrow.schema.validate', {'.base': ('Range', )}, ('network', ))
+		assert names == ['Range']
+		assert getattr_('network') is sys.modules['marrow.schema.validate.network']
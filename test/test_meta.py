@@ -78,3 +78,53 @@ def test_element_construction_callback():  # Issue #7: https://github.com/marrow
 			cls.called = True
 	
 	assert TestElement.called
+
+
+def test_element_multiple_inheritance():
+	class First(Element):
+		foo = Element()
+		bar = Element()
+	
+	class Second(Element):
+		baz = Element()
+		diz = Element()
+	
+	class Combined(Second, First):
+		qux = Element()
+	
+	assert list(Combined.__attributes__.keys()) == ['foo', 'bar', 'baz', 'diz', 'qux']
+
+
+def test_element_older_declaration():
+	early = Element()
+	
+	class TestElement(Element):
+		foo = Element()
+		bar = Element()
+	
+	class ElementSubclass(TestElement):
+		baz = Element()
+		diz = early
+	
+	assert list(ElementSubclass.__attributes__.keys()) == ['diz', 'foo', 'bar', 'baz']
+	assert list(TestElement.__attributes__.keys()) == ['foo', 'bar']
+
+
+def test_element_annotations():
+	class Annotated(Element):
+		annotation = int
+	
+	class TestElement(Element):
+		foo = Annotated()
+		bar = Annotated()
+	
+	class ElementSubclass(TestElement):
+		bar: str
+		baz = Annotated()
+	
+	class Bare(ElementSubclass):
+		pass
+	
+	assert TestElement.__annotations__ == dict(foo=int, bar=int)
+	assert ElementSubclass.__annotations__ == dict(foo=int, bar=str, baz=int)
+	assert Bare.__annotations__ == dict(foo=int, bar=int, baz=int)
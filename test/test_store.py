@@ -0,0 +1,121 @@
+from copy import copy, deepcopy
+import pytest
+
+from marrow.schema import Container, Attribute, DataAttribute, Concern
+from marrow.schema.store import SlotStore
+from marrow.schema.validate import Validated, Range
+
+
+class Sample(Container):
+	__store__ = SlotStore
+	
+	foo = DataAttribute()
+	bar = Attribute(default=42)
+	baz = Attribute(name='bazzy')
+
+
+class Child(Sample):
+	diz = Attribute()
+
+
+class TestSlotStore:
+	def test_specialized(self):
+		assert Sample.__store__ is not SlotStore
+		assert issubclass(Sample.__store__, SlotStore)
+		assert Sample.__store__.__keys__ == ('foo', 'bar', 'bazzy')
+		assert not hasattr(Sample().__data__, '__dict__')
+	
+	def test_subclass_respecialized(self):
+		assert Child.__store__ is not Sample.__store__
+		assert Child.__store__.__generic__ is SlotStore
+		assert Child.__store__.__keys__ == ('foo', 'bar', 'bazzy', 'diz')
+	
+	def test_storage(self):
+		inst = Sample(27, baz=7)
+		assert inst.__data__ == dict(foo=27, bazzy=7)
+		assert inst.foo == 27
+		assert inst.bar == 42
+		assert inst.baz == 7
+	
+	def test_assignment_and_deletion(self):
+		inst = Sample()
+		assert len(inst.__data__) == 0
+		
+		inst.bar = 27
+		assert inst.__data__ == dict(bar=27)
+		assert 'bar' in inst.__data__
+		assert 'foo' not in inst.__data__
+		
+		del inst.bar
+		assert inst.bar == 42
+		assert 'bar' not in inst.__data__
+		
+		with pytest.raises(KeyError):
+			del inst.foo
+		
+		with pytest.raises(AttributeError):
+			inst.foo
+	
+	def test_get(self):
+		data = Sample(1).__data__
+		data['extra'] = 'value'
+		
+		assert data.get('foo') == 1
+		assert data.get('bar') is None
+		assert data.get('bar', 27) == 27
+		assert data.get('extra') == 'value'
+		assert data.get('missing', 27) == 27
+		assert Sample().__data__.get('missing', 27) == 27
+		assert 'foo' in data and 'extra' in data
+		assert 'bar' not in data and 'missing' not in data
+	
+	def test_copy(self):
+		inst = Sample(1)
+		inst.__data__['extra'] = 'value'
+		
+		assert copy(inst.__data__) == dict(foo=1, extra='value')
+		
+		clone = deepcopy(inst)
+		assert clone.__data__ == dict(foo=1, extra='value')
+		assert 'bar' not in clone.__data__
+		assert clone.bar == 42
+	
+	def test_declaration_order(self):
+		inst = Sample(baz=3, bar=2, foo=1)
+		assert list(inst.__data__) == ['foo', 'bar', 'bazzy']
+	
+	def test_overflow(self):
+		inst = Sample(1)
+		inst.__data__['extra'] = 'value'
+		
+		assert inst.__data__['extra'] == 'value'
+		assert list(inst.__data__) == ['foo', 'extra']
+		assert inst.__data__.copy() == dict(foo=1, extra='value')
+		
+		del inst.__data__['extra']
+		
+		with pytest.raises(KeyError):
+			inst.__data__['extra']
+		
+		with pytest.raises(KeyError):
+			del inst.__data__['missing']
+	
+	def test_compiled(self):
+		class Compiled(Sample):
+			__compiled__ = True
+		
+		assert Compiled(1, 2, 3).__data__ == dict(foo=1, bar=2, bazzy=3)
+	
+	def test_validated(self):
+		class Validating(Container):
+			__store__ = SlotStore
+			
+			value = Validated(validator=Range(1, 10))
+		
+		assert Validating(5).value == 5
+		
+		with pytest.raises(Concern):
+			Validating(27)
+	
+	def test_repr(self):
+		assert repr(Sample(1).__data__) == "SlotStore({'foo': 1})"
@@ -1,3 +1,7 @@
+import pytest
+
+from io import BytesIO, StringIO
+
 from marrow.schema.testing import TransformTest
 
 from marrow.schema.transform.container import Array, array
@@ -65,3 +69,90 @@ class TestArrayBoomNative(TransformTest):
 class TestArrayBoomForeign(TransformTest):
 	transform = Array(separator=27).foreign
 	invalid = ([], )
+
+
+class TestArrayLazy(object):
+	transform = Array(cast=None)
+	
+	def test_lazy(self):
+		result = self.transform.native("foo, bar,, baz")
+		assert not isinstance(result, list)
+		assert iter(result) is result
+		assert list(result) == ['foo', 'bar', 'baz']
+	
+	def test_lazy_iterable(self):
+		assert list(self.transform.native([1, ' 2 ', ''])) == ['1', '2']
+	
+	def test_lazy_whitespace(self):
+		result = Array(separator=None, cast=None).native(" foo  bar\tbaz ")
+		assert list(result) == ['foo', 'bar', 'baz']
+
+
+class TestArraySeparator(object):
+	def test_retained(self):
+		transform = Array(separator=' ; ')
+		assert transform.native("foo; bar") == TWO
+		assert transform.__dict__['_split'] == ';'
+		assert transform.foreign(TWO) == "foo;bar"
+	
+	def test_reassignment(self):
+		transform = Array()
+		assert transform.native("foo, bar") == TWO
+		
+		transform.separator = '|'
+		assert transform.native("foo| bar") == TWO
+		
+		transform.strip = False
+		assert transform.native("foo| bar") == RSPC
+		assert transform.foreign(TWO) == "foo|bar"
+		
+		del transform.separator
+		assert transform.native("foo, bar") == TWO  # The default, unstripped.
+
+
+class TestArrayUnicodeWhitespace(TransformTest):
+	transform = array.native
+	valid = (("foo\u00a0,\u2003bar", TWO), ("\u3000foo ,\nbar\r\n", TWO))
+
+
+class TestArrayStreaming(object):
+	TRANSFORMS = (array, Array(empty=True), Array(strip=False), Array(separator=None), Array(separator='||'),
+			Array(empty=True, none=True))
+	VALUES = ("foo,bar, baz   , , diz", "  foo ,bar,", "", "   ", "foo||bar|| baz||", "foo  bar\tbaz  ", "ü,é,ñ")
+	
+	@pytest.mark.parametrize('transform', TRANSFORMS)
+	@pytest.mark.parametrize('size', (1, 2, 3, 64))
+	def test_iterload(self, transform, size):
+		for value in self.VALUES:
+			expect = list(transform.native(value))
+			
+			assert list(transform.iterload(StringIO(value), size=size)) == expect
+			assert list(transform.iterload(BytesIO(value.encode('utf-8')), size=size)) == expect
+	
+	@pytest.mark.parametrize('transform', TRANSFORMS)
+	def test_iterdump(self, transform):
+		for value in (TWO, THREE, LSPC, ['ü', 'é'], []):
+			text, binary = StringIO(), BytesIO()
+			expect = transform.dumps(value)
+			
+			assert transform.iterdump(text, iter(value)) == len(expect)
+			assert text.getvalue() == expect
+			
+			transform.iterdump(binary, iter(value))
+			assert binary.getvalue() == expect.encode('utf-8')
+	
+	def test_iterload_blank(self):
+		assert list(Array(empty=True).iterload(StringIO(''))) == Array(empty=True).native('') == ['']
+		assert list(Array(empty=True).iterload(StringIO('  '), size=1)) == ['']
+		assert list(Array(empty=True, none=True).iterload(StringIO('  '))) == []
+		assert list(array.iterload(StringIO(''))) == []
+	
+	def test_encoding(self):
+		transform = Array(encoding='latin-1')
+		fh = BytesIO()
+		
+		transform.iterdump(fh, ['ü', 'é'])
+		assert fh.getvalue() == 'ü,é'.encode('latin-1')
+		
+		fh.seek(0)
+		assert list(transform.iterload(fh, size=1)) == ['ü', 'é']
@@ -1,9 +1,15 @@
+import asyncio
+
 from io import StringIO
 
+import pytest
+
 from marrow.schema.exc import Concern
 from marrow.schema.testing import TransformTest
 
-from marrow.schema.transform.base import BaseTransform, Transform, IngressTransform, EgressTransform, SplitTransform
+from marrow.schema.transform.base import BaseTransform, Transform, IngressTransform, EgressTransform, SplitTransform, \
+		CallbackTransform
+from marrow.schema.transform.container import Array
 
 
 PASSTHROUGH = (None, False, True, "", "Foo", 27, 42.0, [], {})
@@ -22,6 +28,10 @@ class TestForeignPassthrough(TransformTest):
 	
 	def test_load(self):
 		assert BaseTransform().load(StringIO(str("bar"))) == "bar"
+	
+	def test_iterload(self):
+		assert list(BaseTransform().iterload(StringIO("bar"))) == ['b', 'a', 'r']
+		assert list(BaseTransform().iterload(StringIO("  "))) == []
 
 
 class TestNativePassthrough(TransformTest):
@@ -35,6 +45,11 @@ class TestNativePassthrough(TransformTest):
 		fh = StringIO()
 		assert BaseTransform().dump(fh, "baz") == 3
 		assert fh.getvalue() == "baz"
+	
+	def test_iterdump(self):
+		fh = StringIO()
+		assert BaseTransform().iterdump(fh, iter("baz")) == 15
+		assert fh.getvalue() == "['b', 'a', 'z']"
 
 
 class TestTransform(TransformTest):
@@ -87,6 +102,10 @@ class TestSplitTransformReader(TransformTest):
 	
 	def test_load(self):
 		assert ST.load(StringIO(str("42"))) == 42
+	
+	def test_iterload(self):
+		split = SplitTransform(reader=Array(), writer=Array())
+		assert list(split.iterload(StringIO("27,42"), size=1)) == ['27', '42']
 
 
 class TestSplitTransformWriter(TransformTest):
@@ -100,3 +119,46 @@ class TestSplitTransformWriter(TransformTest):
 		fh = StringIO()
 		assert ST.dump(fh, 2.15) == 4
 		assert fh.getvalue() == "2.15"
+	
+	def test_iterdump(self):
+		split = SplitTransform(reader=Array(), writer=Array())
+		fh = StringIO()
+		assert split.iterdump(fh, iter(['27', '42'])) == 5
+		assert fh.getvalue() == "27,42"
+
+
+class TestAsynchronous(object):
+	@staticmethod
+	async def lookup(value):
+		await asyncio.sleep(0)
+		return {'1': 'one'}[value]
+	
+	def test_passthrough(self):
+		assert asyncio.run(BaseTransform().anative(27)) == 27
+		assert asyncio.run(Transform().anative(b" Foo ")) == "Foo"
+		assert asyncio.run(ST.anative('27')) == 27
+		assert asyncio.run(ST.aforeign(27)) == '27'
+	
+	def test_ingress(self):
+		transform = CallbackTransform(ingress=self.lookup, egress=self.lookup)
+		assert asyncio.run(transform.anative(' 1 ')) == 'one'
+		assert asyncio.run(transform.anative(None)) is None
+		assert asyncio.run(transform.aforeign('1')) == 'one'
+		
+		with pytest.raises(Concern) as exc:
+			asyncio.run(transform.anative('2'))
+		
+		assert 'incoming' in str(exc.value)
+		
+		with pytest.raises(Concern) as exc:
+			asyncio.run(transform.aforeign('2'))
+		
+		assert 'outgoing' in str(exc.value)
+	
+	def test_synchronous(self):
+		assert asyncio.run(IngressTransform(ingress=int).anative('42')) == 42
+		assert asyncio.run(EgressTransform(egress=str).aforeign(42)) == '42'
+		
+		with pytest.raises(Concern):
+			asyncio.run(IngressTransform(ingress=int).anative('x'))
+
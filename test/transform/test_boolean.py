@@ -1,3 +1,6 @@
+import pytest
+
+from marrow.schema import Concern
 from marrow.schema.testing import TransformTest
 
 from marrow.schema.transform.type import Boolean, boolean, WebBoolean, web_boolean
@@ -62,3 +65,37 @@ class TestWebBooleanNative(TransformTest):
 class TestWebBooleanForeign(TransformTest):
 	transform = web_boolean.foreign
 	valid = [(i, bool(i)) for i in (0, 1, False, True)]
+
+
+class TestBooleanTable(object):
+	def test_reassignment(self):
+		transform = Boolean()
+		assert transform.native('yes') is True
+		
+		transform.truthy = ('oui', )
+		assert transform.native('OUI') is True
+		
+		with pytest.raises(Concern):
+			transform.native('yes')
+	
+	def test_invalidate(self):
+		truthy = ['yes']
+		transform = Boolean(truthy=truthy)
+		
+		with pytest.raises(Concern):
+			transform.native('ja')
+		
+		truthy.append('ja')
+		transform.invalidate()
+		assert transform.native('ja') is True
+	
+	def test_precedence(self):
+		transform = Boolean(truthy=('maybe', ), falsy=('maybe', 'no'))
+		assert transform.native('maybe') is True
+		assert transform.native('no') is False
+	
+	def test_unhashable(self):
+		transform = Boolean(truthy=('yes', ['oui']), falsy=('no', ))
+		assert transform.native('YES') is True
+		assert transform.native('no') is False
+		assert transform.foreign(True) == 'yes'
@@ -1,4 +1,8 @@
+import pytest
+
+from marrow.schema import Concern
 from marrow.schema.testing import TransformTest
+from marrow.schema.transform import CallbackTransform
 
 from marrow.schema.transform.type import Integer, integer, Decimal, decimal, Number, number
 
@@ -8,6 +12,11 @@ FLOTS = ('1.5', '-27.0', '0.0', '-0.0')
 INV = ('a', 'fourty two', '0x27')
 
 
+class Cents(Integer):
+	def native(self, value, context=None):
+		return super().native(value, context) * 100
+
+
 class TestIntegerNative(TransformTest):
 	transform = integer.native
 	valid = tuple((i, int(i)) for i in INTS)
@@ -39,3 +48,77 @@ class TestNumberNative(TransformTest):
 class TestNumberForeign(TransformTest):
 	transform = number.foreign
 	valid = tuple((int(i), i) for i in INTS) + tuple((float(i), i) for i in FLOTS)
+
+
+class TestMany:
+	def test_integer(self):
+		assert integer.native_many(INTS + (' 7 ', b'8')) == [1, 5, -27, 7, 8]
+		assert integer.foreign_many([1, 5, -27]) == list(INTS)
+	
+	def test_decimal(self):
+		assert decimal.native_many(FLOTS + (b'2.5', )) == [float(i) for i in FLOTS] + [2.5]
+		assert decimal.foreign_many([float(i) for i in FLOTS]) == list(FLOTS)
+	
+	def test_number(self):
+		result = number.native_many(INTS + FLOTS)
+		assert result == [int(i) for i in INTS] + [float(i) for i in FLOTS]
+		assert [type(i) for i in result] == [int] * len(INTS) + [float] * len(FLOTS)
+	
+	def test_none(self):
+		assert Integer(none=True).native_many(['1', '', None, ' ']) == [1, None, None, None]
+	
+	def test_overridden(self):
+		assert Cents().native_many(['1', '2']) == [Cents().native('1'), Cents().native('2')] == [100, 200]
+	
+	def test_failures(self):
+		with pytest.raises(Concern) as excinfo:
+			integer.native_many(['1', 'a', '3', 'fourty two'])
+		
+		concern = excinfo.value
+		assert str(concern) == "Unable to transform 2 of 4 incoming values."
+		assert [c.args[2] for c in concern.concerns] == [1, 3]
+		assert str(concern.concerns[0]).startswith("Unable to transform incoming value 'a' at index 1: ")
+	
+	def test_foreign_failures(self):
+		with pytest.raises(Concern) as excinfo:
+			CallbackTransform(ingress=int, egress='{0:d}'.format).foreign_many([1, 'a'])
+		
+		assert [c.args[2] for c in excinfo.value.concerns] == [1]
+
+
+class TestManyArrays:
+	numpy = pytest.importorskip('numpy')
+	
+	def test_integer(self):
+		result = integer.native_many(self.numpy.array(INTS))
+		assert result.dtype == self.numpy.int64
+		assert result.tolist() == [int(i) for i in INTS]
+	
+	def test_integer_fallback(self):
+		result = integer.native_many(self.numpy.array(['1', '99999999999999999999']))
+		assert result == [1, 99999999999999999999]
+		
+		with pytest.raises(Concern) as excinfo:
+			integer.native_many(self.numpy.array(INTS + INV))
+		
+		assert [c.args[2] for c in excinfo.value.concerns] == [3, 4, 5]
+	
+	def test_number(self):
+		assert number.native_many(self.numpy.array(INTS)).dtype == self.numpy.int64
+		assert number.native_many(self.numpy.array(FLOTS)).tolist() == [float(i) for i in FLOTS]
+		assert number.native_many(self.numpy.array([1.5, 2.5])) == [1, 2]  # As per ingress, truncating.
+	
+	def test_overridden(self):
+		assert Cents().native_many(self.numpy.array(['1', '2'])) == [100, 200]
+		assert Cents().native_many(self.numpy.array([1, 2])) == [100, 200]
+	
+	def test_foreign(self):
+		assert number.foreign_many(self.numpy.array([1.5, -27.0])) == ['1.5', '-27.0']
+		assert integer.foreign_many(self.numpy.array([1, 5])) == ['1', '5']
+	
+	def test_unrepresentable(self):
+		assert integer.native_many(self.numpy.array([1.5, -2.5])) == [1, -2]
+		assert integer.native_many(self.numpy.array([2 ** 63], dtype='uint64')) == [2 ** 63]
+		
+		with pytest.raises(Concern):
+			integer.native_many(self.numpy.array([1.0, float('inf')]))
@@ -1,6 +1,10 @@
+import pytest
+
+from io import BytesIO, StringIO
+
 from marrow.schema.testing import TransformTest
 
-from marrow.schema.transform.complex import TokenPatternAttribute, Token, tags, terms
+from marrow.schema.transform.complex import TokenPatternAttribute, Token, tags, tag_search, terms, token_pattern
 
 
 class TestTokenGeneral(object):
@@ -101,3 +105,124 @@ class TestTokenDictionaryForeign(TransformTest):
 		
 		return self.separators[0].join(sorted(value) if self.sort else value)
 	'''
+
+
+class TestTokenStreaming(object):
+	TRANSFORMS = (tags, tag_search, terms, Token(), Token(quotes=None), Token(groups=[None, '+', '-'], group=tuple),
+			Token(separators=' \t,', normalize=lambda s: s.lower().strip('"'), sort=True), Token(separators=','),
+			Token(separators=',;', quotes=None), Token(separators=',', groups=['+', '-'], group=dict))
+	VALUES = (
+			'animals +cat -dog +"medical treatment"',
+			'  "high altitude" "melting panda"  , Foo,,bar\t',
+			"it's a 'quoted phrase' \"unclosed quote",
+			'+ - "" ü "ñé á"',
+			'a "" b +"" -c',
+			'a, ,b',
+			' a , b ,, +c ,;\t',
+			'\t;, "x, y" ;-z',
+			'',
+		)
+	
+	def flatten(self, transform, value):
+		"""Reduce the result of native to the sequence of elements produced by iterload."""
+		
+		if value is None:
+			return []
+		
+		if not transform.groups:
+			return sorted(value) if isinstance(value, set) else list(value)
+		
+		if transform.group is dict:
+			return [(group, token) for group, tokens in value.items() for token in tokens]
+		
+		return [(group, token) for group, tokens in zip(transform.groups, value) for token in tokens]
+	
+	@pytest.mark.parametrize('transform', TRANSFORMS)
+	@pytest.mark.parametrize('size', (1, 2, 5, 64))
+	def test_iterload(self, transform, size):
+		for value in self.VALUES:
+			expect = self.flatten(transform, transform.native(value))
+			result = list(transform.iterload(StringIO(value), size=size))
+			encoded = list(transform.iterload(BytesIO(value.encode('utf-8')), size=size))
+			
+			if isinstance(transform.cast, type) and issubclass(transform.cast, set):
+				result, encoded = sorted(set(result), key=repr), sorted(set(encoded), key=repr)
+				expect = sorted(expect, key=repr)
+			elif transform.groups:
+				result, encoded = sorted(result, key=repr), sorted(encoded, key=repr)
+				expect = sorted(expect, key=repr)
+			
+			assert result == expect
+			assert encoded == expect
+	
+	@pytest.mark.parametrize('size', (1, 2, 3, 64))
+	def test_iterload_separators(self, size):
+		transform = Token(separators=',')
+		
+		assert transform.native('a, ,b') == ['a', 'b']
+		assert list(transform.iterload(StringIO('a, ,b'), size=size)) == ['a', 'b']
+		assert list(transform.iterload(StringIO(' a , b \t'), size=size)) == transform.native(' a , b \t')
+	
+	def test_iterload_ungrouped_terms(self):
+		assert list(terms.iterload(StringIO('a +b -c'))) == [(None, 'a'), ('+', 'b'), ('-', 'c')]
+		assert list(tag_search.iterload(StringIO('a "" b'))) == [(None, 'a'), (None, ''), (None, 'b')]
+		assert tag_search.native('a "" b')[None] == ['a', '', 'b']
+	
+	def test_iterdump(self):
+		value = ('high', 'altitude', 'melting pandas')
+		fh = StringIO()
+		
+		assert tags.iterdump(fh, iter(value)) == len(tags.dumps(value))
+		assert fh.getvalue() == tags.dumps(value)
+		
+		fh = BytesIO()
+		tags.iterdump(fh, ['ü', 'ñ é'])
+		assert fh.getvalue() == 'ü "ñ é"'.encode('utf-8')
+	
+	def test_iterdump_grouped(self):
+		transform = Token(group=dict, sort=True)
+		fh = StringIO()
+		
+		transform.iterdump(fh, [('+', 'foo'), ('-', 'baz'), ('+', 'bar')])
+		assert fh.getvalue() == transform.foreign({'+': ('foo', 'bar'), '-': ('baz', )})
+
+
+class TestTokenPatternCache(object):
+	def test_shared(self):
+		token_pattern.cache_clear()
+		
+		first = Token(groups=['+', '-'])
+		second = Token(groups=('+', '-'))
+		
+		assert first.pattern is second.pattern
+		
+		info = token_pattern.cache_info()
+		assert (info.hits, info.misses) == (1, 1)
+	
+	def test_distinct(self):
+		assert Token(separators=' ').pattern[1] is not Token(separators=',').pattern[1]
+	
+	def test_unhashable(self):
+		pattern, regex = Token(separators=[' ', ',']).pattern
+		assert regex.findall('foo,bar baz') == ['foo', 'bar', 'baz']
+
+
+class TestTokenGroupedSorted(TransformTest):
+	transform = Token(groups=[None, '+', '-'], group=tuple, sort=True).native
+	valid = (
+			('zebra +cat apple -dog +bat -ant', (['apple', 'zebra'], ['bat', 'cat'], ['ant', 'dog'])),
+		)
+
+
+class TestTokenUngroupedSorted(TransformTest):
+	transform = Token(groups=['-', '+'], sort=True).native
+	valid = (
+			('zebra +cat apple -dog +bat -ant', [('-', 'ant'), ('-', 'dog'), ('+', 'bat'), ('+', 'cat')]),
+		)
+
+
+class TestTagSearchNative(TransformTest):
+	transform = tag_search.native
+	valid = (
+			('Foo +BAR -baz, "Diz Bop"', {None: ['foo', 'diz bop'], '+': ['bar'], '-': ['baz']}),
+		)
@@ -1,9 +1,12 @@
 import re
+import asyncio
+import pytest
 
 from marrow.schema import Attribute, Concern, Container
 from marrow.schema.testing import ValidationTest
 from marrow.schema.validate.base import Always, Callback, Contains, Equal, Falsy, In, Instance, Length, Missing, \
 		Never, Pattern, Range, Required, Subclass, Truthy, Unique, Validated, Validator
+from marrow.schema.validate.util import ChoiceIndex, RegexAttribute, expression, linear
 
 
 class TestAlways(ValidationTest):
@@ -94,6 +97,113 @@ class TestInCallback(ValidationTest):
 	invalid = TestInSimple.invalid
 
 
+class TestInUnhashable(ValidationTest):
+	validator = In([1, ([2, 3], 'Pair'), ('x', 'Ex'), {'a': 1}]).validate
+	valid = (1, [2, 3], 'x', {'a': 1})
+	invalid = (2, [2], 'Ex', {'a': 2}, None)
+
+
+class TestInIndex(object):
+	def test_static_index_retained(self):
+		validator = In([1, 2, 3])
+		assert validator._index() is validator._index()
+		assert isinstance(validator._index(), ChoiceIndex)
+	
+	def test_reassignment(self):
+		validator = In([1, 2, 3])
+		validator.validate(1)
+		validator.choices = [4]
+		
+		assert validator.validate(4) == 4
+		
+		with pytest.raises(Concern):
+			validator.validate(1)
+	
+	def test_invalidate(self):
+		choices = [1, 2, 3]
+		validator = In(choices)
+		validator.validate(1)
+		choices.append(4)
+		
+		with pytest.raises(Concern):
+			validator.validate(4)
+		
+		validator.invalidate()
+		assert validator.validate(4) == 4
+	
+	def test_callback_uncached(self):
+		calls = []
+		validator = In(lambda: calls.append(None) or [1, 2])
+		
+		validator.validate(1)
+		validator.validate(2)
+		assert len(calls) == 2
+	
+	def test_callback_retained(self):
+		calls = []
+		validator = In(lambda: calls.append(None) or [1, 2], ttl=None)
+		
+		validator.validate(1)
+		validator.validate(2)
+		assert len(calls) == 1
+		
+		validator.invalidate()
+		validator.validate(1)
+		assert len(calls) == 2
+	
+	def test_callback_expiry(self):
+		calls = []
+		validator = In(lambda: calls.append(None) or [1, 2], ttl=-1)  # Always already expired.
+		
+		validator.validate(1)
+		validator.validate(2)
+		assert len(calls) == 2
+
+
+class TestAsynchronous(object):
+	def test_synchronous(self):
+		assert asyncio.run(Length(slice(1, 4)).avalidate('foo')) == 'foo'
+		
+		with pytest.raises(Concern):
+			asyncio.run(Length(slice(1, 4)).avalidate('foobar'))
+	
+	def test_custom(self):
+		class Upper(Validator):
+			def validate(self, value, context=None):
+				return super().validate(value, context).upper()
+		
+		assert asyncio.run(Upper().avalidate('foo')) == 'FOO'
+	
+	def test_callback(self):
+		async def positive(validator, value, context):
+			await asyncio.sleep(0)
+			return value if value > 0 else Concern("Not positive.")
+		
+		validator = Callback(positive)
+		assert asyncio.run(validator.avalidate(27)) == 27
+		
+		with pytest.raises(Concern) as exc:
+			asyncio.run(validator.avalidate(-1))
+		
+		assert str(exc.value) == "Not positive."
+	
+	def test_in(self):
+		calls = []
+		
+		async def choices():
+			calls.append(None)
+			return [1, 2]
+		
+		validator = In(choices, ttl=None)
+		assert asyncio.run(validator.avalidate(1)) == 1
+		
+		with pytest.raises(Concern):
+			asyncio.run(validator.avalidate(3))
+		
+		assert len(calls) == 1
+		assert asyncio.run(In([1, 2]).avalidate(2)) == 2
+
+
 class TestContains(object):
 	empty = Contains()
 	simple = Contains(27)
@@ -212,6 +322,82 @@ class TestPattern(object):
 			pass
 		else:
 			assert False, "Failed to raise a Concern."
+	
+	def test_limit(self):
+		validator = Pattern(r'^[a-z]+$', limit=5)
+		
+		assert validator.validate('abcde') == 'abcde'
+		
+		for validate in (validator.validate, validator.compile()):
+			with pytest.raises(Concern) as excinfo:
+				validate('a' * 6)
+			
+			assert 'maximum length of 5' in str(excinfo.value)
+		
+		assert validator.compile(check=True)('a' * 6).args == (5, )
+	
+	def test_deferred_default(self):
+		class Lower(Pattern):
+			pattern = RegexAttribute(default=r'^[a-z]+$', flags=re.I)
+		
+		validator = Lower()
+		assert 'pattern' not in validator.__data__
+		assert validator.validate('ABC') == 'ABC'
+		assert validator.pattern is validator.__data__['pattern']
+		assert validator.compile()('abc') == 'abc'
+	
+	def test_class_default(self):
+		class Lower(Pattern):
+			pattern = RegexAttribute(default=r'^[a-z]+$', flags=re.I)
+		
+		assert Lower.pattern.match('ABC')
+		assert Lower.pattern is Lower().pattern
+		assert isinstance(Pattern.pattern, RegexAttribute)  # Without a string default, the descriptor itself.
+	
+	def test_shared(self):
+		assert Pattern(r'^shared$').pattern is Pattern(r'^shared$').pattern
+		assert Pattern(r'^shared$').pattern is not Pattern(re.compile(r'^shared$', re.I)).pattern
+	
+	def test_deferred_assignment(self):
+		class Deferred(Pattern):
+			pattern = RegexAttribute(default=None, defer=True)
+		
+		validator = Deferred(r'^[a-z]+$')
+		assert validator.__data__['pattern'] == r'^[a-z]+$'
+		assert validator.validate('abc') == 'abc'
+		assert validator.__data__['pattern'] is expression(r'^[a-z]+$')
+		
+		broken = Deferred(r'^[a-z')  # Errors surface on first use, not assignment.
+		
+		with pytest.raises(re.error):
+			broken.validate('abc')
+	
+	def test_linear(self):
+		validator = Pattern(r'^[a-z]+$', linear=True)
+		
+		assert validator.validate('abc') == 'abc'
+		assert validator.compile()('abc') == 'abc'
+		assert validator.check('ABC') is not None
+		assert validator.compile(check=True)('abc!') is not None
+	
+	def test_linear_fallback(self):
+		for source in (r'^(a)\1$', r'^(?=a)a$', r'^\w+$'):  # Unsupported by RE2, or Unicode-aware.
+			regex = re.compile(source)
+			assert linear(regex) is regex
+		
+		assert linear(None) is None
+	
+	def test_linear_engine(self):
+		pytest.importorskip('re2')
+		
+		assert type(linear(re.compile(r'^[a-z]+$'))).__module__.startswith('re2')
+		assert linear(re.compile(r'^[a-z]+$', re.I)).match('ABC')
+		assert type(linear(re.compile(r'^\w+$', re.A))).__module__.startswith('re2')
+		
+		class Linear(Container):
+			pattern = RegexAttribute(default=None, linear=True)
+		
+		assert type(Linear(r'^a+$').pattern).__module__.startswith('re2')
 
 
 class TestInstance(object):
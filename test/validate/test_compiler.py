@@ -0,0 +1,133 @@
+import pytest
+
+from datetime import date, timedelta
+from numbers import Number
+
+from marrow.schema import Concern, Failure
+from marrow.schema.validate.base import Always, AlwaysMissing, AlwaysRequired, Callback, Contains, Equal, Falsy, \
+		In, Instance, Length, Missing, Never, Pattern, Range, Required, Subclass, Truthy, Unique, Validator, truthy
+from marrow.schema.validate.compound import All, Any, Pipe, Iterable
+from marrow.schema.validate.date import Date
+from marrow.schema.validate.geo import latitude, position
+from marrow.schema.validate.network import hostname, ipaddress, cidr, mac
+from marrow.schema.validate.pattern import uuid
+
+
+class Custom(Validator):
+	def validate(self, value, context=None):
+		value = super().validate(value, context)
+		
+		if value == 'custom':
+			raise Concern("No custom values.")
+		
+		return value
+
+
+class CustomRange(Custom, Range):
+	pass
+
+
+VALIDATORS = [
+		Always(), Never(), truthy, Truthy(), Truthy(True), Falsy(), Falsy(True), Required(), Required(True),
+		Missing(True), AlwaysMissing(), AlwaysRequired(), Callback(), Callback(lambda V, v, x: v),
+		Callback(lambda V, v, x: Concern("Uh, no.")), In(), In([1, 2, 3]), In(lambda: ['a', 'b']),
+		In([('a', 'Alpha'), ('b', 'Beta')]), Contains(), Contains(27), Contains(lambda: 'a'), Length(), Length(5),
+		Length(slice(1, 3)), Length(lambda: (1, 3)), Range(), Range(1, 10), Range(minimum=lambda: 5), Range(maximum=3),
+		Pattern(), Pattern(r'^[a-z]+$'), Instance(), Instance(str), Instance((int, float)), Subclass(),
+		Subclass(Number), Equal(), Equal(27), Equal(lambda: 'a'), Unique(), Custom(), CustomRange(1, 5),
+		Date(minimum=date(2000, 1, 1)), latitude, position, hostname, ipaddress, cidr, mac, uuid,
+		Any([Instance(str), Range(1, 5)]), All([Instance(str), Length(slice(1, 3))]), Pipe([Equal(1), Truthy(True)]),
+		All([Any([Equal(1), Equal(2)]), Pipe([Instance(int)])]), Iterable([Instance(int)]),
+	]
+
+VALUES = [
+		None, True, False, 0, 1, 4, 27, 3.5, '', 'a', 'abc', 'custom', 'ABC', [], [1, 2], [1, 1], (1, 2), {'a': 1},
+		int, bool, date(2010, 1, 1), date(1990, 1, 1), timedelta(1), (45, 90), (91, 0), '192.168.0.1', '::1',
+		'10.0.0.0/8', 'example.com', '01:23:45:67:89:ab', '12345678-1234-1234-1234-123456789abc',
+	]
+
+
+def outcome(validate, value):
+	try:
+		return 'value', validate(value)
+	except Concern as e:
+		try:
+			return 'concern', str(e), len(e.concerns)
+		except Exception as e:  # Some concerns are unrepresentable; this should be equally so.
+			return 'broken', e.__class__
+	except Exception as e:
+		return 'error', e.__class__
+
+
+@pytest.mark.parametrize('validator', VALIDATORS)
+def test_compiled_equivalence(validator):
+	compiled = validator.compile()
+	
+	for value in VALUES:
+		assert outcome(compiled, value) == outcome(validator.validate, value), value
+
+
+@pytest.mark.parametrize('validator', VALIDATORS)
+def test_check_equivalence(validator):
+	checked = validator.compile(check=True)
+	
+	for value in VALUES:
+		expect = outcome(validator.validate, value)
+		
+		if expect[0] == 'error':
+			assert outcome(checked, value) == expect, value
+			assert outcome(validator.check, value) == expect, value
+			continue
+		
+		result = checked(value)
+		
+		if expect[0] == 'value':
+			assert result is None, value
+			assert validator.check(value) is None, value
+			continue
+		
+		assert isinstance(result, Failure), value
+		assert isinstance(validator.check(value), Failure), value
+		
+		if expect[0] == 'concern':
+			assert ('concern', str(result), len(result.concerns)) == expect, value
+
+
+def test_check_preallocated():
+	checked = In([1, 2, 3]).compile(check=True)
+	
+	assert checked(4) is checked(5)
+	assert 'raise' not in checked.__source__
+	assert str(checked(4)) == "Value is not in allowed list."
+
+
+def test_check_fallback():
+	checked = All([Custom(), Range(1, 5)]).compile(check=True)
+	
+	assert checked(3) is None
+	assert str(checked('custom')) == "No custom values."
+	assert str(checked(7)) == "Out of bounds; must be greater than 1 and less than 5."
+
+
+def test_flattening():
+	source = hostname.compile().__source__
+	assert '_validate' not in source, "Hostname should be flattened completely."
+	
+	source = Date(minimum=date(2000, 1, 1)).compile().__source__
+	assert source.index('Too small') < source.index('not an instance'), "Cooperative order must be preserved."
+
+
+def test_uncompilable_fallback():
+	source = CustomRange(1, 5).compile().__source__
+	assert '_validate' in source
+
+
+def test_dynamic_attributes():
+	limit = [5]
+	compiled = Range(maximum=lambda: limit[0]).compile()
+	
+	assert compiled(4) == 4
+	limit[0] = 3
+	
+	with pytest.raises(Concern):
+		compiled(4)
@@ -1,8 +1,19 @@
 import re
+import json
+import pickle
+import asyncio
 
+from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import pytest
+
+from marrow.schema import Container, Attribute
+from marrow.schema.exc import ElementMessage
 from marrow.schema.testing import ValidationTest
-from marrow.schema.validate.base import AlwaysRequired, Instance, Length, falsy, truthy, Concern
-from marrow.schema.validate.compound import All, Any, Compound, Iterable, Mapping, Pipe
+from marrow.schema.validate.base import AlwaysRequired, Instance, Length, Pattern, Range, Validated, Callback, falsy, truthy, Concern
+from marrow.schema.validate.compound import All, Any, AnyPattern, Compound, Iterable, Mapping, Pipe, \
+		Schema, Deferred, fields
 
 
 length = Length(slice(1, 21))
@@ -44,6 +55,78 @@ class TestAny(ValidationTest):
 			assert False, "Failed to raise a Concern."
 
 
+class TestAnyPattern(ValidationTest):
+	patterns = (
+			Pattern(r'^[a-z]+$'),
+			Pattern(re.compile(r'^[0-9]+$')),
+			Pattern(re.compile(r'^x(?P<y>y)z$', re.I)),
+			Pattern(re.compile(r'^a.b$', re.S)),
+		)
+	
+	validator = AnyPattern(patterns).validate
+	valid = ('abc', '123', 'XYZ', 'a\nb', None)
+	invalid = ('', 'ABC', 'a1', 'xy!')
+	
+	def test_combined(self):
+		assert AnyPattern(self.patterns)._alternation() is not None
+	
+	def test_matching(self):
+		validator = AnyPattern(self.patterns)
+		
+		assert validator.matching('abc') is self.patterns[0]
+		assert validator.matching('xYz') is self.patterns[2]
+		assert validator.matching('a1') is None
+	
+	def test_equivalence(self):
+		combined, sequential = AnyPattern(self.patterns), Any(self.patterns)
+		
+		for value in self.valid + self.invalid:
+			assert (combined.check(value) is None) is (sequential.check(value) is None)
+			assert (combined.compile(check=True)(value) is None) is (sequential.check(value) is None)
+	
+	def test_failure_concerns(self):
+		validator = AnyPattern(self.patterns)
+		
+		for validate in (validator.validate, validator.compile()):
+			with pytest.raises(Concern) as exc:
+				validate('a1')
+			
+			assert str(exc.value) == "All validators failed."
+			assert [str(concern) for concern in exc.value.concerns] == ["Failed to match required pattern."] * 4
+		
+		assert len(validator.compile(check=True)('a1').concerns) == 4
+	
+	def test_fallback(self):
+		patterns = (Pattern(r'^(a)\1$'), Pattern(r'^b'))
+		validator = AnyPattern(patterns)
+		
+		assert validator._alternation() is None
+		assert validator.validate('aa') == 'aa'
+		assert validator.compile()('b') == 'b'
+		assert validator.matching('bee') is patterns[1]
+		
+		try:
+			validator.validate('c')
+		except Concern as e:
+			assert len(e.concerns) == 2
+		else:
+			assert False, "Failed to raise a Concern."
+	
+	def test_mixed_fallback(self):
+		validator = AnyPattern([Pattern(r'^a$'), Length(slice(1, 2))])
+		
+		assert validator._alternation() is None
+		assert validator.validate('b') == 'b'
+	
+	def test_invalidation(self):
+		validator = AnyPattern([Pattern(r'^a$')])
+		assert validator.validate('a') == 'a'
+		
+		validator.validators = [Pattern(r'^b$')]
+		assert validator.validate('b') == 'b'
+		assert validator.check('a') is not None
+
+
 class TestAll(ValidationTest):
 	validator = SampleAll((length, )).validate
 	valid = ('Testing.', )
@@ -151,3 +234,401 @@ class TestMappingConcerns(object):
 		except Concern as e:
 			assert "multiple" in e.message.lower(), "Should indicate multiple failures."
 			assert "dole" in e.concerns[0].message or "dole" in e.concerns[1].message, "Should identify element failing validation."
+
+
+class TestCollection(object):
+	def test_path(self):
+		document = Iterable([Mapping([Iterable([truthy])])])
+		
+		with pytest.raises(Concern) as exc:
+			document.validate([{'a': [1, 1]}, {'b': [1, 0, 1]}])
+		
+		assert exc.value.path == (1, 'b', 1)
+		assert str(exc.value) == "Element 1: Element 'b': Element 1: Value is missing or empty."
+		assert document.check([{'a': [0]}]).path == (0, 'a', 0)
+	
+	def test_nested_path(self):
+		with pytest.raises(Concern) as exc:
+			Iterable([Mapping([truthy])]).validate([{}, {'a': 0, 'b': 0}])
+		
+		assert exc.value.path == (1, )
+		assert [concern.path for concern in exc.value.concerns] == [('a', ), ('b', )]
+	
+	def test_max_concerns(self):
+		with pytest.raises(Concern) as exc:
+			Iterable([truthy], max_concerns=3).validate([0] * 100000)
+		
+		assert [concern.path for concern in exc.value.concerns] == [(0, ), (1, ), (2, )]
+	
+	def test_scheme_reuse(self):
+		validator = Iterable([truthy])
+		assert validator._require() == validator._require()
+		assert validator._require(1000) is validator._require()  # Compiled, once enough elements are validated.
+		
+		validator.validators = [falsy]
+		validator.validate([0, False])
+		
+		validator.require = Any
+		validator.validators = [truthy, falsy]
+		validator.validate([0, 1])
+	
+	def test_child_alteration(self):
+		child = Range(1, 10)
+		validator = Iterable([child])
+		
+		for size in (1, 100):  # Whether or not the base scheme has been compiled.
+			child.maximum = 10
+			assert validator.validate([5] * size)
+			
+			child.maximum = 4
+			
+			with pytest.raises(Concern):
+				validator.validate([5] * size)
+	
+	def test_grandchild_alteration(self):
+		child = Range(1, 10)
+		validator = Iterable([All([child])])
+		
+		validator.validate([5] * 100)
+		child.maximum = 4
+		
+		with pytest.raises(Concern):
+			validator.validate([5] * 100)
+	
+	def test_unrelated_alteration(self):
+		validator = Iterable([Range(1, 10)])
+		validator.validate([5] * 100)
+		compiled = validator.__dict__['_compiled']
+		
+		other = Range(1, 10)
+		other.maximum = 4  # Not within the scheme of the collection, which is retained.
+		
+		assert validator.validate([5] * 100)
+		assert validator.__dict__['_compiled'] is compiled
+		
+		clone = deepcopy(validator.validators[0])  # Copies are not retained by the original's collections.
+		clone.maximum = 4
+		
+		assert validator.__dict__['_compiled'] is compiled
+	
+	def test_invalidate(self):
+		validator = Iterable(validators=[truthy])
+		validator.validate([1] * 100)
+		validator.validators.append(Instance(int))  # In-place, and so not noticed.
+		assert validator.validate(['a'] * 100)
+		
+		validator.invalidate()
+		
+		with pytest.raises(Concern):
+			validator.validate(['a'] * 100)
+
+
+class TestParallel(object):
+	values = [1, 0, 1, 'a', 1, 0, 1, 1, 0] * 10
+	
+	def _do(self, executor, limit=None):
+		validator = Iterable([Instance(int), truthy], executor=executor, threshold=10, chunksize=7, max_concerns=limit)
+		serial = Iterable([Instance(int), truthy], max_concerns=limit)
+		
+		with pytest.raises(Concern) as expect:
+			serial.validate(self.values)
+		
+		with pytest.raises(Concern) as exc:
+			validator.validate(self.values)
+		
+		assert [concern.path for concern in exc.value.concerns] == [concern.path for concern in expect.value.concerns]
+		assert [str(concern) for concern in exc.value.concerns] == [str(concern) for concern in expect.value.concerns]
+		
+		validator.validate(list(range(1, 100)))
+		validator.validate([1])  # Below the threshold.
+	
+	def test_threads(self):
+		with ThreadPoolExecutor(2) as executor:
+			self._do(executor)
+			self._do(executor, 5)
+	
+	def test_processes(self):
+		with ProcessPoolExecutor(2) as executor:
+			self._do(executor, 5)
+	
+	def test_mapping(self):
+		with ThreadPoolExecutor(2) as executor:
+			with pytest.raises(Concern) as exc:
+				Mapping([truthy], executor=executor, threshold=2, chunksize=2).validate({'a': 1, 'b': 0, 'c': 1, 'd': 0})
+		
+		assert [concern.path for concern in exc.value.concerns] == [('b', ), ('d', )]
+	
+	def test_pickle(self):
+		validator = Iterable([truthy])
+		validator.validate([1] * 100)
+		
+		assert pickle.loads(pickle.dumps(validator)).validate([1, 2]) == [1, 2]
+
+
+class TestAsynchronous(object):
+	@staticmethod
+	def delayed(delay, valid=True):
+		"""Produce a validator waiting for the given number of seconds before passing or failing."""
+		
+		async def validate(validator, value, context):
+			await asyncio.sleep(delay)
+			return value if valid else Concern("Failed after {0}.", delay)
+		
+		return Callback(validate)
+	
+	def _do(self, validator, value):
+		return asyncio.run(validator.avalidate(value))
+	
+	def test_any(self):
+		assert self._do(SampleAny((length, )), 'Foo') == 'Foo'
+		
+		with pytest.raises(Concern) as exc:
+			self._do(SampleAny((length, )), [])
+		
+		assert len(exc.value.concerns) == 3
+	
+	def test_any_concurrent(self):
+		validator = Any([self.delayed(0.2, False), self.delayed(0.2), self.delayed(0.2)])
+		
+		async def timed():
+			loop = asyncio.get_running_loop()
+			start = loop.time()
+			await validator.avalidate(27)
+			return loop.time() - start
+		
+		assert asyncio.run(timed()) < 0.4
+	
+	def test_any_first(self):
+		slow, fast = self.delayed(0.01), Callback(lambda validator, value, context: value * 2)
+		assert self._do(Any([slow, fast]), 1) == 1
+	
+	def test_all(self):
+		assert self._do(SampleAll((length, )), 'Testing.') == 'Testing.'
+		
+		with pytest.raises(Concern) as exc:
+			self._do(All([self.delayed(0, False), self.delayed(0.01, False)]), 1)
+		
+		assert str(exc.value) == "Failed after 0."
+	
+	def test_pipe(self):
+		with pytest.raises(Concern) as exc:
+			self._do(Pipe([self.delayed(0, False), self.delayed(0), self.delayed(0.01, False)]), 1)
+		
+		assert len(exc.value.concerns) == 2
+	
+	def test_iterable(self):
+		document = Iterable([Mapping([Iterable([truthy])])])
+		assert self._do(document, [{'a': [1]}]) == [{'a': [1]}]
+		
+		with pytest.raises(Concern) as exc:
+			self._do(document, [{'a': [1, 1]}, {'b': [1, 0, 1]}])
+		
+		assert exc.value.path == (1, 'b', 1)
+		
+		with pytest.raises(Concern):
+			self._do(Iterable(), None)
+		
+		with pytest.raises(Concern):
+			self._do(Mapping(), [])
+	
+	def test_iterable_concurrent(self):
+		validator = Iterable([self.delayed(0.2)])
+		
+		async def timed():
+			loop = asyncio.get_running_loop()
+			start = loop.time()
+			await validator.avalidate(list(range(10)))
+			return loop.time() - start
+		
+		assert asyncio.run(timed()) < 1
+	
+	@pytest.mark.skipif(not hasattr(asyncio, 'timeout'), reason="Requires Python 3.11 or later.")
+	def test_element_timeout(self):
+		async def bounded(validator, value, context):
+			try:
+				async with asyncio.timeout(0.05):
+					await asyncio.sleep(value)
+			except TimeoutError:
+				return Concern("Timed out.")
+			
+			return value
+		
+		with pytest.raises(Concern) as exc:
+			self._do(Iterable([Callback(bounded)]), [0, 2])
+		
+		assert exc.value.path == (1, )
+		assert str(exc.value) == "Element 1: Timed out."
+	
+	def test_max_concerns(self):
+		with pytest.raises(Concern) as exc:
+			self._do(Iterable([truthy], max_concerns=2, chunksize=3), [0] * 10)
+		
+		assert [concern.path for concern in exc.value.concerns] == [(0, ), (1, )]
+	
+	def test_schema(self):
+		assert self._do(Schema(Person), dict(name='Bob', age=42)) == dict(name='Bob', age=42)
+		
+		with pytest.raises(Concern) as exc:
+			self._do(Schema(Person), dict(name=27, age=0))
+		
+		assert [concern.path for concern in exc.value.concerns] == [('name', ), ('age', )]
+
+
+class TestElementMessage(object):
+	def test_lazy(self):
+		message = ElementMessage(2, "Value is bad.")
+		
+		assert str(message) == "Element 2: Value is bad."
+		assert message == "Element 2: Value is bad."
+		assert "Element 2" in message
+		assert message.lower().startswith("element 2")
+		assert "Oh, " + message == "Oh, Element 2: Value is bad."
+	
+	def test_mapping_key(self):
+		assert str(ElementMessage('dole', "Value is bad.")) == "Element 'dole': Value is bad."
+	
+	def test_pickle(self):
+		message = ElementMessage(2, "Value is bad.")
+		assert pickle.loads(pickle.dumps(message)) == message
+	
+	def test_concern_message(self):
+		with pytest.raises(Concern) as exc:
+			Iterable([truthy]).validate([1, 0])
+		
+		assert type(exc.value.message) is str
+		assert exc.value.message == "Element 1: Value is missing or empty."
+		assert json.dumps(exc.value.message) == '"Element 1: Value is missing or empty."'
+		assert "Oh, " + exc.value.message == "Oh, Element 1: Value is missing or empty."
+		assert exc.value.message is exc.value.message  # Rendered once, then retained.
+	
+	def test_nested_message(self):
+		with pytest.raises(Concern) as exc:
+			Mapping([Iterable([truthy])]).validate({'a': [1, 0]})
+		
+		assert type(exc.value.message) is str
+		assert exc.value.message == "Element 'a': Element 1: Value is missing or empty."
+		assert exc.value.path == ('a', 1)
+		
+		clone = pickle.loads(pickle.dumps(exc.value))
+		assert type(clone.message) is str
+		assert clone.message == exc.value.message
+	
+	def test_failure_message(self):
+		failure = Iterable([truthy]).check([1, 0])
+		
+		assert type(failure.message) is str
+		assert failure.message == "Element 1: Value is missing or empty."
+		assert failure.concern().message == failure.message
+
+
+class Person(Container):
+	name = Validated(validator=Instance(str))
+	note = Attribute(default=None)
+	age = Validated('years', validator=Range(1, 150))
+
+
+class TestSchema(ValidationTest):
+	validator = Schema(Person).validate
+	valid = (Person('Alice', age=27), Person(), dict(name='Bob', age=42), dict(note=27), {})
+	invalid = (27, None, [], dict(name=27), dict(age=0), dict(name=None, age=200))
+	
+	def test_fields(self):
+		assert [(name, key) for name, key, attribute in fields(Person)] == [('name', 'name'), ('age', 'years')]
+		assert fields(Person) is fields(Person)
+	
+	def test_instance(self):
+		record = Person('Alice', age=27)
+		assert Schema().validate(record) is record
+		
+		record.__data__['years'] = 200  # Bypassing validation on assignment.
+		
+		with pytest.raises(Concern) as exc:
+			Schema().validate(record)
+		
+		assert "'age'" in exc.value.message
+		assert not exc.value.concerns
+	
+	def test_mapping_requires_schema(self):
+		with pytest.raises(Concern):
+			Schema().validate(dict(name='Alice'))
+	
+	def test_multiple_failure(self):
+		with pytest.raises(Concern) as exc:
+			Schema(Person).validate(dict(name=27, age=0))
+		
+		assert "multiple" in exc.value.message.lower()
+		assert [str(concern.message).partition(':')[0] for concern in exc.value.concerns] == \
+				["Element 'name'", "Element 'age'"]
+	
+	def test_context(self):
+		seen = []
+		
+		class Recording(Container):
+			value = Validated(validator=Callback(lambda validator, value, context: seen.append(context)))
+		
+		record = dict(value=27)
+		Schema(Recording).validate(record)
+		assert seen == [record]
+
+
+class TestDeferred(object):
+	def test_immediate(self):
+		with Deferred():
+			pass
+		
+		with pytest.raises(Concern):
+			Person(age=0)
+	
+	def test_deferred(self):
+		with Deferred() as batch:
+			valid = Person('Alice', age=27)
+			invalid = Person(27, age=0)
+			invalid.note = "Not validated."
+			plain = Person(note=27)
+			invalid.name = 42
+		
+		assert invalid.name == 42
+		assert batch.records == [valid, invalid]
+		
+		failures = batch.commit()
+		assert list(failures) == [1]
+		assert "multiple" in failures[1].message.lower()
+		assert [str(failure) for failure in failures[1].concerns] == [
+				"Element 'name': Value is not an instance of <class 'str'>.",
+				"Element 'age': Out of bounds; must be greater than 1 and less than 150.",
+			]
+	
+	def test_nested(self):
+		with Deferred() as outer:
+			first = Person(age=0)
+			
+			with Deferred() as inner:
+				second = Person(age=0)
+			
+			third = Person(age=27)
+		
+		assert outer.records == [first, third]
+		assert inner.records == [second]
+	
+	def test_alteration(self):
+		with Deferred() as batch:
+			people = [Person('Alice', age=100) for i in range(100)]
+		
+		assert not batch.commit()
+		
+		validator = Person.__attributes__['age'].validator
+		maximum, validator.maximum = validator.maximum, 50
+		
+		try:  # Nothing compiled is retained between commits.
+			assert len(batch.commit()) == 100
+		finally:
+			validator.maximum = maximum
+	
+	def test_compiled(self):
+		with Deferred() as batch:
+			people = [Person(str(i), age=i * 2) for i in range(100)]
+		
+		failures = batch.commit()
+		assert list(failures) == [0] + list(range(76, 100))
+		assert str(failures[0]) == "Element 'age': Out of bounds; must be greater than 1 and less than 150."
+		assert not Deferred().commit()
@@ -0,0 +1,147 @@
+import pickle
+
+import pytest
+
+from marrow.schema import Concern, Failure
+from marrow.schema.validate.base import MANY, Always, Equal, In, Instance, Length, Never, Pattern, Range
+from marrow.schema.validate.compound import All, Any, Pipe
+
+
+VALIDATORS = (
+		Always(),
+		Never(),
+		Range(5, 10),
+		Range(None, 5),
+		Equal(27),
+		In([1, 2, 3]),
+		Instance(int),
+		Length(slice(1, 3)),
+		Pattern(r'^[a-z]+$'),
+		All([Range(0, 20), In([1, 5, 27])]),
+		Any([Range(None, 2), Equal(7)]),
+		Pipe([Range(1, None), Range(None, 9)]),
+	)
+
+
+def scalar(validator, values):
+	failures = {}
+	
+	for i, value in enumerate(values):
+		try:
+			validator.validate(value)
+		except Concern as e:
+			failures[i] = e
+	
+	return failures
+
+
+@pytest.mark.parametrize('size', (4, MANY * 2))
+@pytest.mark.parametrize('validator', VALIDATORS)
+def test_equivalence(validator, size):
+	values = [i % 30 if i % 3 else (i % 30) + 0.5 for i in range(size)]
+	
+	if isinstance(validator, (Length, Pattern)):
+		values = ['a' * (i % 5) if i % 2 else 'A' for i in range(size)]
+	
+	expect = scalar(validator, values)
+	result = validator.validate_many(values)
+	
+	assert set(result) == set(expect)
+	assert all(isinstance(failure, Failure) for failure in result.values())
+	assert [str(concern) for concern in result.values()] == [str(concern) for concern in expect.values()]
+
+
+class TestValidateMany(object):
+	def test_empty(self):
+		assert Range(1, 2).validate_many([]) == {}
+		assert Range(1, 2).validate_many([], mask=True) == []
+		assert Range(1, 2).validate_many(iter(()), mask=True) == []
+	
+	def test_mask(self):
+		assert Range(1, 5).validate_many([0, 1, 5, 6], mask=True) == [False, True, True, False]
+	
+	def test_generator(self):
+		result = Range(1, 5).validate_many(i for i in range(MANY * 2))
+		assert sorted(result) == [0] + list(range(6, MANY * 2))
+	
+	def test_retained(self):
+		validator = Range(1, 5)
+		values = list(range(MANY))
+		
+		validator.validate_many(values)
+		check = validator.__dict__['_check']
+		
+		validator.validate_many(values)
+		assert validator.__dict__['_check'] is check
+	
+	def test_alteration(self):
+		validator = Range(1, 5)
+		values = list(range(MANY))
+		
+		assert len(validator.validate_many(values)) == MANY - 5
+		
+		validator.maximum = 10
+		assert len(validator.validate_many(values)) == MANY - 10
+		
+		del validator.maximum
+		assert len(validator.validate_many(values)) == 1
+	
+	def test_child_alteration(self):
+		child = Range(1, 5)
+		validator = All([Instance(int), Pipe([child])])
+		values = list(range(MANY))
+		
+		assert len(validator.validate_many(values)) == MANY - 5
+		
+		child.maximum = 10
+		assert len(validator.validate_many(values)) == MANY - 10
+	
+	def test_pickle(self):
+		validator = Range(1, 5)
+		validator.validate_many(list(range(MANY)))
+		
+		clone = pickle.loads(pickle.dumps(validator))
+		assert '_check' not in clone.__dict__
+		assert len(clone.validate_many(list(range(MANY)))) == MANY - 5
+
+
+class TestVectorized(object):
+	numpy = pytest.importorskip('numpy')
+	
+	def _check(self, validator, values, vectorized=True):
+		expect = scalar(validator, list(values))
+		mask = validator.validate_many(values, mask=True)
+		
+		assert isinstance(mask, self.numpy.ndarray) is vectorized
+		assert list(mask) == [i not in expect for i in range(len(values))]
+		
+		result = validator.validate_many(values)
+		assert set(result) == set(expect)
+		assert [str(concern) for concern in result.values()] == [str(concern) for concern in expect.values()]
+	
+	@pytest.mark.parametrize('validator', [validator for validator in VALIDATORS
+			if not isinstance(validator, (Length, Pattern))])
+	def test_integers(self, validator):
+		self._check(validator, self.numpy.arange(-5, 40))
+	
+	def test_floats(self):
+		values = self.numpy.array([0.5, 5.0, 7.25, 10.0, 10.5, float('nan')])
+		self._check(Range(5, 10), values)
+		self._check(Instance(float), values)
+		self._check(Instance(int), values)
+	
+	def test_text(self):
+		values = self.numpy.array(['a', 'b', 'c'])
+		self._check(In(['a', 'c']), values)
+		self._check(Equal('b'), values)
+	
+	def test_mixed_choices(self):
+		values = self.numpy.arange(5)
+		self._check(In([1, '2', 3]), values, False)
+	
+	def test_vectorization(self):
+		values = self.numpy.arange(10)
+		
+		assert Range(2, 5)._vectorize(values, self.numpy).tolist() == [False, False] + [True] * 4 + [False] * 4
+		assert Pattern(r'^1$')._vectorize(values, self.numpy) is None
+		assert All([Range(2, 5), Pattern(r'^1$')])._vectorize(values, self.numpy) is None
@@ -1,5 +1,9 @@
+import pytest
+
+from marrow.schema import Concern
 from marrow.schema.testing import ValidationTest
 from marrow.schema.validate.network import ipv4, ipv6, ipaddress, cidrv4, cidrv6, cidr, hostname, dnsname, mac, uri
+from marrow.schema.validate.network import IPv4, IPv6, IPAddress, CIDRv4, CIDRv6, CIDR
 
 
 class TestIPv4(ValidationTest):
@@ -59,6 +63,16 @@ class TestIPAddress(ValidationTest):
 	invalid = TestIPv4.invalid + TestIPv6.invalid
 
 
+class TestAddressConcerns(object):
+	def test_ipaddress(self):
+		for validate in (ipaddress.validate, ipaddress.compile(), IPAddress(parse=True).validate,
+				IPAddress(parse=True).compile()):
+			with pytest.raises(Concern) as exc:
+				validate('wxyz:')
+			
+			assert len(exc.value.concerns) == 2
+
+
 class TestCIDRv4(ValidationTest):
 	validator = cidrv4.validate
 	valid = ('10.0.0.0/8', '172.16.0.0/12', '196.168.0.0/16', '192.168.1.100/24')
@@ -77,6 +91,67 @@ class TestCIDR(ValidationTest):
 	invalid = TestCIDRv4.invalid + TestCIDRv6.invalid
 
 
+class TestParsedIPv4(ValidationTest):
+	validator = IPv4(parse=True).validate
+	valid = TestIPv4.valid
+	invalid = TestIPv4.invalid + ('01.1.1.1', '1.1.1.1 ', '1.1.1.1.', '١.1.1.1', 27)
+
+
+class TestParsedIPv6(ValidationTest):
+	validator = IPv6(parse=True).validate
+	valid = TestIPv6.valid + ('fe80::1%eth0', '1:2:3:4:5:6:1.2.3.4')
+	invalid = TestIPv6.invalid + (
+			'2003:dead:beef:cafe:babe:8bad:f00d:b0da:face:d00d',
+			' ::1',
+			':::',
+			'1::2::3',
+			'::1%',
+			'12345::',
+			'1:2:3:4:5:6:7:1.2.3.4',
+			'::ffff:1.2.3',
+		)
+
+
+class TestParsedIPAddress(ValidationTest):
+	validator = IPAddress(parse=True).validate
+	valid = TestParsedIPv4.valid + TestParsedIPv6.valid
+	invalid = TestParsedIPv4.invalid + TestParsedIPv6.invalid
+
+
+class TestParsedCIDRv4(ValidationTest):
+	validator = CIDRv4(parse=True).validate
+	valid = TestCIDRv4.valid + ('0.0.0.0/0', )
+	invalid = TestCIDRv4.invalid + ('10.0.0.0', '10.0.0.0/', '10.0.0.0/08', '10.0.0.0/8/8')
+
+
+class TestParsedCIDRv6(ValidationTest):
+	validator = CIDRv6(parse=True).validate
+	valid = TestCIDRv6.valid + ('::/128', 'fe80::%eth0/64')
+	invalid = TestCIDRv6.invalid + ('::', '::/', '::/1x', '::1%' + ' ' * 4000 + 'x')
+
+
+class TestParsedCIDR(ValidationTest):
+	validator = CIDR(parse=True).validate
+	valid = TestParsedCIDRv4.valid + TestParsedCIDRv6.valid
+	invalid = TestParsedCIDRv4.invalid + TestParsedCIDRv6.invalid
+
+
+@pytest.mark.parametrize('validator', (IPv4, IPv6, IPAddress, CIDRv4, CIDRv6, CIDR))
+def test_parsed_compilation(validator):
+	parsed = validator(parse=True)
+	compiled, checked = parsed.compile(), parsed.compile(check=True)
+	
+	for value in ('1.1.1.1', '::1', '10.0.0.0/8', '::/64', 'wxyz:', None):
+		try:
+			expect = parsed.validate(value)
+		except Concern:
+			assert checked(value) is not None
+			assert parsed.check(value) is not None
+		else:
+			assert compiled(value) == expect
+			assert checked(value) is None
+
+
 class TestHostname(ValidationTest):
 	validator = hostname.validate
 	